@@ -0,0 +1,108 @@
+import os
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Number of rows of the generated datasets, override with e.g. LAZY_PANDAS_BENCHMARK_SCALES=10000,10000000.
+SCALES = [int(scale) for scale in os.environ.get("LAZY_PANDAS_BENCHMARK_SCALES", "100000,1000000").split(",")]
+
+CATEGORIES = [f"category_{i:02d}" for i in range(50)]
+
+
+class Dataset:
+    def __init__(self, directory: str, rows: int):
+        """
+        Deterministic synthetic dataset of `rows` facts and a dimension table, written to CSV and Parquet.
+        """
+        rng = np.random.default_rng(42)
+        keys = max(rows // 100, 1)
+
+        self.rows = rows
+        self.facts = pd.DataFrame(
+            {
+                "id": np.arange(rows),
+                "key": rng.integers(0, keys, rows),
+                "category": np.array(CATEGORIES)[rng.integers(0, len(CATEGORIES), rows)],
+                "value": rng.random(rows),
+                "amount": rng.integers(-1000, 1000, rows),
+                "ts": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365 * 86400, rows), unit="s"),
+            }
+        )
+        self.dimension = pd.DataFrame({"key": np.arange(keys), "label": [f"label_{i}" for i in range(keys)]})
+
+        self.csv_path = os.path.join(directory, f"facts_{rows}.csv")
+        self.parquet_path = os.path.join(directory, f"facts_{rows}.parquet")
+        self.facts.to_csv(self.csv_path, index=False)
+        self.facts.to_parquet(self.parquet_path, index=False)
+
+
+class PeakMemory:
+    def __init__(self, interval: float = 0.001):
+        """
+        Samples the resident memory of the process in a thread, DuckDB allocates outside of the Python
+        allocator so tracemalloc would miss most of it.
+        """
+        self.interval = interval
+        self.peak: int | None = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def rss() -> int | None:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            return None
+
+    def _sample(self, baseline: int) -> None:
+        while not self._stop.wait(self.interval):
+            rss = self.rss()
+            if rss is not None and self.peak is not None:
+                self.peak = max(self.peak, rss - baseline)
+
+    def __enter__(self) -> "Self":
+        baseline = self.rss()
+        if baseline is not None:
+            self.peak = 0
+            self._thread = threading.Thread(target=self._sample, args=(baseline,), daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop.set()
+        if self.peak is not None:
+            self._thread.join()
+
+
+@pytest.fixture(scope="session", params=SCALES, ids=lambda rows: f"{rows}_rows")
+def dataset(request, tmp_path_factory) -> Dataset:
+    return Dataset(str(tmp_path_factory.mktemp("datasets")), request.param)
+
+
+@pytest.fixture(params=["lazy_pandas", "pandas"])
+def engine(request) -> str:
+    return request.param
+
+
+@pytest.fixture
+def measure(benchmark, dataset: Dataset, engine: str) -> Callable[[str, Callable[[], object]], object]:
+    """
+    Times `func` under the group `operation`, recording the peak memory of one extra run.
+    """
+
+    def _(operation: str, func: Callable[[], object]) -> object:
+        benchmark.group = f"{operation} ({dataset.rows} rows)"
+        benchmark.extra_info["engine"] = engine
+        with PeakMemory() as memory:
+            func()
+        benchmark.extra_info["peak_memory_bytes"] = memory.peak
+        return benchmark(func)
+
+    return _
@@ -0,0 +1,60 @@
+import lazy_pandas as lp
+
+
+def test_collect(measure, dataset, engine):
+    if engine == "lazy_pandas":
+        measure("collect", lambda: lp.from_pandas(dataset.facts).collect())
+    else:
+        measure("collect", lambda: dataset.facts.copy())
+
+
+def test_filter(measure, dataset, engine):
+    def lazy():
+        df = lp.from_pandas(dataset.facts)
+        return df[(df["value"] > 0.5) & (df["amount"] < 0)].collect()
+
+    def eager():
+        df = dataset.facts
+        return df[(df["value"] > 0.5) & (df["amount"] < 0)]
+
+    measure("filter", lazy if engine == "lazy_pandas" else eager)
+
+
+def test_astype(measure, dataset, engine):
+    def lazy():
+        return lp.from_pandas(dataset.facts).astype({"amount": "DOUBLE", "key": "VARCHAR"}).collect()
+
+    def eager():
+        return dataset.facts.astype({"amount": "float64", "key": "str"})
+
+    measure("astype", lazy if engine == "lazy_pandas" else eager)
+
+
+def test_drop_duplicates(measure, dataset, engine):
+    def lazy():
+        return lp.from_pandas(dataset.facts).drop_duplicates(subset=["key"]).collect()
+
+    def eager():
+        return dataset.facts.drop_duplicates(subset=["key"])
+
+    measure("drop_duplicates", lazy if engine == "lazy_pandas" else eager)
+
+
+def test_sort_values(measure, dataset, engine):
+    def lazy():
+        return lp.from_pandas(dataset.facts).sort_values(["category", "value"]).collect()
+
+    def eager():
+        return dataset.facts.sort_values(["category", "value"])
+
+    measure("sort_values", lazy if engine == "lazy_pandas" else eager)
+
+
+def test_merge(measure, dataset, engine):
+    def lazy():
+        return lp.from_pandas(dataset.facts).merge(lp.from_pandas(dataset.dimension), on="key").collect()
+
+    def eager():
+        return dataset.facts.merge(dataset.dimension, on="key")
+
+    measure("merge", lazy if engine == "lazy_pandas" else eager)
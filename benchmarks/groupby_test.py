@@ -0,0 +1,49 @@
+import lazy_pandas as lp
+
+
+def test_groupby_agg(measure, dataset, engine):
+    def lazy():
+        return lp.from_pandas(dataset.facts).groupby("category").agg({"value": "sum", "amount": "mean"}).collect()
+
+    def eager():
+        return dataset.facts.groupby("category").agg({"value": "sum", "amount": "mean"}).reset_index()
+
+    measure("groupby_agg", lazy if engine == "lazy_pandas" else eager)
+
+
+def test_groupby_high_cardinality(measure, dataset, engine):
+    def lazy():
+        return lp.from_pandas(dataset.facts).groupby("key").agg({"value": ["min", "max"]}).collect()
+
+    def eager():
+        return dataset.facts.groupby("key").agg({"value": ["min", "max"]}).reset_index()
+
+    measure("groupby_high_cardinality", lazy if engine == "lazy_pandas" else eager)
+
+
+def test_groupby_cumsum(measure, dataset, engine):
+    def lazy():
+        df = lp.from_pandas(dataset.facts)
+        df["running_amount"] = df.groupby("key")["amount"].cumsum()
+        return df.collect()
+
+    def eager():
+        df = dataset.facts.copy()
+        df["running_amount"] = df.groupby("key")["amount"].cumsum()
+        return df
+
+    measure("groupby_cumsum", lazy if engine == "lazy_pandas" else eager)
+
+
+def test_rolling_mean(measure, dataset, engine):
+    def lazy():
+        df = lp.from_pandas(dataset.facts)
+        df["moving_value"] = df["value"].rolling(7).mean()
+        return df.collect()
+
+    def eager():
+        df = dataset.facts.copy()
+        df["moving_value"] = df["value"].rolling(7).mean()
+        return df
+
+    measure("rolling_mean", lazy if engine == "lazy_pandas" else eager)
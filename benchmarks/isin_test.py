@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+import lazy_pandas as lp
+from lazy_pandas.column import lazy_column
+
+
+@pytest.mark.parametrize("keys", [1_000, 10_000, 100_000], ids=lambda keys: f"{keys}_keys")
+@pytest.mark.parametrize("path", ["semi_join", "constants"])
+def test_isin(measure, benchmark, monkeypatch, dataset, engine, path, keys):
+    if engine == "pandas" and path == "constants":
+        pytest.skip("pandas has a single isin path")
+
+    # Every third id, so about a third of the keys match when the dataset has fewer rows than keys.
+    values = np.arange(0, keys * 3, 3)
+    threshold = 0 if path == "semi_join" else len(values)
+    monkeypatch.setattr(lazy_column, "ISIN_SEMI_JOIN_THRESHOLD", threshold)
+    benchmark.extra_info["path"] = path
+
+    def lazy():
+        df = lp.from_pandas(dataset.facts)
+        return df[df["id"].isin(values)].collect()
+
+    def eager():
+        df = dataset.facts
+        return df[df["id"].isin(values)]
+
+    measure(f"isin_{keys}_keys", lazy if engine == "lazy_pandas" else eager)
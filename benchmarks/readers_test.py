@@ -0,0 +1,29 @@
+import pandas as pd
+
+import lazy_pandas as lp
+
+
+def test_read_csv(measure, dataset, engine):
+    if engine == "lazy_pandas":
+        measure("read_csv", lambda: lp.read_csv(dataset.csv_path).collect())
+    else:
+        measure("read_csv", lambda: pd.read_csv(dataset.csv_path))
+
+
+def test_read_parquet(measure, dataset, engine):
+    if engine == "lazy_pandas":
+        measure("read_parquet", lambda: lp.read_parquet(dataset.parquet_path).collect())
+    else:
+        measure("read_parquet", lambda: pd.read_parquet(dataset.parquet_path))
+
+
+def test_read_parquet_filtered(measure, dataset, engine):
+    def lazy():
+        df = lp.read_parquet(dataset.parquet_path)
+        return df[df["value"] > 0.9].collect()
+
+    def eager():
+        df = pd.read_parquet(dataset.parquet_path)
+        return df[df["value"] > 0.9]
+
+    measure("read_parquet_filtered", lazy if engine == "lazy_pandas" else eager)
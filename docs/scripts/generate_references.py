@@ -34,6 +34,12 @@ vls += [
     if not attr.startswith("_")
 ]
 
+vls += [
+    (4000 + idx, "lazy_pandas.Session", f"Session.{attr}", attr)
+    for idx, attr in enumerate(sorted(dir(lp.Session)))
+    if not attr.startswith("_")
+]
+
 template = """
 # {page_name}
 ::: {function_location}
@@ -53,7 +59,16 @@ fn_names = [
     for idx, attr in enumerate(sorted(dir(lp)))
     if not attr.startswith("_")
     and callable(getattr(lp, attr))
-    and attr not in ["LazyFrame", "LazyColumn", "LazyStringColumn", "LazyDateTimeColumn"]
+    and attr
+    not in [
+        "LazyFrame",
+        "LazyColumn",
+        "LazyStringColumn",
+        "LazyDateTimeColumn",
+        "LazyWindowColumn",
+        "LazyRolling",
+        "Session",
+    ]
 ]
 
 
@@ -1,19 +1,51 @@
+from lazy_pandas.cache import persisted_relations, unpersist_all
+from lazy_pandas.cancellation import CancellationToken
 from lazy_pandas.column.lazy_column import LazyColumn
 from lazy_pandas.column.lazy_datetime_column import LazyDateTimeColumn
 from lazy_pandas.column.lazy_string_column import LazyStringColumn
+from lazy_pandas.column.lazy_window_column import LazyRolling, LazyWindowColumn
 from lazy_pandas.frame.lazy_frame import LazyFrame
-from lazy_pandas.general import from_pandas, read_csv, read_delta, read_iceberg, read_parquet
+from lazy_pandas.general import (
+    collect_all,
+    from_arrow,
+    from_batches,
+    from_dict,
+    from_numpy,
+    from_pandas,
+    from_polars,
+    merge_asof,
+    read_csv,
+    read_delta,
+    read_iceberg,
+    read_json,
+    read_parquet,
+)
+from lazy_pandas.session import Session
 
 __all__ = [
     "LazyFrame",
     "LazyColumn",
     "read_csv",
     "read_parquet",
+    "read_json",
     "from_pandas",
+    "from_arrow",
+    "from_polars",
+    "from_dict",
+    "from_numpy",
+    "from_batches",
     "read_delta",
     "read_iceberg",
     "LazyDateTimeColumn",
     "LazyStringColumn",
+    "LazyWindowColumn",
+    "LazyRolling",
+    "persisted_relations",
+    "unpersist_all",
+    "Session",
+    "collect_all",
+    "CancellationToken",
+    "merge_asof",
 ]
 
 __version__ = "0.1.0"
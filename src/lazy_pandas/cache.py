@@ -0,0 +1,109 @@
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Literal, cast
+
+from duckdb import DuckDBPyRelation
+
+from lazy_pandas.utils import quote_literal, run_query
+
+__all__ = ["PersistedRelation", "persisted_relations", "unpersist_all"]
+
+Storage = Literal["memory", "disk"]
+
+_lock = threading.Lock()
+_registry: dict[str, "PersistedRelation"] = {}
+_cache_dir: str | None = None
+
+
+def _get_cache_dir() -> str:
+    global _cache_dir
+    with _lock:
+        if _cache_dir is None:
+            _cache_dir = tempfile.mkdtemp(prefix="lazy_pandas_cache_")
+            atexit.register(shutil.rmtree, _cache_dir, ignore_errors=True)
+        return _cache_dir
+
+
+class PersistedRelation:
+    def __init__(self, source: DuckDBPyRelation, storage: Storage = "memory"):
+        """
+        Materialize a relation into DuckDB storage, the backing store of `LazyFrame.persist`.
+
+        With 'memory' storage the relation is written to a temporary table. With 'disk' storage it is
+        written to a DuckDB database file, attached to the connection of the relation, which lets
+        DuckDB keep results larger than memory.
+
+        Args:
+            source (DuckDBPyRelation): The relation to materialize.
+            storage (str): Where to store the rows, 'memory' or 'disk'. Defaults to 'memory'.
+        """
+        if storage not in ("memory", "disk"):
+            raise ValueError(f"Invalid value for storage: {storage}")
+
+        self.name = f"lazy_pandas_cache_{uuid.uuid1().hex}"
+        self.storage = storage
+        self.path: str | None = None
+        self._source = source
+
+        if storage == "memory":
+            table = self.name
+            run_query(source, lambda view: f"CREATE TEMP TABLE {table} AS FROM {view}")
+        else:
+            path = self.path = os.path.join(_get_cache_dir(), f"{self.name}.duckdb")
+            table = f"{self.name}.data"
+            run_query(source, lambda _: f"ATTACH {quote_literal(path)} AS {self.name}")
+            run_query(source, lambda view: f"CREATE TABLE {table} AS FROM {view}")
+
+        self.relation = cast(DuckDBPyRelation, run_query(source, lambda _: f"FROM {table}"))
+
+        with _lock:
+            _registry[self.name] = self
+
+    def free(self) -> None:
+        """
+        Drop the materialized rows. Frames scanning them can no longer be executed.
+        """
+        with _lock:
+            if _registry.pop(self.name, None) is None:
+                return
+
+        if self.storage == "memory":
+            run_query(self._source, lambda _: f"DROP TABLE IF EXISTS {self.name}")
+        else:
+            run_query(self._source, lambda _: f"DETACH DATABASE IF EXISTS {self.name}")
+            if self.path is not None:
+                for path in (self.path, f"{self.path}.wal"):
+                    if os.path.exists(path):
+                        os.remove(path)
+
+    def __repr__(self) -> str:
+        return f"PersistedRelation(name={self.name!r}, storage={self.storage!r})"
+
+
+def persisted_relations() -> list[PersistedRelation]:
+    """
+    List the relations persisted with `LazyFrame.persist` that were not freed yet.
+
+    Returns:
+        list[PersistedRelation]: The persisted relations.
+    """
+    with _lock:
+        return list(_registry.values())
+
+
+def unpersist_all() -> None:
+    """
+    Free the storage of every relation persisted with `LazyFrame.persist`.
+
+    Example:
+    ```python
+    import lazy_pandas as lp
+    lp.unpersist_all()
+    ```
+    """
+    for persisted in persisted_relations():
+        persisted.free()
@@ -0,0 +1,124 @@
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from duckdb import DuckDBPyConnection, InterruptException
+
+from lazy_pandas.exceptions import LazyPandasQueryCancelled, LazyPandasQueryTimeout
+
+__all__ = ["CancellationToken", "interruptible"]
+
+
+class CancellationToken:
+    def __init__(self):
+        """
+        Initializes a token to cancel, from any thread, the queries it is given to.
+
+        Cancelling the token interrupts the running queries and makes the queries started afterwards
+        fail right away, all of them raising `LazyPandasQueryCancelled`.
+
+        Example:
+        ```python
+        import threading
+        import lazy_pandas as lp
+        token = lp.CancellationToken()
+        threading.Timer(30, token.cancel).start()
+        df = lp.read_parquet('data.parquet').collect(cancellation_token=token)
+        ```
+        """
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether `cancel()` was called.
+        """
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """
+        Cancel the queries running with the token and the ones started afterwards.
+        """
+        with self._lock:
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _register(self, callback: Callable[[], None]) -> bool:
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+            return not self._cancelled
+
+    def _unregister(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+@contextmanager
+def interruptible(
+    connection: DuckDBPyConnection, timeout: float | None = None, cancellation_token: CancellationToken | None = None
+) -> Iterator[Callable[[], None]]:
+    """
+    Interrupts the query running on `connection` inside the block once `timeout` seconds elapse or
+    `cancellation_token` is cancelled, raising the matching `LazyPandasQueryInterrupted` error.
+
+    The connection must only run the query of the block, usually it is a cursor of its own. The block
+    receives a function raising the error once the query was interrupted, for the blocks that keep
+    consuming a result after DuckDB finished producing it.
+    """
+    if timeout is None and cancellation_token is None:
+        yield lambda: None
+        return
+
+    if timeout is not None and timeout <= 0:
+        raise ValueError(f"timeout must be a positive number, got {timeout}")
+
+    lock = threading.Lock()
+    running = True
+    reason: str | None = None
+
+    def interrupt(cause: str) -> None:
+        nonlocal reason
+        # The interruption of an idle connection would hit its next query, so it only happens while the
+        # block runs.
+        with lock:
+            if running and reason is None:
+                reason = cause
+                connection.interrupt()
+
+    def cancel() -> None:
+        interrupt("cancelled")
+
+    def check() -> None:
+        if reason is not None:
+            raise InterruptException("Interrupted")
+
+    if cancellation_token is not None and not cancellation_token._register(cancel):
+        raise LazyPandasQueryCancelled("The query was cancelled before it started")
+
+    timer = None
+    if timeout is not None:
+        timer = threading.Timer(timeout, interrupt, ("timeout",))
+        timer.daemon = True
+        timer.start()
+
+    try:
+        yield check
+    except Exception as e:
+        if reason == "timeout":
+            raise LazyPandasQueryTimeout(f"The query did not finish within {timeout} seconds") from e
+        if reason == "cancelled":
+            raise LazyPandasQueryCancelled("The query was cancelled") from e
+        raise
+    finally:
+        with lock:
+            running = False
+        if timer is not None:
+            timer.cancel()
+        if cancellation_token is not None:
+            cancellation_token._unregister(cancel)
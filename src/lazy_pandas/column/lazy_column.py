@@ -1,15 +1,34 @@
+import uuid
+from datetime import timedelta
 from typing import Any, Callable, Literal, Tuple, Union, cast
 
-from duckdb import CoalesceOperator, ConstantExpression, Expression, FunctionExpression
+from duckdb import (
+    CoalesceOperator,
+    ConstantExpression,
+    DuckDBPyConnection,
+    DuckDBPyRelation,
+    Expression,
+    FunctionExpression,
+)
 from duckdb.typing import DuckDBPyType
 
+from lazy_pandas.column import lazy_window_column as window
 from lazy_pandas.column.lazy_datetime_column import LazyDateTimeColumn
 from lazy_pandas.column.lazy_string_column import LazyStringColumn
+from lazy_pandas.column.lazy_window_column import Closed, LazyRolling, LazyWindowColumn, RankMethod
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
+from lazy_pandas.utils import quote_identifier
 
 __all__ = ["LazyColumn"]
 
 ColumnOrName = Union["LazyColumn", str]
 
+# Above this number of values, `isin` filters of a LazyFrame compile into a hash semi-join against the
+# values registered as an Arrow relation, instead of an IN list binding one constant expression per value.
+ISIN_SEMI_JOIN_THRESHOLD = 1000
+
+ISIN_KEY_COLUMN = "__lazy_pandas_isin_key__"
+
 
 class UnsupporttedOperation(Exception): ...
 
@@ -18,10 +37,29 @@ def _get_expr(x) -> Expression:
     return x.expr if isinstance(x, LazyColumn) else ConstantExpression(x)
 
 
+def _to_list(values: Any) -> list:
+    if hasattr(values, "to_pylist"):
+        return values.to_pylist()
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
+
+
+def _relation_of(*values: Any) -> DuckDBPyRelation | None:
+    # A derived column keeps the relation of its columns while they all come from the same frame.
+    relations = {id(value._relation): value._relation for value in values if isinstance(value, LazyColumn)}
+    return next(iter(relations.values())) if len(relations) == 1 else None
+
+
+def _isin(expr: Expression, values: list[Expression]) -> Expression:
+    # Like pandas, and like the semi-join used for many values, a null is never contained, and it is kept by `~isin`.
+    return CoalesceOperator(expr.isin(*values), ConstantExpression(False))
+
+
 def _func_op(name: str, doc: str = "") -> Callable[["LazyColumn"], "LazyColumn"]:
     def _(self: "LazyColumn") -> "LazyColumn":
         njc = getattr(self.expr, name)()
-        return LazyColumn(njc)
+        return LazyColumn(njc, self._relation)
 
     _.__doc__ = doc
     return _
@@ -34,7 +72,7 @@ def _bin_op(
     def _(self: "LazyColumn", other) -> "LazyColumn":
         jc = _get_expr(other)
         njc = getattr(self.expr, name)(jc)
-        return LazyColumn(njc)
+        return LazyColumn(njc, _relation_of(self, other))
 
     _.__doc__ = doc
     return _
@@ -44,7 +82,7 @@ class LazyColumn:
     __div__ = _bin_op("__div__")
     __rdiv__ = _bin_op("__rdiv__")
 
-    def __init__(self, expr: Expression):
+    def __init__(self, expr: Expression, relation: DuckDBPyRelation | None = None):
         """
         Initializes a new instance of LazyColumn.
 
@@ -52,6 +90,8 @@ class LazyColumn:
             expr (Expression):
                 An expression or object representing the column or dataset
                 in the context of LazyColumn.
+            relation (DuckDBPyRelation | None):
+                The relation of the frame the column was selected from, if any.
 
         Examples:
             ```python
@@ -62,6 +102,7 @@ class LazyColumn:
             ```
         """
         self.expr = expr
+        self._relation = relation
 
     def abs(self) -> "LazyColumn":
         """
@@ -130,7 +171,14 @@ class LazyColumn:
         Checks whether the values in this column are contained in a specified set of values.
 
         This method is similar to `pandas.Series.isin`. It can accept multiple values
-        separated by commas or a single iterable (like a list, set, or tuple).
+        separated by commas, a single collection (a list, set, tuple, pandas Series,
+        NumPy array or Arrow array) or a column of a LazyFrame, whose values are the set
+        to check against. Like in pandas, null values are never contained.
+
+        Collections larger than `ISIN_SEMI_JOIN_THRESHOLD` values and columns of a
+        LazyFrame are not turned into constants: filtering a LazyFrame with the result
+        compiles into a hash semi-join against them (an anti-join once inverted with `~`),
+        which scales to millions of values.
 
         Args:
             *cols (Any):
@@ -160,13 +208,26 @@ class LazyColumn:
             # Checking if values are in a list [4, 6]
             df["my_column_to_test"].isin([4, 6])
             # [False, True, True, False, False]
+
+            # Keeping the rows whose id is one of a million ids, or of another frame
+            df[df["id"].isin(np.arange(1_000_000))]
+            df[df["id"].isin(customers["id"])]
             ```
         """
-        if len(cols) == 1 and isinstance(cols[0], (list, set)):
-            cols = cast(Tuple, cols[0])
+        if len(cols) == 1 and isinstance(cols[0], LazyColumn):
+            if cols[0]._relation is None:
+                raise LazyPandasUnsupporttedOperation(
+                    "isin only accepts a column of a LazyFrame or a column derived from the columns of a single frame"
+                )
+            return LazyIsinColumn(self.expr, cols[0]._relation.project(cols[0].expr.alias(ISIN_KEY_COLUMN)))
+
+        if len(cols) == 1 and (isinstance(cols[0], (list, set, tuple)) or hasattr(cols[0], "__array__")):
+            if len(cols[0]) > ISIN_SEMI_JOIN_THRESHOLD:
+                return LazyIsinColumn(self.expr, cols[0])
+            cols = cast(Tuple, _to_list(cols[0]))
 
         cols = cast(Tuple, [_get_expr(c) for c in cols])
-        return LazyColumn(self.expr.isin(*cols))
+        return LazyColumn(_isin(self.expr, cols), self._relation)
 
     def astype(self, dtype: str | DuckDBPyType) -> "LazyColumn":
         """
@@ -202,7 +263,7 @@ class LazyColumn:
         """
         if isinstance(dtype, str):
             dtype = DuckDBPyType(dtype)
-        return LazyColumn(self.expr.cast(dtype))
+        return LazyColumn(self.expr.cast(dtype), self._relation)
 
     def fillna(self, value: Any) -> "LazyColumn":
         """
@@ -233,7 +294,7 @@ class LazyColumn:
             # [10.0, 0, 7.5, 0, 12.0]
             ```
         """
-        return LazyColumn(CoalesceOperator(self.expr, _get_expr(value)))
+        return LazyColumn(CoalesceOperator(self.expr, _get_expr(value)), _relation_of(self, value))
 
     def isnull(self) -> "LazyColumn":
         """
@@ -258,7 +319,7 @@ class LazyColumn:
             # [False, True, False, True, False]
             ```
         """
-        return LazyColumn(self.expr.isnull())
+        return LazyColumn(self.expr.isnull(), self._relation)
 
     def isna(self) -> "LazyColumn":
         """
@@ -308,7 +369,7 @@ class LazyColumn:
             # [False, True, False, True, False]
             ```
         """
-        return LazyColumn(self.expr.isnotnull())
+        return LazyColumn(self.expr.isnotnull(), self._relation)
 
     def notna(self) -> "LazyColumn":
         """
@@ -409,6 +470,208 @@ class LazyColumn:
 
         return LazyColumn(result)
 
+    def cumsum(self) -> LazyWindowColumn:
+        """
+        Returns the cumulative sum of this column, following the order of the rows in the frame.
+
+        Null values are skipped by the sum and remain null in the result.
+
+        Returns:
+            LazyWindowColumn:
+                A window column that can be assigned to the frame.
+
+        Examples:
+            ```python
+            print(df.head())
+            #    col1  my_column_to_test
+            # 0     1                  2
+            # 1     2               None
+            # 2     3                  5
+
+            df["running_total"] = df["my_column_to_test"].cumsum()
+            # [2, None, 7]
+            ```
+        """
+        return window.cumulative("sum", str(self.expr), [])
+
+    def cummax(self) -> LazyWindowColumn:
+        """
+        Returns the cumulative maximum of this column, following the order of the rows in the frame.
+
+        Returns:
+            LazyWindowColumn:
+                A window column that can be assigned to the frame.
+
+        Examples:
+            ```python
+            df["running_max"] = df["my_column_to_test"].cummax()
+            # [2, 1, 5] -> [2, 2, 5]
+            ```
+        """
+        return window.cumulative("max", str(self.expr), [])
+
+    def cummin(self) -> LazyWindowColumn:
+        """
+        Returns the cumulative minimum of this column, following the order of the rows in the frame.
+
+        Returns:
+            LazyWindowColumn:
+                A window column that can be assigned to the frame.
+
+        Examples:
+            ```python
+            df["running_min"] = df["my_column_to_test"].cummin()
+            # [2, 1, 5] -> [2, 1, 1]
+            ```
+        """
+        return window.cumulative("min", str(self.expr), [])
+
+    def shift(self, periods: int = 1) -> LazyWindowColumn:
+        """
+        Shifts the values of this column by `periods` rows, filling the gaps with nulls.
+
+        Args:
+            periods (int, optional):
+                Number of rows to shift. Negative values shift backwards. Defaults to 1.
+
+        Returns:
+            LazyWindowColumn:
+                A window column that can be assigned to the frame.
+
+        Examples:
+            ```python
+            df["previous"] = df["my_column_to_test"].shift()
+            # [2, 1, 5] -> [None, 2, 1]
+            ```
+        """
+        return window.shift(str(self.expr), periods, [])
+
+    def diff(self, periods: int = 1) -> LazyWindowColumn:
+        """
+        Returns the difference between each value and the value `periods` rows before it.
+
+        Args:
+            periods (int, optional):
+                Number of rows between the compared values. Defaults to 1.
+
+        Returns:
+            LazyWindowColumn:
+                A window column that can be assigned to the frame.
+
+        Examples:
+            ```python
+            df["delta"] = df["my_column_to_test"].diff()
+            # [2, 1, 5] -> [None, -1, 4]
+            ```
+        """
+        return window.diff(str(self.expr), periods, [])
+
+    def pct_change(self, periods: int = 1) -> LazyWindowColumn:
+        """
+        Returns the fractional change between each value and the value `periods` rows before it.
+
+        Args:
+            periods (int, optional):
+                Number of rows between the compared values. Defaults to 1.
+
+        Returns:
+            LazyWindowColumn:
+                A window column that can be assigned to the frame.
+
+        Examples:
+            ```python
+            df["growth"] = df["my_column_to_test"].pct_change()
+            # [2, 1, 5] -> [None, -0.5, 4.0]
+            ```
+        """
+        return window.pct_change(str(self.expr), periods, [])
+
+    def rank(self, method: RankMethod = "average", ascending: bool = True) -> LazyWindowColumn:
+        """
+        Computes the rank of each value of this column, like `pandas.Series.rank`.
+
+        Args:
+            method (Literal["average", "min", "max", "first", "dense"], optional):
+                How tied values are ranked. Defaults to "average".
+            ascending (bool, optional):
+                Whether the smallest value gets rank 1. Defaults to True.
+
+        Returns:
+            LazyWindowColumn:
+                A window column of float ranks; null values get a null rank.
+
+        Examples:
+            ```python
+            df["position"] = df["my_column_to_test"].rank(method="min", ascending=False)
+            # [2, 1, 5, 2] -> [2.0, 4.0, 1.0, 2.0]
+            ```
+        """
+        return window.rank(str(self.expr), method, ascending, [])
+
+    def rolling(
+        self,
+        window: int | str | timedelta,
+        min_periods: int | None = None,
+        on: str | None = None,
+        closed: Closed | None = None,
+    ) -> LazyRolling[LazyWindowColumn]:
+        """
+        Provides rolling window calculations over this column, like `pandas.Series.rolling`.
+
+        Args:
+            window (int | str | timedelta):
+                Number of rows of each window, or a time offset like "7D" or "15min" for
+                time-based windows.
+            min_periods (int | None, optional):
+                Minimum number of non-null values required to produce a value. Defaults to
+                `window` for row-count windows and to 1 for time-based windows.
+            on (str | None, optional):
+                Column ordering the rows, required for time-based windows. Row-count windows
+                follow the order of the rows in the frame when it is None.
+            closed (Literal["right", "left", "both", "neither"] | None, optional):
+                Which endpoints of the window are included. Defaults to "right".
+
+        Returns:
+            LazyRolling:
+                An object whose reducers (`sum`, `mean`, `max`, ...) return window columns.
+
+        Examples:
+            ```python
+            print(df.head())
+            #           day  sales
+            # 0  2024-01-01     10
+            # 1  2024-01-02     20
+            # 2  2024-01-05     30
+
+            df["sales_3d"] = df["sales"].rolling("3D", on="day").sum()
+            # [10, 30, 30]
+
+            df["moving_avg"] = df["sales"].rolling(2).mean()
+            # [None, 15.0, 25.0]
+            ```
+        """
+        return LazyRolling(lambda build: build(str(self.expr)), [], window, min_periods, on, closed)
+
+    def expanding(self, min_periods: int = 1) -> LazyRolling[LazyWindowColumn]:
+        """
+        Provides expanding window calculations over this column, like `pandas.Series.expanding`.
+
+        Args:
+            min_periods (int, optional):
+                Minimum number of non-null values required to produce a value. Defaults to 1.
+
+        Returns:
+            LazyRolling:
+                An object whose reducers (`sum`, `mean`, `max`, ...) return window columns.
+
+        Examples:
+            ```python
+            df["running_mean"] = df["sales"].expanding().mean()
+            # [10, 20, 30] -> [10.0, 15.0, 20.0]
+            ```
+        """
+        return LazyRolling(lambda build: build(str(self.expr)), [], None, min_periods)
+
     @classmethod
     def create_from_function(cls, function: str, *arguments: Expression) -> "LazyColumn":
         return LazyColumn(FunctionExpression(function, *arguments))
@@ -439,7 +702,7 @@ class LazyColumn:
     __ror__ = _bin_op("__ror__")
 
     def __neg__(self):
-        return LazyColumn(-self.expr)
+        return LazyColumn(-self.expr, self._relation)
 
     __invert__ = _func_op("__invert__")
     __lt__ = _bin_op("__lt__")
@@ -449,13 +712,64 @@ class LazyColumn:
         self,
         other,
     ) -> "LazyColumn":
-        return LazyColumn(self.expr == (_get_expr(other)))
+        return LazyColumn(self.expr == (_get_expr(other)), _relation_of(self, other))
 
     def __ne__(  # type: ignore[override]
         self,
         other: Any,
     ) -> "LazyColumn":
-        return LazyColumn(self.expr != (_get_expr(other)))
+        return LazyColumn(self.expr != (_get_expr(other)), _relation_of(self, other))
 
     __gt__ = _bin_op("__gt__")
     __ge__ = _bin_op("__ge__")
+
+
+class LazyIsinColumn(LazyColumn):
+    def __init__(self, column: Expression, values: Any, negate: bool = False):
+        """
+        The result of `LazyColumn.isin` with many values or the column of another frame.
+
+        Filtering a LazyFrame with it joins the frame with the values instead of evaluating an
+        expression. Used in any other way, e.g. combined with another condition, the values fall
+        back to constants.
+
+        Args:
+            column (Expression): The expression checked for containment.
+            values (Any): A collection of values or a relation of a single column.
+            negate (bool): Whether the rows whose value is not contained are kept.
+        """
+        self._column = column
+        self._values = values
+        self._negate = negate
+        self._relation = None
+
+    @property
+    def expr(self) -> Expression:  # type: ignore[override]
+        if isinstance(self._values, DuckDBPyRelation):
+            raise LazyPandasUnsupporttedOperation(
+                "isin against the column of another frame can only filter a frame, e.g. df[df['a'].isin(other['a'])]"
+            )
+        expr = _isin(self._column, [ConstantExpression(value) for value in _to_list(self._values)])
+        return ~expr if self._negate else expr
+
+    def _filter_relation(self, relation: DuckDBPyRelation, connection: DuckDBPyConnection | None) -> DuckDBPyRelation:
+        keys = self._values
+        if not isinstance(keys, DuckDBPyRelation):
+            if connection is None:
+                # The key table has to be created on the connection of the relation, without knowing it
+                # the values are compared as constants.
+                return relation.filter(self.expr)
+            import pyarrow as pa
+
+            if not isinstance(keys, (pa.Array, pa.ChunkedArray)):
+                keys = pa.array(list(keys) if isinstance(keys, set) else keys)
+            keys = connection.from_arrow(pa.table({ISIN_KEY_COLUMN: keys}))
+
+        # The keys may be a projection of the filtered relation itself, which has the same alias.
+        alias = f"lazy_pandas_isin_{uuid.uuid4().hex}"
+        keys = keys.set_alias(alias)
+        condition = f"{self._column} = {quote_identifier(alias)}.{quote_identifier(ISIN_KEY_COLUMN)}"
+        return relation.join(keys, condition, how="anti" if self._negate else "semi")
+
+    def __invert__(self) -> "LazyIsinColumn":
+        return LazyIsinColumn(self._column, self._values, not self._negate)
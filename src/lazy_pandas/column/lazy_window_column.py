@@ -0,0 +1,286 @@
+import uuid
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Generic, Literal, TypeVar, cast
+
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
+from lazy_pandas.utils import quote_identifier, to_interval
+
+__all__ = ["LazyRolling", "LazyWindowColumn"]
+
+ORDINAL_COLUMN = "__lazy_pandas_ordinal__"
+
+RankMethod = Literal["average", "min", "max", "first", "dense"]
+
+Closed = Literal["right", "left", "both", "neither"]
+
+T = TypeVar("T")
+
+_WINDOW_AGGREGATIONS = {
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+    "mean": "avg",
+    "median": "median",
+    "std": "stddev_samp",
+    "var": "var_samp",
+    "count": "count",
+}
+
+
+class LazyWindowColumn:
+    def __init__(self, sql: str, helpers: dict[str, str] | None = None):
+        """
+        Initializes a column computed by a DuckDB window function.
+
+        Window columns are evaluated against the frame they are assigned to, so unlike `LazyColumn`
+        they can only be assigned (`df["c"] = ...`), not combined with other columns.
+
+        Args:
+            sql (str):
+                The SQL of the window expression. It can order rows by `ORDINAL_COLUMN`, the position
+                of each row in the frame.
+            helpers (dict[str, str] | None, optional):
+                SQL of window expressions projected before `sql`, by the name `sql` refers to them with.
+                DuckDB does not allow window functions in a frame bound, but it allows their results.
+
+        Examples:
+            ```python
+            df["running_total"] = df.groupby("account")["amount"].cumsum()
+            df["previous"] = df["amount"].shift(1)
+            ```
+        """
+        self.sql = sql
+        self.helpers = helpers or {}
+
+    def __repr__(self) -> str:
+        return f"LazyWindowColumn({self.sql})"
+
+
+def _window(partition_by: list[str], order_by: str | None = None, frame: str | None = None) -> str:
+    clauses = []
+    if partition_by:
+        clauses.append("PARTITION BY " + ", ".join(partition_by))
+    if order_by is not None:
+        clauses.append(f"ORDER BY {order_by}")
+    if frame is not None:
+        clauses.append(frame)
+    return f"OVER ({' '.join(clauses)})"
+
+
+def _keep_nulls(value: str, result: str) -> str:
+    return f"CASE WHEN {value} IS NULL THEN NULL ELSE {result} END"
+
+
+def _ordinal() -> str:
+    return quote_identifier(ORDINAL_COLUMN)
+
+
+def cumulative(func: Literal["sum", "min", "max"], value: str, partition_by: list[str]) -> LazyWindowColumn:
+    window = _window(partition_by, _ordinal(), "ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW")
+    return LazyWindowColumn(_keep_nulls(value, f"{func}({value}) {window}"))
+
+
+def cumcount(partition_by: list[str]) -> LazyWindowColumn:
+    return LazyWindowColumn(f"row_number() {_window(partition_by, _ordinal())} - 1")
+
+
+def shift(value: str, periods: int, partition_by: list[str]) -> LazyWindowColumn:
+    function = "lag" if periods >= 0 else "lead"
+    return LazyWindowColumn(f"{function}({value}, {abs(periods)}) {_window(partition_by, _ordinal())}")
+
+
+def diff(value: str, periods: int, partition_by: list[str]) -> LazyWindowColumn:
+    return LazyWindowColumn(f"{value} - {shift(value, periods, partition_by).sql}")
+
+
+def pct_change(value: str, periods: int, partition_by: list[str]) -> LazyWindowColumn:
+    return LazyWindowColumn(f"{value} / {shift(value, periods, partition_by).sql} - 1")
+
+
+def rank(value: str, method: RankMethod, ascending: bool, partition_by: list[str]) -> LazyWindowColumn:
+    order_by = f"{value} {'ASC' if ascending else 'DESC'} NULLS LAST"
+    ties = f"count(*) {_window([*partition_by, value])}"
+    if method == "average":
+        result = f"rank() {_window(partition_by, order_by)} + ({ties} - 1) / 2"
+    elif method == "min":
+        result = f"rank() {_window(partition_by, order_by)}"
+    elif method == "max":
+        result = f"rank() {_window(partition_by, order_by)} + {ties} - 1"
+    elif method == "first":
+        result = f"row_number() {_window(partition_by, f'{order_by}, {_ordinal()}')}"
+    elif method == "dense":
+        result = f"dense_rank() {_window(partition_by, order_by)}"
+    else:
+        raise ValueError(f"Invalid value for method: {method}")
+    return LazyWindowColumn(_keep_nulls(value, f"CAST({result} AS DOUBLE)"))
+
+
+def transform(func: str, value: str, partition_by: list[str]) -> LazyWindowColumn:
+    if func in ("first", "last"):
+        window = _window(partition_by, _ordinal(), "ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING")
+        return LazyWindowColumn(f"{func}_value({value} IGNORE NULLS) {window}")
+    if func == "size":
+        return LazyWindowColumn(f"count(*) {_window(partition_by)}")
+    if func not in _WINDOW_AGGREGATIONS:
+        raise LazyPandasUnsupporttedOperation(
+            f"Transformation '{func}' is not supported, available transformations are: "
+            f"{', '.join([*_WINDOW_AGGREGATIONS, 'first', 'last', 'size'])}"
+        )
+    return LazyWindowColumn(f"{_WINDOW_AGGREGATIONS[func]}({value}) {_window(partition_by)}")
+
+
+def _rows_frame(window: int | None, closed: Closed) -> str:
+    start = "UNBOUNDED PRECEDING"
+    if window is not None:
+        start = f"{window if closed in ('left', 'both') else window - 1} PRECEDING"
+    end = "1 PRECEDING" if closed in ("left", "neither") else "CURRENT ROW"
+    return f"ROWS BETWEEN {start} AND {end}"
+
+
+def _time_frame(
+    window: str | timedelta, partition_by: list[str], on: str, closed: Closed
+) -> tuple[str, dict[str, str]]:
+    # Like pandas, the rows sharing the timestamp of the current row are in its window only if they come
+    # before it in the frame (none of them for an open end), which a RANGE frame over `on` cannot express.
+    # The frame is a ROWS frame over (on, ordinal) instead, whose bounds count the rows to leave out.
+    # RANGE frames are inclusive on both ends, an open bound is shifted by the timestamp resolution.
+    epsilon = "INTERVAL '1 microsecond'"
+    before = to_interval(window)
+    if closed in ("left", "both"):
+        before = f"{before} + {epsilon}"
+    row = f"row_number() {_window(partition_by, f'{on}, {_ordinal()}')}"
+    outside = f"count(*) {_window(partition_by, on, f'RANGE BETWEEN UNBOUNDED PRECEDING AND {before} PRECEDING')}"
+    start = f"__lazy_pandas_window_start_{uuid.uuid4().hex}__"
+    helpers = {start: f"{row} - 1 - {outside}"}
+    end = "CURRENT ROW"
+    if closed in ("left", "neither"):
+        peers = f"__lazy_pandas_window_end_{uuid.uuid4().hex}__"
+        helpers[peers] = f"row_number() {_window([*partition_by, on], _ordinal())}"
+        end = f"{quote_identifier(peers)} PRECEDING"
+    return f"ROWS BETWEEN {quote_identifier(start)} PRECEDING AND {end}", helpers
+
+
+def rolling(
+    func: str,
+    value: str,
+    partition_by: list[str],
+    window: int | str | timedelta | None,
+    min_periods: int,
+    on: str | None,
+    closed: Closed,
+) -> LazyWindowColumn:
+    if func not in _WINDOW_AGGREGATIONS:
+        raise LazyPandasUnsupporttedOperation(
+            f"Rolling aggregation '{func}' is not supported, available aggregations are: "
+            f"{', '.join(_WINDOW_AGGREGATIONS)}"
+        )
+
+    order_by = _ordinal() if on is None else f"{quote_identifier(on)}, {_ordinal()}"
+    helpers: dict[str, str] = {}
+    if isinstance(window, (str, timedelta)):
+        frame, helpers = _time_frame(window, partition_by, quote_identifier(cast(str, on)), closed)
+    else:
+        frame = _rows_frame(window, closed)
+
+    over = _window(partition_by, order_by, frame)
+    result = f"{_WINDOW_AGGREGATIONS[func]}({value}) {over}"
+    if min_periods > 0:
+        # Like pandas, `count` requires `min_periods` rows in the window, null or not.
+        observations = "*" if func == "count" else value
+        result = f"CASE WHEN count({observations}) {over} >= {min_periods} THEN {result} END"
+    return LazyWindowColumn(result, helpers)
+
+
+def _rolling_reducer(func: str, doc: str) -> Callable[["LazyRolling[T]"], T]:
+    def _(self: "LazyRolling[T]") -> T:
+        return self.agg(func)
+
+    _.__doc__ = doc
+    return _
+
+
+class LazyRolling(Generic[T]):
+    sum = _rolling_reducer("sum", "Compute the sum of the values in each window.")
+    min = _rolling_reducer("min", "Compute the minimum of the values in each window.")
+    max = _rolling_reducer("max", "Compute the maximum of the values in each window.")
+    mean = _rolling_reducer("mean", "Compute the mean of the values in each window.")
+    median = _rolling_reducer("median", "Compute the median of the values in each window.")
+    std = _rolling_reducer("std", "Compute the sample standard deviation of the values in each window.")
+    var = _rolling_reducer("var", "Compute the sample variance of the values in each window.")
+    count = _rolling_reducer("count", "Count the non-null values in each window.")
+
+    def __init__(
+        self,
+        apply: Callable[[Callable[[str], LazyWindowColumn]], T],
+        partition_by: list[str],
+        window: int | str | timedelta | None,
+        min_periods: int | None = None,
+        on: str | None = None,
+        closed: Closed | None = None,
+    ):
+        """
+        Initializes a rolling (or, when `window` is None, expanding) window, the result of
+        `LazyColumn.rolling` and `LazyGrouppedFrame.rolling`.
+
+        Row-count windows compile to `ROWS BETWEEN` frames and time-based windows to `ROWS BETWEEN`
+        frames whose bounds are counted by `RANGE BETWEEN` frames, so DuckDB's segment-tree window
+        operator computes every reducer.
+
+        Args:
+            apply (Callable):
+                Turns the builder of a window column, given the SQL of the value it reduces,
+                into the result of the reducers.
+            partition_by (list[str]):
+                SQL of the expressions partitioning the window.
+            window (int | str | timedelta | None):
+                Number of rows, a time offset like '7D', or None for an expanding window.
+            min_periods (int | None, optional):
+                Minimum number of non-null values (of rows for `count`) required to produce a value.
+                Defaults to the window size for row-count windows and to 1 otherwise.
+            on (str | None, optional):
+                Column ordering the rows, required for time-based windows. Row-count windows
+                follow the order of the rows in the frame when it is None.
+            closed (Literal["right", "left", "both", "neither"] | None, optional):
+                Which endpoints of the window are included. Defaults to "right".
+
+        Examples:
+            ```python
+            df["sales_7d"] = df["sales"].rolling("7D", on="day").sum()
+            df["moving_avg"] = df.groupby("store")["sales"].rolling(3).mean()
+            df["running_max"] = df["sales"].expanding().max()
+            ```
+        """
+        if isinstance(window, int) and window <= 0:
+            raise ValueError(f"window must be a positive integer, got {window}")
+        if isinstance(window, (str, timedelta)) and on is None:
+            raise ValueError("Time-based windows require the column to order the rows by, use on=...")
+
+        if min_periods is None:
+            min_periods = window if isinstance(window, int) else 1
+
+        self._apply = apply
+        self._partition_by = partition_by
+        self._window = window
+        self._min_periods = min_periods
+        self._on = on
+        self._closed: Closed = closed or "right"
+
+    def agg(self, func: str) -> T:
+        """
+        Reduce each window with `func`, one of 'sum', 'min', 'max', 'mean', 'median', 'std', 'var' or 'count'.
+
+        Args:
+            func (str): The reducer to apply.
+
+        Returns:
+            LazyWindowColumn | LazyFrame: The reduced windows.
+
+        Raises:
+            LazyPandasUnsupporttedOperation: If the reducer is not supported.
+        """
+        return self._apply(
+            lambda value: rolling(
+                func, value, self._partition_by, self._window, self._min_periods, self._on, self._closed
+            )
+        )
@@ -1 +1,13 @@
 class LazyPandasUnsupporttedOperation(Exception): ...
+
+
+class LazyPandasQueryInterrupted(Exception): ...
+
+
+class LazyPandasQueryTimeout(LazyPandasQueryInterrupted, TimeoutError): ...
+
+
+class LazyPandasQueryCancelled(LazyPandasQueryInterrupted): ...
+
+
+class LazyPandasStreamConsumed(Exception): ...
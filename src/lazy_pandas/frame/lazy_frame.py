@@ -1,5 +1,13 @@
+import asyncio
+import os
+import re
+import tempfile
+import threading
 import uuid
-from typing import TYPE_CHECKING, Literal, Union, overload
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager, nullcontext, suppress
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, overload
 
 import duckdb
 from duckdb import (
@@ -12,11 +20,28 @@ from duckdb import (
 )
 from duckdb.typing import DuckDBPyType
 
-from lazy_pandas.column.lazy_column import LazyColumn
+from lazy_pandas import instrumentation, streams
+from lazy_pandas.cache import PersistedRelation, Storage
+from lazy_pandas.cancellation import CancellationToken, interruptible
+from lazy_pandas.column.lazy_column import LazyColumn, LazyIsinColumn
+from lazy_pandas.column.lazy_window_column import ORDINAL_COLUMN, LazyWindowColumn
 from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
 from lazy_pandas.frame.lazy_groupped_frame import LazyGrouppedFrame
+from lazy_pandas.frame.lazy_resampler import ORIGIN_COLUMN, LazyResampler, Origin, origin_aggregate, time_bucket
+from lazy_pandas.profiling import QueryProfile
+from lazy_pandas.schema import Schema
+from lazy_pandas.utils import (
+    connection_lock,
+    is_period_end_frequency,
+    merge_column_names,
+    quote_identifier,
+    quote_literal,
+    run_query,
+    temporary_settings,
+)
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
     import polars as pl
     import pyarrow as pa
@@ -26,25 +51,347 @@ __all__ = ["LazyFrame"]
 
 ColumnOrName = Union["LazyColumn", str]
 
+T = TypeVar("T")
+
+SortKind = Literal["quicksort", "mergesort", "heapsort", "stable"]
+MergeHow = Literal["inner", "left", "right", "outer", "semi", "anti", "cross"]
+DtypeBackend = Literal["numpy", "numpy_nullable", "pyarrow"]
+MergeValidate = Literal["one_to_one", "1:1", "one_to_many", "1:m", "many_to_one", "m:1", "many_to_many", "m:m"]
+
+_LEFT_ALIAS = "__lazy_pandas_left__"
+_RIGHT_ALIAS = "__lazy_pandas_right__"
+_LEFT_MARKER = "__lazy_pandas_left_row__"
+_RIGHT_MARKER = "__lazy_pandas_right_row__"
+
+_VALUES_COLUMN = "__lazy_pandas_values__"
+
+_IDENTIFIER_PATTERN = re.compile(r'"((?:[^"]|"")+)"|(\w+)')
+
+
+def _format_copy_option(value: bool | int | str | list[str]) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, list):
+        return "(" + ", ".join(quote_identifier(col) for col in value) + ")"
+    return quote_literal(value)
+
+
+def _referenced_names(expr: Expression) -> set[str]:
+    # Every identifier-like token of the expression, a superset of the columns it references.
+    return {
+        (quoted.replace('""', '"') if quoted else bare).lower()
+        for quoted, bare in _IDENTIFIER_PATTERN.findall(str(expr))
+    }
+
+
+def _to_expression(value: Any) -> Expression:
+    if isinstance(value, LazyColumn):
+        return value.expr
+    if isinstance(value, Expression):
+        return value
+    return ConstantExpression(value)
+
+
+def _project_assignments(relation: DuckDBPyRelation, exprs: dict[str, Expression]) -> DuckDBPyRelation:
+    columns = relation.columns
+    projection = [exprs[col].alias(col) if col in exprs else ColumnExpression(col) for col in columns]
+    projection += [expr.alias(col) for col, expr in exprs.items() if col not in columns]
+    return relation.project(*projection)
+
+
+def _project_sql(relation: DuckDBPyRelation, exprs: dict[str, str]) -> DuckDBPyRelation:
+    # Window functions can only be expressed as SQL, which `project` parses from a single string.
+    columns = relation.columns
+    projection = [
+        f"{exprs[col]} AS {quote_identifier(col)}" if col in exprs else quote_identifier(col) for col in columns
+    ]
+    projection += [f"{expr} AS {quote_identifier(col)}" for col, expr in exprs.items() if col not in columns]
+    return relation.project(", ".join(projection))
+
+
+def _validate_merge(
+    left: DuckDBPyRelation,
+    right: DuckDBPyRelation,
+    left_keys: list[str],
+    right_keys: list[str],
+    validate: str,
+) -> None:
+    kinds = {"1:1": "one_to_one", "1:m": "one_to_many", "m:1": "many_to_one", "m:m": "many_to_many"}
+    kind = kinds.get(validate, validate)
+    if kind not in kinds.values():
+        raise ValueError(f"Invalid validate: {validate!r}, expected one of {', '.join([*kinds.values(), *kinds])}")
+
+    for side, relation, keys, unique in (
+        ("left", left, left_keys, kind in ("one_to_one", "one_to_many")),
+        ("right", right, right_keys, kind in ("one_to_one", "many_to_one")),
+    ):
+        if not unique or not keys:
+            continue
+        group_expr = ", ".join(quote_identifier(key) for key in keys)
+        streams.consume(relation)
+        if relation.aggregate("count(*) AS n", group_expr).filter("n > 1").limit(1).fetchone() is not None:
+            raise ValueError(f"Merge keys are not unique in {side} dataset; not a {kind} merge")
+
+
+def _interval_to_duration(intervals: "pa.Array") -> "pa.Array":
+    # Like DuckDB, a month counts as 30 days.
+    import numpy as np
+    import pyarrow as pa
+
+    layout = np.dtype([("months", "<i4"), ("days", "<i4"), ("nanoseconds", "<i8")])
+    values = np.frombuffer(intervals.buffers()[1], dtype=layout)[intervals.offset : intervals.offset + len(intervals)]
+    days = values["months"].astype("int64") * 30 + values["days"]
+    nanoseconds = days * 86_400_000_000_000 + values["nanoseconds"]
+    return pa.array(nanoseconds, pa.duration("ns"), mask=intervals.is_null().to_numpy(zero_copy_only=False))
+
+
+def _cast_like_to_df(table: "pa.Table") -> "pa.Table":
+    # Arrow converts decimals, dates and intervals to Python objects where `to_df()` returns float64,
+    # datetime64[us] and timedelta64[ns] columns.
+    import pyarrow as pa
+
+    for index, field in enumerate(table.schema):
+        column = table.column(index)
+        if pa.types.is_decimal(field.type):
+            column = column.cast(pa.float64(), safe=False)
+        elif pa.types.is_date(field.type):
+            column = column.cast(pa.timestamp("us"))
+        elif field.type == pa.month_day_nano_interval():
+            column = pa.chunked_array([_interval_to_duration(chunk) for chunk in column.chunks], pa.duration("ns"))
+        else:
+            continue
+        table = table.set_column(index, field.name, column)
+    return table
+
+
+def _pandas_converter(
+    dtype_backend: DtypeBackend, categorical: list[str] | None
+) -> Callable[[DuckDBPyRelation], "pd.DataFrame"]:
+    if dtype_backend not in ("numpy", "numpy_nullable", "pyarrow"):
+        raise ValueError(f"Invalid dtype_backend: {dtype_backend!r}, expected 'numpy', 'numpy_nullable' or 'pyarrow'")
+    if dtype_backend == "numpy" and not categorical:
+        return lambda relation: relation.to_df()
+
+    def convert(relation: DuckDBPyRelation) -> "pd.DataFrame":
+        import pandas as pd
+        import pyarrow as pa
+
+        table = relation.arrow()
+        for col in categorical or []:
+            index = table.schema.get_field_index(col)
+            if index == -1:
+                raise ValueError(f"Column {col!r} not found, expected one of {table.column_names}")
+            column = table.column(index)
+            if not pa.types.is_dictionary(column.type):
+                # Encoded while still in Arrow, so the values never become Python objects.
+                table = table.set_column(index, col, column.dictionary_encode())
+
+        if dtype_backend == "pyarrow":
+            # Dictionary columns are left to pyarrow, which returns them as pd.Categorical.
+            return table.to_pandas(
+                types_mapper=lambda type: None if pa.types.is_dictionary(type) else pd.ArrowDtype(type)
+            )
+        # The other columns get the dtypes `to_df()` returns, or their nullable counterparts.
+        table = _cast_like_to_df(table)
+        if dtype_backend == "numpy_nullable":
+            nullable_dtypes = {
+                pa.int8(): pd.Int8Dtype(),
+                pa.int16(): pd.Int16Dtype(),
+                pa.int32(): pd.Int32Dtype(),
+                pa.int64(): pd.Int64Dtype(),
+                pa.uint8(): pd.UInt8Dtype(),
+                pa.uint16(): pd.UInt16Dtype(),
+                pa.uint32(): pd.UInt32Dtype(),
+                pa.uint64(): pd.UInt64Dtype(),
+                pa.float32(): pd.Float32Dtype(),
+                pa.float64(): pd.Float64Dtype(),
+                pa.bool_(): pd.BooleanDtype(),
+                # Backed by the Arrow buffers, so the strings do not become Python objects.
+                pa.string(): pd.StringDtype("pyarrow"),
+                pa.large_string(): pd.StringDtype("pyarrow"),
+            }
+            return table.to_pandas(types_mapper=nullable_dtypes.get)
+        return table.to_pandas()
+
+    return convert
+
+
+def _unmask(array: "np.ndarray") -> "np.ndarray":
+    # fetchnumpy returns masked arrays for nullable columns, plain arrays are enough when nothing is null.
+    import numpy as np
+
+    if isinstance(array, np.ma.MaskedArray) and not np.ma.is_masked(array):
+        return array.data
+    return array
+
+
+def _convert_batch(batch: "pa.RecordBatch", format: str) -> Union["pa.RecordBatch", "pd.DataFrame", "pl.DataFrame"]:
+    if format == "pandas":
+        return batch.to_pandas()
+    if format == "polars":
+        import polars as pl
+
+        return pl.from_arrow(batch)
+    return batch
+
+
+async def _run_in_executor(
+    func: Callable[[DuckDBPyRelation], T],
+    relation: DuckDBPyRelation,
+    connection: duckdb.DuckDBPyConnection | None,
+    lock: "threading.Lock | None",
+) -> T:
+    def run() -> T:
+        with lock or nullcontext():
+            return func(relation)
+
+    future = asyncio.get_running_loop().run_in_executor(None, run)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # Cancelling the awaiting task does not stop a query running on a worker thread, so the query
+        # is interrupted and awaited before the cancellation propagates, keeping its cursor open meanwhile.
+        # Without a known connection the query cannot be interrupted and runs to completion.
+        if connection is not None:
+            connection.interrupt()
+        with suppress(Exception):
+            await future
+        raise
+
+
+async def _acquire(lock: "threading.Lock") -> None:
+    # Waits for the lock on a worker thread, so the event loop is not blocked meanwhile.
+    acquired = asyncio.get_running_loop().run_in_executor(None, lock.acquire)
+    try:
+        await asyncio.shield(acquired)
+    except asyncio.CancelledError:
+        # The lock is still acquired by the worker thread, it is released as soon as it is.
+        acquired.add_done_callback(lambda _: lock.release())
+        raise
+
 
 class LazyFrame:
-    def __init__(self, relation: DuckDBPyRelation):
+    def __init__(self, relation: DuckDBPyRelation, connection: duckdb.DuckDBPyConnection | None = None):
         """
         Initialize a LazyFrame with a DuckDB relation.
 
         Args:
             relation (DuckDBPyRelation): The underlying DuckDB relation.
+            connection (DuckDBPyConnection | None, optional): The connection the relation is bound to,
+                None when it is unknown. Defaults to None.
         """
         self._relation = relation
+        self._connection = connection
+        self._persisted: PersistedRelation | None = None
+        # Relation the last column assignments were projected from, the relation they produced and the
+        # assigned expressions, so consecutive assignments are merged into a single projection.
+        self._assignments: tuple[DuckDBPyRelation, DuckDBPyRelation, dict[str, Expression]] | None = None
+        # Schema and number of rows of a relation, computed once and dropped when the frame gets a new relation.
+        self._schema: tuple[DuckDBPyRelation, Schema] | None = None
+        self._row_count: tuple[DuckDBPyRelation, int] | None = None
+        # Relation scanning Parquet files without filtering their rows, counted from the file footers.
+        self._parquet_scan: tuple[DuckDBPyRelation, str] | None = None
+
+    @contextmanager
+    def _isolated(
+        self,
+    ) -> Iterator[tuple[DuckDBPyRelation, duckdb.DuckDBPyConnection | None, "threading.Lock | None"]]:
+        """
+        Bind the plan to a new cursor of the connection of the frame, so it can run while other threads
+        use that connection. Plans that cannot move to another cursor, like scans of pandas DataFrames
+        or temporary tables, stay on the connection of the frame and come with the lock to hold while
+        executing them. The connection is None when the frame does not know it.
+        """
+        if self._connection is not None:
+            cursor = self._connection.cursor()
+            try:
+                relation = cursor.sql(self._relation.sql_query())
+            except duckdb.Error:
+                cursor.close()
+            else:
+                try:
+                    yield relation, cursor, None
+                finally:
+                    cursor.close()
+                return
+
+        yield self._relation, self._connection, connection_lock(self._connection)
+
+    @contextmanager
+    def _execution(
+        self, timeout: float | None, cancellation_token: CancellationToken | None
+    ) -> Iterator[tuple[DuckDBPyRelation, Callable[[], None]]]:
+        """
+        Relation to execute a terminal operation on, and the function raising once it is interrupted.
+        With a timeout or a cancellation token, the plan runs on a cursor of its own, so interrupting
+        it does not affect other queries.
+        """
+        streams.consume(self._relation)
+        if timeout is None and cancellation_token is None:
+            yield self._relation, lambda: None
+            return
 
-    def collect(self) -> "pd.DataFrame":
+        if self._connection is None:
+            # Interrupting any other connection would leave the query running and stop unrelated ones.
+            raise LazyPandasUnsupporttedOperation(
+                "timeout and cancellation_token need the connection of the frame, "
+                "create it with LazyFrame(relation, connection) or the lazy_pandas readers"
+            )
+
+        with (
+            self._isolated() as (relation, connection, lock),
+            lock or nullcontext(),
+            interruptible(connection, timeout, cancellation_token) as check,
+        ):
+            yield relation, check
+
+    def collect(
+        self,
+        *,
+        dtype_backend: DtypeBackend = "numpy",
+        categorical: list[str] | None = None,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> "pd.DataFrame":
         """
         Collect the lazy relation and materialize it as a pandas DataFrame.
 
+        With the 'pyarrow' and 'numpy_nullable' backends the result is fetched as Arrow and converted with
+        a types mapper, so strings are not turned into Python objects.
+
+        Args:
+            dtype_backend (Literal["numpy", "numpy_nullable", "pyarrow"]): Dtypes of the columns,
+                'numpy' for the default NumPy dtypes, 'numpy_nullable' for the pandas nullable dtypes and
+                'pyarrow' for `pd.ArrowDtype`. Defaults to 'numpy'.
+            categorical (list[str] | None): Low cardinality columns returned as `pd.Categorical`, dictionary
+                encoded before they are converted to pandas. ENUM columns are always categoricals.
+                Defaults to None.
+            timeout (float | None): Maximum number of seconds the query may run. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the query from another thread.
+
         Returns:
             pd.DataFrame: The materialized DataFrame.
+
+        Raises:
+            ValueError: If `dtype_backend` is invalid or a `categorical` column does not exist.
+            LazyPandasQueryTimeout: If the query runs longer than `timeout`.
+            LazyPandasQueryCancelled: If `cancellation_token` is cancelled.
+            LazyPandasUnsupporttedOperation: If `timeout` or `cancellation_token` is given and the
+                connection of the frame is unknown.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('data.parquet')
+        result = df.collect(timeout=30)
+        result = df.collect(dtype_backend="pyarrow", categorical=["country"])
+        ```
         """
-        return self._relation.to_df()
+        convert = _pandas_converter(dtype_backend, categorical)
+        with self._execution(timeout, cancellation_token) as (relation, _):
+            return instrumentation.track("collect", relation, convert)
 
     def dropna(
         self, *, how: Literal["any", "all"] = "any", subset: str | list[str] | None = None, inplace: bool = False
@@ -62,45 +409,630 @@ class LazyFrame:
         if inplace:
             self._relation = rel
         else:
-            return LazyFrame(rel)
+            return LazyFrame(rel, self._connection)
 
-    def to_pandas(self) -> "pd.DataFrame":
+    def to_pandas(
+        self,
+        *,
+        dtype_backend: DtypeBackend = "numpy",
+        categorical: list[str] | None = None,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> "pd.DataFrame":
         """
         Alias for `collect()`.
 
+        Args:
+            dtype_backend (Literal["numpy", "numpy_nullable", "pyarrow"]): Dtypes of the columns. Defaults to 'numpy'.
+            categorical (list[str] | None): Columns returned as `pd.Categorical`. Defaults to None.
+            timeout (float | None): Maximum number of seconds the query may run. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the query from another thread.
+
         Returns:
             pd.DataFrame: The materialized DataFrame.
         """
-        return self.collect()
+        return self.collect(
+            dtype_backend=dtype_backend,
+            categorical=categorical,
+            timeout=timeout,
+            cancellation_token=cancellation_token,
+        )
 
-    def to_polars(self) -> "pl.DataFrame":
+    def to_polars(
+        self, *, timeout: float | None = None, cancellation_token: CancellationToken | None = None
+    ) -> "pl.DataFrame":
         """
         Convert the relation to a Polars DataFrame.
 
+        Args:
+            timeout (float | None): Maximum number of seconds the query may run. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the query from another thread.
+
         Returns:
             pl.DataFrame: The Polars DataFrame.
         """
-        return self._relation.pl()
+        with self._execution(timeout, cancellation_token) as (relation, _):
+            return instrumentation.track("to_polars", relation, lambda relation: relation.pl())
+
+    def to_arrow(
+        self,
+        batch_size: int | None = None,
+        *,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> "pa.Table":
+        """
+        Convert the relation to an Arrow Table.
+
+        Args:
+            batch_size (int | None): The number of rows of each RecordBatch that makes up the table.
+                If None, DuckDB's default batch size is used. The whole result is still materialized,
+                use `iter_batches()` to stream it instead.
+            timeout (float | None): Maximum number of seconds the query may run. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the query from another thread.
+
+        Returns:
+            pa.Table: The Arrow representation of the data.
+        """
+        with self._execution(timeout, cancellation_token) as (relation, _):
+            if batch_size is None:
+                return instrumentation.track("to_arrow", relation, lambda relation: relation.arrow())
+            return instrumentation.track("to_arrow", relation, lambda relation: relation.arrow(batch_size=batch_size))
+
+    def to_numpy(
+        self,
+        columns: str | list[str] | None = None,
+        *,
+        dtype: Any = None,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> "np.ndarray":
+        """
+        Materialize the relation as a two dimensional NumPy array, fetched with DuckDB's `fetchnumpy`
+        without building a pandas DataFrame.
+
+        Args:
+            columns (str | list[str] | None): The columns to fetch, in order. Defaults to None, all columns.
+            dtype (Any): NumPy dtype of the array. Defaults to None, the common type of the columns.
+            timeout (float | None): Maximum number of seconds the query may run. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the query from another thread.
+
+        Returns:
+            np.ndarray: Array of shape (rows, columns), a `numpy.ma.MaskedArray` if any value is null.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('data.parquet')
+        features = df.to_numpy(["age", "income"], dtype="float64")
+        ```
+        """
+        import numpy as np
+
+        frame = self if columns is None else self[[columns] if isinstance(columns, str) else columns]
+
+        def fetch(relation: DuckDBPyRelation) -> "np.ndarray":
+            arrays = [_unmask(array) for array in relation.fetchnumpy().values()]
+            stack = (
+                np.ma.column_stack if any(isinstance(array, np.ma.MaskedArray) for array in arrays) else np.column_stack
+            )
+            result = stack(arrays) if arrays else np.empty((0, 0))
+            return result if dtype is None else result.astype(dtype)
+
+        with frame._execution(timeout, cancellation_token) as (relation, _):
+            return instrumentation.track("to_numpy", relation, fetch)
+
+    def _project_windows(self, windows: dict[str, LazyWindowColumn]) -> DuckDBPyRelation:
+        # Partitioned windows return the rows grouped by partition, the ordinal puts them back in the order
+        # of the frame so that later windows over the ordinal see the same rows as pandas.
+        ordinal = quote_identifier(ORDINAL_COLUMN)
+        rel = self._relation.project(f"*, row_number() OVER () AS {ordinal}")
+        helpers = {name: sql for window in windows.values() for name, sql in window.helpers.items()}
+        if helpers:
+            rel = _project_sql(rel, helpers)
+        rel = _project_sql(rel, {col: window.sql for col, window in windows.items()})
+        return rel.order(ordinal).select(StarExpression(exclude=[ORDINAL_COLUMN, *helpers]))
+
+    @overload
+    def column_values(
+        self,
+        column: ColumnOrName | LazyWindowColumn,
+        format: Literal["numpy"] = ...,
+        *,
+        timeout: float | None = ...,
+        cancellation_token: CancellationToken | None = ...,
+    ) -> "np.ndarray": ...
+
+    @overload
+    def column_values(
+        self,
+        column: ColumnOrName | LazyWindowColumn,
+        format: Literal["arrow"],
+        *,
+        timeout: float | None = ...,
+        cancellation_token: CancellationToken | None = ...,
+    ) -> "pa.ChunkedArray": ...
+
+    def column_values(
+        self,
+        column: ColumnOrName | LazyWindowColumn,
+        format: Literal["numpy", "arrow"] = "numpy",
+        *,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> Union["np.ndarray", "pa.ChunkedArray"]:
+        """
+        Evaluate a single column or column expression and fetch its values, without building a pandas DataFrame.
+
+        Args:
+            column (str | LazyColumn | LazyWindowColumn): A column name or an expression over the columns of the frame.
+            format (Literal["numpy", "arrow"]): 'numpy' fetches a NumPy array with `fetchnumpy`, 'arrow' a
+                pyarrow ChunkedArray. Defaults to 'numpy'.
+            timeout (float | None): Maximum number of seconds the query may run. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the query from another thread.
+
+        Returns:
+            np.ndarray | pa.ChunkedArray: The values, a `numpy.ma.MaskedArray` for 'numpy' if any value is null.
+
+        Raises:
+            ValueError: If `format` is invalid.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('data.parquet')
+        target = df.column_values("label")
+        ratio = df.column_values(df["income"] / df["age"], format="arrow")
+        ```
+        """
+        if format not in ("numpy", "arrow"):
+            raise ValueError(f"Invalid format: {format!r}, expected 'numpy' or 'arrow'")
+
+        if isinstance(column, str):
+            relation = self._relation.select(ColumnExpression(column))
+        elif isinstance(column, LazyWindowColumn):
+            relation = self._project_windows({_VALUES_COLUMN: column}).select(ColumnExpression(_VALUES_COLUMN))
+        else:
+            relation = self._relation.project(column.expr)
+        frame = LazyFrame(relation, self._connection)
+
+        def fetch(relation: DuckDBPyRelation) -> Union["np.ndarray", "pa.ChunkedArray"]:
+            if format == "arrow":
+                return relation.arrow().column(0)
+            return _unmask(next(iter(relation.fetchnumpy().values())))
+
+        with frame._execution(timeout, cancellation_token) as (relation, _):
+            return instrumentation.track("column_values", relation, fetch)
+
+    def _iter_batches(
+        self, batch_size: int, format: str, timeout: float | None, cancellation_token: CancellationToken | None
+    ) -> Iterator:
+        with self._execution(timeout, cancellation_token) as (relation, check):
+            # The record batch reader consumes the result owned by the relation it is created from,
+            # so stream from a throwaway projection to keep the relation reusable.
+            event = instrumentation.start("iter_batches", relation)
+            error = None
+            reader = relation.project(StarExpression()).record_batch(batch_size)
+            try:
+                for batch in reader:
+                    check()
+                    instrumentation.add_result(event, batch)
+                    yield _convert_batch(batch, format)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                reader.close()
+                instrumentation.finish(event, error=error)
 
     @overload
-    def to_arrow(self, batch_size: Literal[None]) -> "pa.Table": ...
+    def iter_batches(
+        self,
+        batch_size: int = ...,
+        format: Literal["arrow"] = ...,
+        *,
+        timeout: float | None = ...,
+        cancellation_token: CancellationToken | None = ...,
+    ) -> Iterator["pa.RecordBatch"]: ...
 
     @overload
-    def to_arrow(self, batch_size: int) -> "pa.RecordBatch": ...
+    def iter_batches(
+        self,
+        batch_size: int = ...,
+        *,
+        format: Literal["pandas"],
+        timeout: float | None = ...,
+        cancellation_token: CancellationToken | None = ...,
+    ) -> Iterator["pd.DataFrame"]: ...
 
-    def to_arrow(self, batch_size: int | None = None) -> Union["pa.Table", "pa.RecordBatch"]:
+    @overload
+    def iter_batches(
+        self,
+        batch_size: int = ...,
+        *,
+        format: Literal["polars"],
+        timeout: float | None = ...,
+        cancellation_token: CancellationToken | None = ...,
+    ) -> Iterator["pl.DataFrame"]: ...
+
+    def iter_batches(
+        self,
+        batch_size: int = 1_000_000,
+        format: Literal["arrow", "pandas", "polars"] = "arrow",
+        *,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> Iterator[Union["pa.RecordBatch", "pd.DataFrame", "pl.DataFrame"]]:
         """
-        Convert the relation to an Arrow Table or RecordBatch.
+        Stream the relation in batches of at most `batch_size` rows.
+
+        The query is executed through DuckDB's Arrow record batch reader, so only the batch being
+        consumed is held in memory, regardless of the size of the full result.
 
         Args:
-            batch_size (int | None): The size of each RecordBatch. If None, returns an Arrow Table.
+            batch_size (int): Maximum number of rows of each batch. Defaults to 1,000,000.
+            format (str): Output format of each batch: 'arrow' (pa.RecordBatch), 'pandas'
+                (pd.DataFrame) or 'polars' (pl.DataFrame). Defaults to 'arrow'.
+            timeout (float | None): Maximum number of seconds the whole iteration may take, including
+                the time spent consuming the batches. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the query from another thread.
 
         Returns:
-            pa.Table or pa.RecordBatch: The Arrow representation of the data.
+            Iterator: A generator yielding the batches in the requested format.
+
+        Raises:
+            ValueError: If `batch_size` is not positive or `format` is not supported.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('data.parquet')
+        for batch in df.iter_batches(100_000, format="pandas"):
+            load(batch)
+        ```
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
+        if format not in ("arrow", "pandas", "polars"):
+            raise ValueError(f"Invalid value for format: {format}")
+
+        return self._iter_batches(batch_size, format, timeout, cancellation_token)
+
+    def iter_pandas(
+        self,
+        batch_size: int = 1_000_000,
+        *,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Alias for `iter_batches(batch_size, format="pandas")`.
+
+        Args:
+            batch_size (int): Maximum number of rows of each batch. Defaults to 1,000,000.
+            timeout (float | None): Maximum number of seconds the whole iteration may take. Defaults to None.
+            cancellation_token (CancellationToken | None): Token that cancels the query from another thread.
+
+        Returns:
+            Iterator[pd.DataFrame]: A generator yielding pandas DataFrames.
+        """
+        return self.iter_batches(batch_size, format="pandas", timeout=timeout, cancellation_token=cancellation_token)
+
+    async def _run_async(self, operation: str, func: Callable[[DuckDBPyRelation], T]) -> T:
+        streams.consume(self._relation)
+        with self._isolated() as isolated:
+            return await _run_in_executor(lambda relation: instrumentation.track(operation, relation, func), *isolated)
+
+    async def collect_async(
+        self, *, dtype_backend: DtypeBackend = "numpy", categorical: list[str] | None = None
+    ) -> "pd.DataFrame":
+        """
+        Asynchronous version of `collect()`.
+
+        The query runs on the default executor of the event loop, bound to its own cursor, so many
+        queries can overlap without blocking the loop. Cancelling the awaiting task interrupts the query.
+
+        Args:
+            dtype_backend (Literal["numpy", "numpy_nullable", "pyarrow"]): Dtypes of the columns. Defaults to 'numpy'.
+            categorical (list[str] | None): Columns returned as `pd.Categorical`. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The materialized DataFrame.
+
+        Example:
+        ```python
+        import asyncio
+        import lazy_pandas as lp
+        df = lp.read_parquet('data.parquet')
+        first, second = await asyncio.gather(df.head(10).collect_async(), df.collect_async())
+        ```
+        """
+        return await self._run_async("collect", _pandas_converter(dtype_backend, categorical))
+
+    async def to_arrow_async(self, batch_size: int | None = None) -> "pa.Table":
+        """
+        Asynchronous version of `to_arrow()`, see `collect_async()`.
+
+        Args:
+            batch_size (int | None): The number of rows of each RecordBatch that makes up the table.
+                If None, DuckDB's default batch size is used.
+
+        Returns:
+            pa.Table: The Arrow representation of the data.
         """
         if batch_size is None:
-            return self._relation.arrow()
-        return self._relation.arrow(batch_size=batch_size)
+            return await self._run_async("to_arrow", lambda relation: relation.arrow())
+        return await self._run_async("to_arrow", lambda relation: relation.arrow(batch_size=batch_size))
+
+    async def _aiter_batches(self, batch_size: int, format: str) -> AsyncIterator:
+        streams.consume(self._relation)
+        with self._isolated() as (relation, connection, lock):
+            # A plan that stays on the connection of the frame holds its lock until the reader is closed,
+            # so no other query runs on the connection between two batches.
+            if lock is not None:
+                await _acquire(lock)
+            try:
+                event = instrumentation.start("aiter_batches", relation)
+                error = None
+                reader = await _run_in_executor(
+                    lambda relation: relation.project(StarExpression()).record_batch(batch_size),
+                    relation,
+                    connection,
+                    None,
+                )
+
+                def read_next_batch(_) -> Union["pa.RecordBatch", "pd.DataFrame", "pl.DataFrame", None]:
+                    try:
+                        batch = reader.read_next_batch()
+                    except StopIteration:
+                        return None
+                    instrumentation.add_result(event, batch)
+                    return _convert_batch(batch, format)
+
+                try:
+                    while (batch := await _run_in_executor(read_next_batch, relation, connection, None)) is not None:
+                        yield batch
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    reader.close()
+                    instrumentation.finish(event, error=error)
+            finally:
+                if lock is not None:
+                    lock.release()
+
+    def aiter_batches(
+        self, batch_size: int = 1_000_000, format: Literal["arrow", "pandas", "polars"] = "arrow"
+    ) -> AsyncIterator[Union["pa.RecordBatch", "pd.DataFrame", "pl.DataFrame"]]:
+        """
+        Asynchronous version of `iter_batches()`, each batch is fetched on the default executor of
+        the event loop. Cancelling the consuming task interrupts the query.
+
+        Args:
+            batch_size (int): Maximum number of rows of each batch. Defaults to 1,000,000.
+            format (str): Output format of each batch: 'arrow' (pa.RecordBatch), 'pandas'
+                (pd.DataFrame) or 'polars' (pl.DataFrame). Defaults to 'arrow'.
+
+        Returns:
+            AsyncIterator: An asynchronous generator yielding the batches in the requested format.
+
+        Raises:
+            ValueError: If `batch_size` is not positive or `format` is not supported.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('data.parquet')
+        async for batch in df.aiter_batches(100_000, format="pandas"):
+            await load(batch)
+        ```
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
+        if format not in ("arrow", "pandas", "polars"):
+            raise ValueError(f"Invalid value for format: {format}")
+
+        return self._aiter_batches(batch_size, format)
+
+    def _copy_to(
+        self,
+        path: str,
+        format: str,
+        options: dict[str, bool | int | str | None],
+        *,
+        partition_by: str | list[str] | None,
+        per_thread_output: bool,
+        sort_by: str | list[str] | None,
+        overwrite: bool,
+        timeout: float | None,
+        cancellation_token: CancellationToken | None,
+    ) -> None:
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+
+        copy_options: dict[str, bool | int | str | list[str] | None] = {"format": format, **options}
+        if partition_by:
+            copy_options["partition_by"] = partition_by
+        if per_thread_output:
+            copy_options["per_thread_output"] = True
+        if overwrite and (partition_by or per_thread_output):
+            copy_options["overwrite"] = True
+
+        options_str = ", ".join(
+            f"{name} {_format_copy_option(value)}" for name, value in copy_options.items() if value is not None
+        )
+
+        def copy(relation: DuckDBPyRelation) -> None:
+            run_query(relation, lambda view: f"COPY (FROM {view}) TO {quote_literal(path)} ({options_str})")
+
+        frame = self if sort_by is None else self.sort_values(sort_by)
+        with frame._execution(timeout, cancellation_token) as (relation, _):
+            instrumentation.track(f"to_{format}", relation, copy)
+
+    def to_parquet(
+        self,
+        path: str,
+        *,
+        compression: str | None = None,
+        row_group_size: int | None = None,
+        partition_by: str | list[str] | None = None,
+        per_thread_output: bool = False,
+        sort_by: str | list[str] | None = None,
+        overwrite: bool = False,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> None:
+        """
+        Write the relation to Parquet using DuckDB's `COPY ... TO`, without materializing it in Python.
+
+        Args:
+            path (str): Destination file, or directory when `partition_by` or `per_thread_output` is used.
+            compression (str | None): Compression codec, e.g. 'snappy', 'zstd', 'gzip' or 'uncompressed'.
+                If None, DuckDB's default is used.
+            row_group_size (int | None): Target number of rows of each Parquet row group.
+            partition_by (str | list[str] | None): Column(s) used to write a hive partitioned layout
+                (`path/col=value/...`).
+            per_thread_output (bool): If True, each thread writes its own file inside `path`.
+            sort_by (str | list[str] | None): Column(s) to sort the relation by before writing.
+            overwrite (bool): Whether to overwrite the content of an existing output directory. Only
+                used together with `partition_by` or `per_thread_output`.
+            timeout (float | None): Maximum number of seconds the write may take. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the write from another thread.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_csv('events.csv')
+        df.to_parquet('events', partition_by='date', compression='zstd', row_group_size=100_000)
+        ```
+        """
+        self._copy_to(
+            path,
+            "parquet",
+            {"compression": compression, "row_group_size": row_group_size},
+            partition_by=partition_by,
+            per_thread_output=per_thread_output,
+            sort_by=sort_by,
+            overwrite=overwrite,
+            timeout=timeout,
+            cancellation_token=cancellation_token,
+        )
+
+    def to_csv(
+        self,
+        path: str,
+        *,
+        sep: str = ",",
+        header: bool = True,
+        compression: str | None = None,
+        partition_by: str | list[str] | None = None,
+        per_thread_output: bool = False,
+        sort_by: str | list[str] | None = None,
+        overwrite: bool = False,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> None:
+        """
+        Write the relation to CSV using DuckDB's `COPY ... TO`, without materializing it in Python.
+
+        Args:
+            path (str): Destination file, or directory when `partition_by` or `per_thread_output` is used.
+            sep (str): Field delimiter. Defaults to ','.
+            header (bool): Whether to write the column names as the first line. Defaults to True.
+            compression (str | None): Compression codec, e.g. 'gzip' or 'zstd'. If None, it is inferred
+                from the file extension.
+            partition_by (str | list[str] | None): Column(s) used to write a hive partitioned layout
+                (`path/col=value/...`).
+            per_thread_output (bool): If True, each thread writes its own file inside `path`.
+            sort_by (str | list[str] | None): Column(s) to sort the relation by before writing.
+            overwrite (bool): Whether to overwrite the content of an existing output directory. Only
+                used together with `partition_by` or `per_thread_output`.
+            timeout (float | None): Maximum number of seconds the write may take. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the write from another thread.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('events.parquet')
+        df.to_csv('events.csv.gz', sep=';', compression='gzip')
+        ```
+        """
+        self._copy_to(
+            path,
+            "csv",
+            {"delimiter": sep, "header": header, "compression": compression},
+            partition_by=partition_by,
+            per_thread_output=per_thread_output,
+            sort_by=sort_by,
+            overwrite=overwrite,
+            timeout=timeout,
+            cancellation_token=cancellation_token,
+        )
+
+    def to_json(
+        self,
+        path: str,
+        *,
+        lines: bool = True,
+        compression: str | None = None,
+        partition_by: str | list[str] | None = None,
+        per_thread_output: bool = False,
+        sort_by: str | list[str] | None = None,
+        overwrite: bool = False,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> None:
+        """
+        Write the relation to JSON using DuckDB's `COPY ... TO`, without materializing it in Python.
+
+        Args:
+            path (str): Destination file, or directory when `partition_by` or `per_thread_output` is used.
+            lines (bool): If True, writes newline delimited JSON, otherwise a single JSON array.
+                Defaults to True.
+            compression (str | None): Compression codec, e.g. 'gzip' or 'zstd'. If None, it is inferred
+                from the file extension.
+            partition_by (str | list[str] | None): Column(s) used to write a hive partitioned layout
+                (`path/col=value/...`).
+            per_thread_output (bool): If True, each thread writes its own file inside `path`.
+            sort_by (str | list[str] | None): Column(s) to sort the relation by before writing.
+            overwrite (bool): Whether to overwrite the content of an existing output directory. Only
+                used together with `partition_by` or `per_thread_output`.
+            timeout (float | None): Maximum number of seconds the write may take. Defaults to None, no limit.
+            cancellation_token (CancellationToken | None): Token that cancels the write from another thread.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_csv('events.csv')
+        df.to_json('events.jsonl')
+        ```
+        """
+        self._copy_to(
+            path,
+            "json",
+            {"array": not lines, "compression": compression},
+            partition_by=partition_by,
+            per_thread_output=per_thread_output,
+            sort_by=sort_by,
+            overwrite=overwrite,
+            timeout=timeout,
+            cancellation_token=cancellation_token,
+        )
+
+    @property
+    def schema(self) -> Schema:
+        """
+        Get the column names and types of the relation, computed once per relation.
+
+        Returns:
+            Schema: The names, DuckDB types and pandas dtypes of the columns.
+        """
+        if self._schema is None or self._schema[0] is not self._relation:
+            self._schema = (self._relation, Schema.from_relation(self._relation))
+        return self._schema[1]
 
     @property
     def columns(self) -> list[str]:
@@ -110,7 +1042,44 @@ class LazyFrame:
         Returns:
             list[str]: A copy of the column names.
         """
-        return self._relation.columns.copy()
+        return list(self.schema.names)
+
+    @property
+    def dtypes(self) -> "pd.Series":
+        """
+        Get the pandas dtype of each column in the result of `collect()`, without running the query.
+
+        Returns:
+            pd.Series: The dtypes indexed by column name.
+        """
+        import pandas as pd
+
+        return pd.Series(
+            [pd.api.types.pandas_dtype(dtype) for dtype in self.schema.dtypes],
+            index=list(self.schema.names),
+            dtype=object,
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        Get the number of rows and columns of the relation, counting the rows runs a query once per relation.
+
+        Returns:
+            tuple[int, int]: The number of rows and the number of columns.
+        """
+        return len(self), len(self.schema)
+
+    def _count_rows(self) -> int:
+        if self._connection is not None and self._parquet_scan is not None and self._parquet_scan[0] is self._relation:
+            path = quote_literal(self._parquet_scan[1])
+            count = self._connection.sql(f"SELECT sum(num_rows) FROM parquet_file_metadata({path})")
+        else:
+            count = self._relation.aggregate("count(*)")
+
+        with LazyFrame(count, self._connection)._execution(None, None) as (relation, _):
+            row = instrumentation.track("count", relation, lambda relation: relation.fetchone())
+        return int(row[0] or 0) if row is not None else 0
 
     def head(self, n: int = 10) -> "LazyFrame":
         """
@@ -122,7 +1091,7 @@ class LazyFrame:
         Returns:
             LazyFrame: A new LazyFrame containing the first `n` rows.
         """
-        return LazyFrame(self._relation.limit(n))
+        return LazyFrame(self._relation.limit(n), self._connection)
 
     @property
     def empty(self) -> bool:
@@ -132,78 +1101,330 @@ class LazyFrame:
         Returns:
             bool: True if the relation is empty, False otherwise.
         """
+        streams.consume(self._relation)
         rel = self._relation.limit(1).fetchone()
         return rel is None
 
     @overload
-    def sort_values(self, by: str | list[str], inplace: Literal[False] = ...) -> "LazyFrame": ...
+    def sort_values(
+        self,
+        by: str | list[str],
+        ascending: bool | list[bool] = ...,
+        inplace: Literal[False] = ...,
+        kind: SortKind = ...,
+        na_position: Literal["first", "last"] = ...,
+    ) -> "LazyFrame": ...
 
     @overload
-    def sort_values(self, by: str | list[str], inplace: Literal[True] = ...) -> None: ...
-
-    def sort_values(self, by: str | list[str], inplace: bool = False) -> Union["LazyFrame", None]:
+    def sort_values(
+        self,
+        by: str | list[str],
+        ascending: bool | list[bool] = ...,
+        inplace: Literal[True] = ...,
+        kind: SortKind = ...,
+        na_position: Literal["first", "last"] = ...,
+    ) -> None: ...
+
+    def sort_values(
+        self,
+        by: str | list[str],
+        ascending: bool | list[bool] = True,
+        inplace: bool = False,
+        kind: SortKind = "quicksort",
+        na_position: Literal["first", "last"] = "last",
+    ) -> Union["LazyFrame", None]:
         """
         Sort the relation by one or more columns.
 
+        Sorts run out of core: when the relation does not fit in the `memory_limit` of its connection,
+        DuckDB spills sorted runs to the `temp_directory` of the connection (see `Session`) instead of
+        failing.
+
         Args:
             by (str | list[str]): The column(s) to sort by.
+            ascending (bool | list[bool]): Sort ascending vs. descending, a list sets the direction of
+                each column of `by`. Defaults to True.
             inplace (bool): Whether to modify the relation in place. Defaults to False.
+            kind (str): 'stable' and 'mergesort' keep the relation order of rows with equal keys, at the cost
+                of numbering the rows. 'quicksort' and 'heapsort' leave it unspecified. Defaults to 'quicksort'.
+            na_position (Literal["first", "last"]): Whether null values come first or last. Defaults to "last".
 
         Returns:
             LazyFrame or None: A new LazyFrame if not inplace, otherwise None.
+
+        Raises:
+            ValueError: If `ascending` does not match `by`, or `kind` or `na_position` is invalid.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('sales.parquet')
+        df = df.sort_values(["store", "amount"], ascending=[True, False], na_position="first")
+        ```
         """
         if isinstance(by, str):
             by = [by]
+        if isinstance(ascending, bool):
+            ascending = [ascending] * len(by)
+        if len(ascending) != len(by):
+            raise ValueError(f"Length of ascending ({len(ascending)}) != length of by ({len(by)})")
+        if kind not in ("quicksort", "mergesort", "heapsort", "stable"):
+            raise ValueError(f"Invalid kind: {kind!r}, expected 'quicksort', 'mergesort', 'heapsort' or 'stable'")
+        if na_position not in ("first", "last"):
+            raise ValueError(f"Invalid na_position: {na_position!r}, expected 'first' or 'last'")
+
+        exprs = []
+        for col, asc in zip(by, ascending):
+            expr = ColumnExpression(col).asc() if asc else ColumnExpression(col).desc()
+            exprs.append(expr.nulls_first() if na_position == "first" else expr.nulls_last())
+
+        if kind in ("mergesort", "stable"):
+            # DuckDB sorts are not stable, ties are ordered by the position of the rows.
+            rel = (
+                self._relation.project(f"*, row_number() OVER () AS {quote_identifier(ORDINAL_COLUMN)}")
+                .sort(*exprs, ColumnExpression(ORDINAL_COLUMN))
+                .select(StarExpression(exclude=[ORDINAL_COLUMN]))
+            )
+        else:
+            rel = self._relation.sort(*exprs)
 
-        rel = self._relation.sort(*[ColumnExpression(col) for col in by])
         if inplace:
             self._relation = rel
         else:
-            return LazyFrame(rel)
+            return LazyFrame(rel, self._connection)
+
+    def _top(
+        self,
+        n: int,
+        columns: str | list[str],
+        keep: Literal["first", "last", "all"],
+        descending: bool,
+        partition_by: list[str] | None = None,
+    ) -> "LazyFrame":
+        if keep not in ("first", "last", "all"):
+            raise ValueError(f"Invalid keep: {keep!r}, expected 'first', 'last' or 'all'")
+        if isinstance(columns, str):
+            columns = [columns]
+
+        # Ties are broken by the position of the rows, so the result is deterministic.
+        ordinal = quote_identifier(ORDINAL_COLUMN)
+        direction = "DESC" if descending else "ASC"
+        order = [f"{quote_identifier(col)} {direction} NULLS LAST" for col in columns]
+        tie_break = f"{ordinal} DESC" if keep == "last" else ordinal
+        rel = self._relation.project(f"*, row_number() OVER () AS {ordinal}")
+
+        if partition_by or keep == "all":
+            rank_name = f"tmp_col_{uuid.uuid1().hex}"
+            rank_col = quote_identifier(rank_name)
+            rank_func = "rank()" if keep == "all" else "row_number()"
+            partition = f"PARTITION BY {', '.join(partition_by)} " if partition_by else ""
+            window_order = ", ".join(order if keep == "all" else [*order, tie_break])
+            rel = (
+                rel.project(f"*, {rank_func} OVER ({partition}ORDER BY {window_order}) AS {rank_col}")
+                .filter(f"{rank_col} <= {int(n)}")
+                .order(", ".join([*(partition_by or []), *order, tie_break]))
+                .select(StarExpression(exclude=[ORDINAL_COLUMN, rank_name]))
+            )
+        else:
+            rel = rel.order(", ".join([*order, tie_break])).limit(n).select(StarExpression(exclude=[ORDINAL_COLUMN]))
+
+        return LazyFrame(rel, self._connection)
+
+    def nlargest(
+        self, n: int, columns: str | list[str], keep: Literal["first", "last", "all"] = "first"
+    ) -> "LazyFrame":
+        """
+        Return the first `n` rows ordered by `columns` in descending order.
+
+        Compiles into DuckDB's top-N operator, which only keeps `n` rows in memory instead of sorting
+        the whole relation like `sort_values(...).head(n)` would. Null values come last.
+
+        Args:
+            n (int): Number of rows to return.
+            columns (str | list[str]): The column(s) to order by.
+            keep (Literal["first", "last", "all"]): Which of the tied rows to keep: the first or last ones
+                in the order of the relation, or all of them even if it returns more than `n` rows.
+                Defaults to "first".
+
+        Returns:
+            LazyFrame: A new LazyFrame with the `n` rows with the largest values.
+
+        Raises:
+            ValueError: If keep is not "first", "last" or "all".
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('scores.parquet')
+        leaderboard = df.nlargest(100, "score")
+        ```
+        """
+        return self._top(n, columns, keep, descending=True)
+
+    def nsmallest(
+        self, n: int, columns: str | list[str], keep: Literal["first", "last", "all"] = "first"
+    ) -> "LazyFrame":
+        """
+        Return the first `n` rows ordered by `columns` in ascending order.
+
+        See `nlargest`.
+
+        Args:
+            n (int): Number of rows to return.
+            columns (str | list[str]): The column(s) to order by.
+            keep (Literal["first", "last", "all"]): Which of the tied rows to keep. Defaults to "first".
+
+        Returns:
+            LazyFrame: A new LazyFrame with the `n` rows with the smallest values.
+
+        Raises:
+            ValueError: If keep is not "first", "last" or "all".
+        """
+        return self._top(n, columns, keep, descending=False)
 
     @overload
-    def drop_duplicates(self, subset: str | list[str] | None = ..., inplace: Literal[False] = ...) -> "LazyFrame": ...
+    def drop_duplicates(
+        self,
+        subset: str | list[str] | None = ...,
+        keep: Literal["first", "last", False] = ...,
+        inplace: Literal[False] = ...,
+    ) -> "LazyFrame": ...
 
     @overload
-    def drop_duplicates(self, subset: str | list[str] | None = ..., inplace: Literal[True] = ...) -> None: ...
+    def drop_duplicates(
+        self,
+        subset: str | list[str] | None = ...,
+        keep: Literal["first", "last", False] = ...,
+        inplace: Literal[True] = ...,
+    ) -> None: ...
 
-    def drop_duplicates(self, subset: str | list[str] | None = None, inplace: bool = False) -> Union["LazyFrame", None]:
+    def drop_duplicates(
+        self,
+        subset: str | list[str] | None = None,
+        keep: Literal["first", "last", False] = "first",
+        inplace: bool = False,
+    ) -> Union["LazyFrame", None]:
         """
         Remove duplicate rows from the relation.
 
+        With a subset, rows are numbered in the order of the relation and each group of duplicates is
+        reduced with a hash aggregate keeping the values of the first or last row, so the result is
+        deterministic and keeps the order of the relation. Only one row per group is held in memory, not
+        the whole group. Without a subset duplicates are identical, so they are removed with a plain
+        `DISTINCT` and the rows come back in no particular order.
+
         Args:
-            subset (list[str] | None): The subset of columns to consider for duplicates. Defaults to None.
+            subset (str | list[str] | None): The subset of columns to consider for duplicates. Defaults to None,
+                which considers all columns.
+            keep (Literal["first", "last", False]): Which duplicate to keep, False drops every duplicated row.
+                Defaults to "first".
             inplace (bool): Whether to modify the relation in place. Defaults to False.
 
         Returns:
             LazyFrame or None: A new LazyFrame if not inplace, otherwise None.
+
+        Raises:
+            ValueError: If keep is not "first", "last" or False.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_csv('events.csv')
+        latest = df.sort_values("updated_at").drop_duplicates(subset="id", keep="last")
+        ```
         """
-        if subset is None:
+        if keep not in ("first", "last", False):
+            raise ValueError(f"Invalid keep: {keep!r}, expected 'first', 'last' or False")
+        count_col = f"tmp_col_{uuid.uuid1().hex}"
+        count = quote_identifier(count_col)
+        if subset is None and keep is False:
+            rel = self._relation.aggregate(f"*, count(*) AS {count}", "ALL").filter(f"{count} = 1")
+            rel = rel.select(StarExpression(exclude=[count_col]))
+        elif subset is None:
             rel = self._relation.distinct()
         else:
             if isinstance(subset, str):
                 subset = [subset]
 
-            rn_col = f"tmp_col_{uuid.uuid1().hex}"
-            subset_str = ", ".join([f'"{c}"' for c in subset])
-            window_spec = f"OVER(PARTITION BY {subset_str}) AS {rn_col}"
-            expr = StarExpression(exclude=[rn_col])
-            rel = self._relation.row_number(window_spec, "*").filter(f'"{rn_col}" == 1').select(expr)
+            ordinal = quote_identifier(ORDINAL_COLUMN)
+            arg_func, ordinal_func = ("arg_max_null", "max") if keep == "last" else ("arg_min_null", "min")
+            aggregations = [
+                f"{arg_func}(COLUMNS(* EXCLUDE ({ordinal})), {ordinal})",
+                f"{ordinal_func}({ordinal}) AS {ordinal}",
+                f"count(*) AS {count}",
+            ]
+            rel = self._relation.project(f"*, row_number() OVER () AS {ordinal}").aggregate(
+                ", ".join(aggregations), ", ".join(quote_identifier(col) for col in subset)
+            )
+            if keep is False:
+                rel = rel.filter(f"{count} = 1")
+            rel = rel.order(ordinal).select(StarExpression(exclude=[ORDINAL_COLUMN, count_col]))
 
         if inplace:
             self._relation = rel
         else:
-            return LazyFrame(rel)
+            return LazyFrame(rel, self._connection)
+
+    def astype(self, dtype: str | DuckDBPyType | dict[str, str | DuckDBPyType]) -> "LazyFrame":
+        """
+        Cast columns to other types, all of them in a single projection.
 
-    def astype(self, dtype: str | type | dict[str, str | DuckDBPyType]) -> "LazyFrame":
+        Args:
+            dtype (str | DuckDBPyType | dict[str, str | DuckDBPyType]): The type of every column, or a
+                mapping from column names to their new type.
+
+        Returns:
+            LazyFrame: A new LazyFrame with the columns cast.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_csv('data.csv', all_varchar=True)
+        df = df.astype({"id": "BIGINT", "amount": "DOUBLE"})
+        ```
+        """
         if isinstance(dtype, str | DuckDBPyType):
             dtype = {col: dtype for col in self.columns}
 
-        curr = self
-        for col, col_dtype in dtype.items():
-            curr[col] = curr[col].astype(col_dtype)
+        frame = self.copy()
+        frame._assign({col: self[col].astype(col_dtype).expr for col, col_dtype in dtype.items()})
+        return frame
 
-        return curr
+    def assign(self, **columns: Any) -> "LazyFrame":
+        """
+        Assign new columns or replace existing ones, returning a new LazyFrame.
+
+        Like in pandas, the columns are assigned in order and a callable receives the frame with the
+        previous assignments applied. Other values are evaluated against the frame `assign` is called on,
+        and consecutive ones are projected at once, so assigning hundreds of columns binds a single projection.
+
+        Args:
+            **columns (LazyColumn | LazyWindowColumn | Expression | Callable | Any): The values of the
+                columns, by column name. Callables are called with the frame and return the value.
+
+        Returns:
+            LazyFrame: A new LazyFrame with the assigned columns.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_csv('data.csv')
+        df = df.assign(total=df["price"] * df["quantity"], discounted=lambda d: d["total"] * 0.9)
+        ```
+        """
+        frame = self.copy()
+        exprs: dict[str, Expression] = {}
+        for key, value in columns.items():
+            if not callable(value) and not isinstance(value, LazyWindowColumn):
+                exprs[key] = _to_expression(value)
+                continue
+            if exprs:
+                frame._assign(exprs)
+                exprs = {}
+            frame[key] = value(frame) if callable(value) else value
+        if exprs:
+            frame._assign(exprs)
+        return frame
 
     def explode(self, column: str | list[str]) -> "LazyFrame":
         if isinstance(column, str):
@@ -214,7 +1435,7 @@ class LazyFrame:
             *[FunctionExpression("explode", ColumnExpression(col)) for col in column],
         )
 
-        return LazyFrame(rel)
+        return LazyFrame(rel, self._connection)
 
     def reset_index(self) -> "LazyFrame":
         return self
@@ -231,6 +1452,189 @@ class LazyFrame:
         """
         return LazyGrouppedFrame(self, by)
 
+    def resample(
+        self,
+        rule: str | timedelta,
+        on: str,
+        *,
+        origin: Origin = "start_day",
+        label: Literal["left", "right"] | None = None,
+        closed: Literal["left", "right"] | None = None,
+        fill_gaps: bool = False,
+    ) -> LazyResampler:
+        """
+        Group the relation into time buckets of the `on` column, computed with DuckDB's `time_bucket`.
+
+        The reducers of the result (`sum`, `mean`, `agg`, ...) bucket and aggregate in a single pass,
+        returning a LazyFrame sorted by bucket.
+
+        Args:
+            rule (str | timedelta): The width of the buckets, as a pandas frequency like '15min', '1h',
+                '7D' or 'MS', or a timedelta.
+            on (str): The timestamp column to bucket.
+            origin (str | datetime): The timestamp the buckets are aligned to: 'start_day' (midnight of
+                the first day), 'start' (first timestamp), 'epoch' or a timestamp. Ignored for week,
+                month, quarter and year buckets, which start at the beginning of the calendar period.
+                Defaults to 'start_day'.
+            label (str | None): Whether buckets are labeled by their 'left' or 'right' edge. Defaults to
+                None, 'right' for the week, month, quarter and year end rules ('W', 'ME', 'QE', 'YE') and 'left'
+                otherwise.
+            closed (str | None): Which edge of the buckets is inclusive, 'left' or 'right'. Defaults to
+                None, 'right' for the week, month, quarter and year end rules and 'left' otherwise.
+            fill_gaps (bool): If True, buckets without rows are added to the results with null
+                aggregates. Defaults to False.
+
+        Returns:
+            LazyResampler: A grouped object to aggregate the buckets.
+
+        Raises:
+            LazyPandasUnsupporttedOperation: If `rule` is a multiple of weeks like '2W', whose buckets pandas
+                anchors on the data.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('telemetry.parquet')
+        df.resample("15min", on="timestamp").agg({"cpu": "mean", "requests": "sum"})
+        ```
+        """
+        default = "right" if is_period_end_frequency(rule) else "left"
+        bucket = time_bucket(on, rule, origin, label or default, closed or default)
+
+        frame = self
+        aggregate = origin_aggregate(on, rule, origin)
+        if aggregate is not None:
+            # The origin is a single row aggregate joined to every row, a window over the whole relation
+            # would materialize it before bucketing.
+            origin_relation = self._relation.aggregate(f"{aggregate} AS {quote_identifier(ORIGIN_COLUMN)}")
+            relation = self._relation.join(origin_relation.set_alias(ORIGIN_COLUMN), "true", how="inner")
+            frame = LazyFrame(relation, self._connection)
+
+        relation = _project_sql(frame._relation, {on: bucket})
+        if aggregate is not None:
+            relation = relation.project(StarExpression(exclude=[ORIGIN_COLUMN]))
+        return LazyResampler(LazyFrame(relation, self._connection), on, rule, fill_gaps)
+
+    def _explain_analyze(self, format: Literal["json", "query_tree"]) -> str:
+        # DuckDB prints the profile to stdout unless it is given a file, which is also the only place
+        # where the totals of the query are filled in.
+        streams.consume(self._relation)
+        with tempfile.TemporaryDirectory(prefix="lazy_pandas_profile_") as directory:
+            path = os.path.join(directory, "profile")
+            with (
+                self._isolated() as (relation, _, lock),
+                lock or nullcontext(),
+                temporary_settings(relation, profiling_output=path, enable_profiling=format),
+            ):
+                relation.explain("analyze")
+                with open(path) as f:
+                    return f.read()
+
+    def explain(self, mode: Literal["logical", "physical", "analyze"] = "physical") -> str:
+        """
+        Describe the plan DuckDB builds for the frame.
+
+        Args:
+            mode (str): 'logical' for the optimized logical plan, 'physical' for the physical plan, or
+                'analyze' to run the query and annotate the physical plan with the rows and time of each
+                operator. Defaults to 'physical'.
+
+        Returns:
+            str: The rendered plan.
+
+        Raises:
+            ValueError: If `mode` is not supported.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('data.parquet')
+        print(df[df["amount"] > 0].groupby("store").sum().explain("analyze"))
+        ```
+        """
+        if mode == "analyze":
+            return self._explain_analyze("query_tree")
+        if mode == "logical":
+            settings = {"explain_output": "optimized_only"}
+        elif mode == "physical":
+            settings = {}
+        else:
+            raise ValueError(f"Invalid value for mode: {mode}")
+
+        with self._isolated() as (relation, _, lock), lock or nullcontext(), temporary_settings(relation, **settings):
+            return relation.explain()
+
+    def profile(self) -> QueryProfile:
+        """
+        Run the query with DuckDB profiling enabled and return the profile of each operator.
+
+        The rows of the result are discarded, only the profile is kept.
+
+        Returns:
+            QueryProfile: The profile of the query, a tree of `OperatorProfile` with the rows, time,
+                output size and estimated cardinality of each operator.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('data.parquet')
+        profile = df.groupby("store").sum().profile()
+        print(profile)
+        slowest = profile.slowest()[0]
+        ```
+        """
+        return QueryProfile.from_json(self._explain_analyze("json"))
+
+    def persist(self, storage: Storage = "memory") -> "LazyFrame":
+        """
+        Execute the relation once and store its rows in DuckDB, returning a frame that scans them.
+
+        Every terminal operation re-executes the whole plan of a frame. Persisting a frame that feeds
+        several downstream computations reads and transforms its sources only once. The storage is
+        kept until `unpersist()` (or `lazy_pandas.unpersist_all()`) is called.
+
+        Args:
+            storage (str): 'memory' stores the rows in a temporary table, 'disk' in a temporary DuckDB
+                database file, for results that do not fit in memory. Defaults to 'memory'.
+
+        Returns:
+            LazyFrame: A new LazyFrame scanning the persisted rows.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_csv('data.csv')
+        df = df[df["amount"] > 0].persist()
+        totals = df.groupby("account").sum().collect()
+        latest = df.sort_values("date").head(10).collect()
+        df.unpersist()
+        ```
+        """
+        streams.consume(self._relation)
+        persisted = PersistedRelation(self._relation, storage)
+        frame = LazyFrame(persisted.relation, self._connection)
+        frame._persisted = persisted
+        return frame
+
+    def cache(self) -> "LazyFrame":
+        """
+        Alias for `persist(storage="memory")`.
+
+        Returns:
+            LazyFrame: A new LazyFrame scanning the persisted rows.
+        """
+        return self.persist("memory")
+
+    def unpersist(self) -> None:
+        """
+        Free the storage of a frame returned by `persist()` or `cache()`.
+
+        Frames derived from it can no longer be executed afterwards. Does nothing for frames
+        that were not persisted.
+        """
+        if self._persisted is not None:
+            self._persisted.free()
+
     def copy(self) -> "LazyFrame":
         """
         Create a copy of the LazyFrame.
@@ -238,31 +1642,149 @@ class LazyFrame:
         Returns:
             LazyFrame: A new LazyFrame with the same underlying relation.
         """
-        return LazyFrame(self._relation)
+        frame = LazyFrame(self._relation, self._connection)
+        # The caches are tied to the relation, so the copy can reuse them until either frame changes.
+        frame._schema, frame._row_count, frame._parquet_scan = self._schema, self._row_count, self._parquet_scan
+        return frame
 
     def merge(
         self,
         right: Union["LazyFrame", duckdb.DuckDBPyRelation],
-        on: str | list[str],
-        how: Literal["inner", "right", "left", "outer"] = "inner",
+        on: str | list[str] | None = None,
+        how: MergeHow = "inner",
+        *,
+        left_on: str | list[str] | None = None,
+        right_on: str | list[str] | None = None,
+        suffixes: tuple[str | None, str | None] = ("_x", "_y"),
+        indicator: bool | str = False,
+        validate: MergeValidate | None = None,
     ) -> "LazyFrame":
         """
         Merge two relations on one or more columns.
 
+        'semi' and 'anti' keep the rows of the left relation with, respectively without, a match in the
+        right relation. They compile into hash semi/anti joins, which never duplicate left rows and are
+        the efficient replacement of `isin` over a collected list of keys.
+
         Args:
             right (LazyFrame): The right relation to merge.
-            on (str | list[str]): The column(s) to merge on.
-            how (str): The type of merge to perform. Defaults to 'inner'.
+            on (str | list[str] | None): The column(s) to merge on, present in both relations. Defaults to
+                None, the columns common to both relations unless `left_on` and `right_on` are given.
+            how (str): The type of merge to perform: 'inner', 'left', 'right', 'outer', 'semi', 'anti' or
+                'cross'. Defaults to 'inner'.
+            left_on (str | list[str] | None): The column(s) of the left relation to merge on.
+            right_on (str | list[str] | None): The column(s) of the right relation to merge on.
+            suffixes (tuple[str | None, str | None]): Suffixes added to the overlapping columns of the left
+                and right relations, None keeps the name of that side. Defaults to ("_x", "_y").
+            indicator (bool | str): Add a categorical column telling whether each row comes from
+                'left_only', 'right_only' or 'both' relations, named '_merge' or the given name.
+            validate (str | None): Check the merge keys are unique in the left ('one_to_many' or '1:m'),
+                right ('many_to_one' or 'm:1') or both ('one_to_one' or '1:1') relations. The check runs
+                a query right away.
 
         Returns:
             LazyFrame: A new LazyFrame with the merged data.
+
+        Raises:
+            ValueError: If the merge keys, `how`, `suffixes`, `indicator` or `validate` are invalid, or
+                the merge keys are not unique as required by `validate`.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        orders = lp.read_parquet('orders.parquet')
+        customers = lp.read_parquet('customers.parquet')
+        df = orders.merge(customers, left_on="customer_id", right_on="id", how="left", suffixes=("", "_customer"))
+        active_orders = orders.merge(customers[customers["active"]], on="customer_id", how="semi")
+        ```
         """
-        if isinstance(on, str):
-            on = [on]
+        if how not in ("inner", "left", "right", "outer", "semi", "anti", "cross"):
+            raise ValueError(
+                f"Invalid how: {how!r}, expected 'inner', 'left', 'right', 'outer', 'semi', 'anti' or 'cross'"
+            )
 
         right_relation = right._relation if isinstance(right, LazyFrame) else right
-
-        return LazyFrame(self._relation.join(right_relation, *on, how=how))
+        left_columns, right_columns = self._relation.columns, right_relation.columns
+        if how == "cross":
+            if on is not None or left_on is not None or right_on is not None:
+                raise ValueError("Can not pass on, left_on or right_on to merge with how='cross'")
+            left_keys = right_keys = []
+        elif on is not None:
+            if left_on is not None or right_on is not None:
+                raise ValueError("Can only pass on or left_on and right_on, not a combination of both")
+            left_keys = right_keys = [on] if isinstance(on, str) else list(on)
+        elif left_on is not None and right_on is not None:
+            left_keys = [left_on] if isinstance(left_on, str) else list(left_on)
+            right_keys = [right_on] if isinstance(right_on, str) else list(right_on)
+            if len(left_keys) != len(right_keys):
+                raise ValueError("len(right_on) must equal len(left_on)")
+        elif left_on is None and right_on is None:
+            left_keys = right_keys = [col for col in left_columns if col in right_columns]
+            if not left_keys:
+                raise ValueError("No common columns to perform merge on, pass on or left_on and right_on")
+        else:
+            raise ValueError("Must pass both left_on and right_on")
+
+        if indicator is not False and how in ("semi", "anti"):
+            raise ValueError(f"indicator is not supported with how={how!r}, every row comes from the left relation")
+        if validate is not None:
+            _validate_merge(self._relation, right_relation, left_keys, right_keys, validate)
+
+        indicator_name = "_merge" if indicator is True else indicator
+        left_rel, right_rel = self._relation, right_relation
+        if indicator_name:
+            left_rel = left_rel.project(f"*, true AS {quote_identifier(_LEFT_MARKER)}")
+            right_rel = right_rel.project(f"*, true AS {quote_identifier(_RIGHT_MARKER)}")
+
+        lhs, rhs = quote_identifier(_LEFT_ALIAS), quote_identifier(_RIGHT_ALIAS)
+        condition = " AND ".join(
+            f"{lhs}.{quote_identifier(lk)} = {rhs}.{quote_identifier(rk)}" for lk, rk in zip(left_keys, right_keys)
+        )
+        rel = left_rel.set_alias(_LEFT_ALIAS).join(
+            right_rel.set_alias(_RIGHT_ALIAS), condition or "true", how="inner" if how == "cross" else how
+        )
+        if how in ("semi", "anti"):
+            return LazyFrame(rel, self._connection)
+
+        # Keys with the same name on both sides are merged into a single column, like pandas does.
+        merged = {lk for lk, rk in zip(left_keys, right_keys) if lk == rk}
+        right_columns = [col for col in right_columns if col not in merged]
+        names = merge_column_names(left_columns, right_columns, suffixes)
+
+        exprs = []
+        for col in left_columns:
+            ref = f"{lhs}.{quote_identifier(col)}"
+            if col in merged and how in ("right", "outer"):
+                ref = f"COALESCE({ref}, {rhs}.{quote_identifier(col)})"
+            exprs.append(ref)
+        exprs += [f"{rhs}.{quote_identifier(col)}" for col in right_columns]
+        if indicator_name:
+            if indicator_name in names:
+                raise ValueError(f"Cannot use name of an existing column for indicator column: {indicator_name}")
+            names.append(indicator_name)
+            exprs.append(
+                f"CAST(CASE WHEN {rhs}.{quote_identifier(_RIGHT_MARKER)} IS NULL THEN 'left_only' "
+                f"WHEN {lhs}.{quote_identifier(_LEFT_MARKER)} IS NULL THEN 'right_only' ELSE 'both' END "
+                "AS ENUM ('left_only', 'right_only', 'both'))"
+            )
+
+        projection = ", ".join(f"{expr} AS {quote_identifier(name)}" for expr, name in zip(exprs, names))
+        return LazyFrame(rel.project(projection), self._connection)
+
+    def _assign(self, exprs: dict[str, Expression]) -> None:
+        # The assignments join the projection of the previous ones, unless the frame changed since or
+        # an expression depends on one of them. Expressions of the same call are all evaluated against
+        # the relation before it.
+        base, pending = self._relation, {}
+        if self._assignments is not None:
+            previous_base, previous_result, previous_exprs = self._assignments
+            referenced = set().union(*(_referenced_names(expr) for expr in exprs.values()))
+            if previous_result is self._relation and not referenced & {col.lower() for col in previous_exprs}:
+                base, pending = previous_base, previous_exprs
+
+        exprs = {**pending, **exprs}
+        self._relation = _project_assignments(base, exprs)
+        self._assignments = (base, self._relation, exprs)
 
     @overload
     def __getitem__(self, key: str) -> LazyColumn: ...
@@ -284,13 +1806,16 @@ class LazyFrame:
             LazyPandasUnsupporttedOperation: If an unsupported operation is attempted.
         """
         if isinstance(key, list):
-            return LazyFrame(self._relation.select(*key))
+            return LazyFrame(self._relation.select(*key), self._connection)
 
         if isinstance(key, str):
-            return LazyColumn(ColumnExpression(key))
+            return LazyColumn(ColumnExpression(key), self._relation)
+
+        if isinstance(key, LazyIsinColumn):
+            return LazyFrame(key._filter_relation(self._relation, self._connection), self._connection)
 
         if isinstance(key, LazyColumn):
-            return LazyFrame(self._relation.filter(key.expr))
+            return LazyFrame(self._relation.filter(key.expr), self._connection)
 
         raise LazyPandasUnsupporttedOperation(
             f"LazyPandas does not support all pandas operations, use collect() to get a pandas DataFrame and then perform the operation {key}"
@@ -302,26 +1827,27 @@ class LazyFrame:
 
         Args:
             key (str): The name of the column.
-            value (LazyColumn | Expression | Any): The value or expression for the column.
+            value (LazyColumn | LazyWindowColumn | Expression | Any): The value or expression for the column.
         """
         if isinstance(key, str):
-            if isinstance(value, LazyColumn):
-                expr = value.expr.alias(key)
-            elif isinstance(value, Expression):
-                expr = value.alias(key)
-            else:
-                expr = ConstantExpression(value).alias(key)
+            if isinstance(value, LazyWindowColumn):
+                self._relation = self._project_windows({key: value})
+                return
 
-            if key in (columns := self._relation.columns):
-                idx = columns.index(key)
-                self._relation = self._relation.project(*columns[:idx], expr, *columns[idx + 1 :])
-            else:
-                self._relation = self._relation.project(*columns, expr)
+            self._assign({key: _to_expression(value)})
             return
 
     def __delitem__(self, key: str) -> None:
         self._relation = self._relation.project(StarExpression(exclude=[key]))
 
+    def __len__(self) -> int:
+        if self._row_count is None or self._row_count[0] is not self._relation:
+            self._row_count = (self._relation, self._count_rows())
+        return self._row_count[1]
+
+    def __bool__(self) -> bool:
+        raise ValueError("The truth value of a LazyFrame is ambiguous. Use df.empty or len(df) instead.")
+
     def __repr__(self) -> str:
         return repr(self._relation)
 
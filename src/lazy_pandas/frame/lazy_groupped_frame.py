@@ -1,32 +1,441 @@
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from datetime import timedelta
+from typing import TYPE_CHECKING, Literal, Union
 
 from duckdb import DuckDBPyRelation
 
+from lazy_pandas.column import lazy_window_column as window
+from lazy_pandas.column.lazy_window_column import Closed, LazyRolling, LazyWindowColumn, RankMethod
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
+from lazy_pandas.utils import quote_identifier
+
 if TYPE_CHECKING:
     from lazy_pandas import LazyFrame
 
+__all__ = ["LazyGrouppedFrame"]
+
+
+AggFunc = str | list[str]
+
+# Aggregates are SQL, the expression API has no DISTINCT or FILTER clauses. Like in pandas, first
+# and last skip nulls.
+_AGGREGATIONS: dict[str, Callable[[str], str]] = {
+    "sum": lambda col: f"sum({col})",
+    "min": lambda col: f"min({col})",
+    "max": lambda col: f"max({col})",
+    "mean": lambda col: f"avg({col})",
+    "median": lambda col: f"median({col})",
+    "std": lambda col: f"stddev_samp({col})",
+    "var": lambda col: f"var_samp({col})",
+    "count": lambda col: f"count({col})",
+    "first": lambda col: f"first({col}) FILTER (WHERE {col} IS NOT NULL)",
+    "last": lambda col: f"last({col}) FILTER (WHERE {col} IS NOT NULL)",
+    "nunique": lambda col: f"count(DISTINCT {col})",
+}
+
+
+def _aggregation(column: str, func: str, name: str) -> str:
+    if func not in _AGGREGATIONS:
+        raise LazyPandasUnsupporttedOperation(
+            f"Aggregation '{func}' is not supported, available aggregations are: {', '.join(_AGGREGATIONS)}"
+        )
+    return f"{_AGGREGATIONS[func](quote_identifier(column))} AS {quote_identifier(name)}"
+
+
+def _reducer(func: str, doc: str) -> Callable[["LazyGrouppedFrame"], "LazyFrame"]:
+    def _(self: "LazyGrouppedFrame") -> "LazyFrame":
+        return self.agg(func)
+
+    _.__doc__ = doc
+    return _
+
 
 class LazyGrouppedFrame:
-    def __init__(self, frame: "LazyFrame", by: list[str] | str):
+    @property
+    def _relation(self) -> DuckDBPyRelation:
+        return self._frame._relation
+
+    @property
+    def _agg_columns(self) -> list[str]:
+        if isinstance(self._selection, str):
+            return [self._selection]
+        if self._selection is not None:
+            return self._selection
+        return [col for col in self._relation.columns if col not in self._by]
+
+    def _aggregate(self, exprs: list[str]) -> "LazyFrame":
+        group_expr = ", ".join(quote_identifier(col) for col in self._by)
+        rel = self._relation.aggregate(", ".join([group_expr, *exprs]), group_expr)
+        return type(self._frame)(rel, self._frame._connection)
+
+    def agg(self, func: AggFunc | dict[str, AggFunc] | None = None, **named_aggs: tuple[str, str]) -> "LazyFrame":
+        """
+        Aggregate the groups with one or more reducers, compiled into a single aggregation.
+
+        Supported reducers are 'sum', 'min', 'max', 'mean', 'median', 'std', 'var', 'count',
+        'first', 'last' and 'nunique'.
+
+        Args:
+            func (str | list[str] | dict[str, str | list[str]] | None): The reducer(s) to apply.
+                - A string applies the reducer to every aggregated column, keeping its name.
+                - A list applies every reducer to every aggregated column, naming the results
+                  `{column}_{reducer}`.
+                - A dict maps columns to a reducer (keeping the column name) or a list of reducers
+                  (naming the results `{column}_{reducer}`).
+            **named_aggs (tuple[str, str]): pandas named aggregations, `output=(column, reducer)`.
+
+        Returns:
+            LazyFrame: A new LazyFrame with the grouping keys followed by the aggregated columns.
+
+        Raises:
+            LazyPandasUnsupporttedOperation: If a reducer is not supported.
+            ValueError: If neither `func` nor named aggregations are given.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_csv('weather_station.csv', sep=';')
+        df.groupby("city").agg({"temperature": ["min", "max"]})
+        df.groupby("city").agg(avg_temp=("temperature", "mean"), samples=("temperature", "count"))
+        ```
+        """
+        if func is None and not named_aggs:
+            raise ValueError("No aggregation was specified")
+
+        exprs = []
+        if isinstance(func, str):
+            exprs += [_aggregation(col, func, col) for col in self._agg_columns]
+        elif isinstance(func, list):
+            exprs += [_aggregation(col, f, f"{col}_{f}") for col in self._agg_columns for f in func]
+        elif isinstance(func, dict):
+            for col, col_func in func.items():
+                if isinstance(col_func, str):
+                    exprs.append(_aggregation(col, col_func, col))
+                else:
+                    exprs += [_aggregation(col, f, f"{col}_{f}") for f in col_func]
+
+        exprs += [_aggregation(col, f, name) for name, (col, f) in named_aggs.items()]
+        return self._aggregate(exprs)
+
+    aggregate = agg
+
+    sum = _reducer("sum", "Compute the sum of each column per group.")
+    min = _reducer("min", "Compute the minimum of each column per group.")
+    max = _reducer("max", "Compute the maximum of each column per group.")
+    mean = _reducer("mean", "Compute the mean of each column per group.")
+    median = _reducer("median", "Compute the median of each column per group.")
+    std = _reducer("std", "Compute the sample standard deviation of each column per group.")
+    var = _reducer("var", "Compute the sample variance of each column per group.")
+    count = _reducer("count", "Count the non-null values of each column per group.")
+    first = _reducer("first", "Get the first non-null value of each column per group, in scan order.")
+    last = _reducer("last", "Get the last non-null value of each column per group, in scan order.")
+    nunique = _reducer("nunique", "Count the distinct non-null values of each column per group.")
+
+    def __init__(self, frame: "LazyFrame", by: list[str] | str, selection: str | list[str] | None = None):
+        """
+        Initialize a LazyGrouppedFrame, the result of `LazyFrame.groupby`.
+
+        Args:
+            frame (LazyFrame): The frame being grouped.
+            by (str | list[str]): The column(s) to group by.
+            selection (str | list[str] | None): The column(s) to aggregate. If None, every column that
+                is not a grouping key is aggregated.
+        """
         self._frame = frame
         if isinstance(by, str):
             by = [by]
         self._by = by
+        self._selection = selection
+
+    def size(self) -> "LazyFrame":
+        """
+        Count the number of rows of each group.
+
+        Returns:
+            LazyFrame: A new LazyFrame with the grouping keys and a `size` column.
+        """
+        return self._aggregate(["count(*) AS size"])
+
+    def quantile(self, q: float = 0.5) -> "LazyFrame":
+        """
+        Compute the `q` quantile of each column per group, interpolating linearly like pandas.
+
+        Args:
+            q (float): The quantile to compute, between 0 and 1. Defaults to 0.5.
+
+        Returns:
+            LazyFrame: A new LazyFrame with the grouping keys followed by the quantile of each column.
+        """
+        exprs = [
+            f"quantile_cont({quote_identifier(col)}, {float(q)}) AS {quote_identifier(col)}"
+            for col in self._agg_columns
+        ]
+        return self._aggregate(exprs)
+
+    def _top_columns(self, columns: str | list[str] | None) -> str | list[str]:
+        if columns is not None:
+            return columns
+        if self._selection is None:
+            raise ValueError("No column to order by, select one with groupby(...)[column] or pass columns")
+        return self._selection
 
     @property
-    def _relation(self) -> DuckDBPyRelation:
-        return self._frame._relation
+    def _partition_by(self) -> list[str]:
+        return [quote_identifier(col) for col in self._by]
+
+    def nlargest(
+        self, n: int, columns: str | list[str] | None = None, keep: Literal["first", "last", "all"] = "first"
+    ) -> "LazyFrame":
+        """
+        Return the first `n` rows of each group ordered by `columns` in descending order.
+
+        Compiles into a `row_number()` window per group filtered to `n` rows, like a `QUALIFY` clause.
+        Since there is no index to align a pandas-like result with, the result keeps every column of
+        the original frame, ordered by the grouping keys and then by `columns`.
+
+        Args:
+            n (int): Number of rows to return per group.
+            columns (str | list[str] | None): The column(s) to order by. Defaults to the selected column(s).
+            keep (Literal["first", "last", "all"]): Which of the tied rows to keep, see `LazyFrame.nlargest`.
+                Defaults to "first".
+
+        Returns:
+            LazyFrame: A new LazyFrame with the `n` rows with the largest values of each group.
+
+        Raises:
+            ValueError: If no column to order by is given or selected, or keep is invalid.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        df = lp.read_parquet('scores.parquet')
+        top_players = df.groupby("league")["score"].nlargest(10)
+        ```
+        """
+        return self._frame._top(n, self._top_columns(columns), keep, True, self._partition_by)
+
+    def nsmallest(
+        self, n: int, columns: str | list[str] | None = None, keep: Literal["first", "last", "all"] = "first"
+    ) -> "LazyFrame":
+        """
+        Return the first `n` rows of each group ordered by `columns` in ascending order.
+
+        See `nlargest`.
+
+        Args:
+            n (int): Number of rows to return per group.
+            columns (str | list[str] | None): The column(s) to order by. Defaults to the selected column(s).
+            keep (Literal["first", "last", "all"]): Which of the tied rows to keep. Defaults to "first".
+
+        Returns:
+            LazyFrame: A new LazyFrame with the `n` rows with the smallest values of each group.
+
+        Raises:
+            ValueError: If no column to order by is given or selected, or keep is invalid.
+        """
+        return self._frame._top(n, self._top_columns(columns), keep, False, self._partition_by)
+
+    def _window(self, build: Callable[[str], LazyWindowColumn]) -> Union["LazyFrame", LazyWindowColumn]:
+        if isinstance(self._selection, str):
+            return build(quote_identifier(self._selection))
+        windows = {col: build(quote_identifier(col)) for col in self._agg_columns}
+        return type(self._frame)(self._frame._project_windows(windows), self._frame._connection)
+
+    def transform(self, func: str) -> Union["LazyFrame", LazyWindowColumn]:
+        """
+        Broadcast a per-group aggregation back to every row of its group.
+
+        Supported functions are 'sum', 'min', 'max', 'mean', 'median', 'std', 'var', 'count',
+        'size', 'first' and 'last'.
+
+        Window operations compile into DuckDB window functions over the grouped frame. When a single
+        column was selected (`groupby(...)["col"]`) the result is a `LazyWindowColumn` to be assigned
+        to the frame; otherwise it is a LazyFrame keeping every column of the original frame, with the
+        aggregated columns replaced, since there is no index to align a pandas-like result with.
+
+        Args:
+            func (str): The aggregation to broadcast.
+
+        Returns:
+            LazyFrame | LazyWindowColumn: The transformed column(s).
+
+        Raises:
+            LazyPandasUnsupporttedOperation: If the function is not supported.
+
+        Example:
+        ```python
+        df["city_mean"] = df.groupby("city")["temperature"].transform("mean")
+        ```
+        """
+        return self._window(lambda col: window.transform(func, col, self._partition_by))
+
+    def cumsum(self) -> Union["LazyFrame", LazyWindowColumn]:
+        """
+        Compute the cumulative sum of each column per group, following the order of the rows.
+
+        See `transform` for the shape of the result.
+
+        Returns:
+            LazyFrame | LazyWindowColumn: The cumulative sums.
+        """
+        return self._window(lambda col: window.cumulative("sum", col, self._partition_by))
+
+    def cummax(self) -> Union["LazyFrame", LazyWindowColumn]:
+        """
+        Compute the cumulative maximum of each column per group, following the order of the rows.
+
+        See `transform` for the shape of the result.
+
+        Returns:
+            LazyFrame | LazyWindowColumn: The cumulative maximums.
+        """
+        return self._window(lambda col: window.cumulative("max", col, self._partition_by))
+
+    def cummin(self) -> Union["LazyFrame", LazyWindowColumn]:
+        """
+        Compute the cumulative minimum of each column per group, following the order of the rows.
+
+        See `transform` for the shape of the result.
+
+        Returns:
+            LazyFrame | LazyWindowColumn: The cumulative minimums.
+        """
+        return self._window(lambda col: window.cumulative("min", col, self._partition_by))
+
+    def cumcount(self) -> LazyWindowColumn:
+        """
+        Number each row within its group, from 0 to the group size minus 1.
+
+        Returns:
+            LazyWindowColumn: A window column to be assigned to the frame.
+
+        Example:
+        ```python
+        df["visit_number"] = df.groupby("user_id").cumcount()
+        ```
+        """
+        return window.cumcount(self._partition_by)
+
+    def rank(self, method: RankMethod = "average", ascending: bool = True) -> Union["LazyFrame", LazyWindowColumn]:
+        """
+        Rank the values of each column within its group.
+
+        See `transform` for the shape of the result.
+
+        Args:
+            method (str): How tied values are ranked: 'average', 'min', 'max', 'first' or 'dense'.
+                Defaults to 'average'.
+            ascending (bool): Whether the smallest value gets rank 1. Defaults to True.
+
+        Returns:
+            LazyFrame | LazyWindowColumn: The float ranks; null values get a null rank.
+        """
+        return self._window(lambda col: window.rank(col, method, ascending, self._partition_by))
+
+    def shift(self, periods: int = 1) -> Union["LazyFrame", LazyWindowColumn]:
+        """
+        Shift the values of each column by `periods` rows within its group.
+
+        See `transform` for the shape of the result.
+
+        Args:
+            periods (int): Number of rows to shift. Negative values shift backwards. Defaults to 1.
+
+        Returns:
+            LazyFrame | LazyWindowColumn: The shifted values.
+        """
+        return self._window(lambda col: window.shift(col, periods, self._partition_by))
+
+    def diff(self, periods: int = 1) -> Union["LazyFrame", LazyWindowColumn]:
+        """
+        Compute the difference between each value and the value `periods` rows before it in its group.
+
+        See `transform` for the shape of the result.
+
+        Args:
+            periods (int): Number of rows between the compared values. Defaults to 1.
+
+        Returns:
+            LazyFrame | LazyWindowColumn: The differences.
+        """
+        return self._window(lambda col: window.diff(col, periods, self._partition_by))
+
+    def pct_change(self, periods: int = 1) -> Union["LazyFrame", LazyWindowColumn]:
+        """
+        Compute the fractional change between each value and the value `periods` rows before it in its group.
+
+        See `transform` for the shape of the result.
+
+        Args:
+            periods (int): Number of rows between the compared values. Defaults to 1.
+
+        Returns:
+            LazyFrame | LazyWindowColumn: The fractional changes.
+        """
+        return self._window(lambda col: window.pct_change(col, periods, self._partition_by))
+
+    def rolling(
+        self,
+        window: int | str | timedelta,
+        min_periods: int | None = None,
+        on: str | None = None,
+        closed: Closed | None = None,
+    ) -> LazyRolling[Union["LazyFrame", LazyWindowColumn]]:
+        """
+        Provide rolling window calculations within each group.
+
+        See `transform` for the shape of the results of the reducers.
+
+        Args:
+            window (int | str | timedelta): Number of rows of each window, or a time offset like
+                '7D' or '15min' for time-based windows.
+            min_periods (int | None): Minimum number of non-null values required to produce a value.
+                Defaults to `window` for row-count windows and to 1 for time-based windows.
+            on (str | None): Column ordering the rows, required for time-based windows. Row-count
+                windows follow the order of the rows in the frame when it is None.
+            closed (str | None): Which endpoints of the window are included: 'right', 'left', 'both'
+                or 'neither'. Defaults to 'right'.
+
+        Returns:
+            LazyRolling: An object whose reducers (`sum`, `mean`, `max`, ...) compute the windows.
+
+        Example:
+        ```python
+        df["sales_7d"] = df.groupby("store")["sales"].rolling("7D", on="day").sum()
+        ```
+        """
+        return LazyRolling(self._window, self._partition_by, window, min_periods, on, closed)
+
+    def expanding(self, min_periods: int = 1) -> LazyRolling[Union["LazyFrame", LazyWindowColumn]]:
+        """
+        Provide expanding window calculations within each group.
+
+        See `transform` for the shape of the results of the reducers.
+
+        Args:
+            min_periods (int): Minimum number of non-null values required to produce a value. Defaults to 1.
+
+        Returns:
+            LazyRolling: An object whose reducers (`sum`, `mean`, `max`, ...) compute the windows.
+        """
+        return LazyRolling(self._window, self._partition_by, None, min_periods)
+
+    def __getitem__(self, key: str | list[str]) -> "LazyGrouppedFrame":
+        """
+        Select the column(s) to aggregate.
+
+        Selecting a single column name, like a pandas SeriesGroupBy, makes window operations
+        (`cumsum`, `rank`, `transform`, ...) return a `LazyWindowColumn` instead of a `LazyFrame`.
+
+        Args:
+            key (str | list[str]): A column name or a list of column names.
+
+        Returns:
+            LazyGrouppedFrame: A new LazyGrouppedFrame restricted to the selected columns.
 
-    def max(self) -> "LazyFrame":
-        agg_cols = set(map(str.lower, self._relation.columns)) - set(map(str.lower, self._by))
-        aggs_exprs = [f"max({col}) as {col}" for col in agg_cols]
-        aggs_expr = ", ".join(self._by + aggs_exprs)
-        rel = self._relation.aggregate(aggr_expr=aggs_expr, group_expr="all")
-        return type(self._frame)(rel)
-
-    def sum(self) -> "LazyFrame":
-        agg_cols = set(map(str.lower, self._relation.columns)) - set(map(str.lower, self._by))
-        aggs_exprs = [f"sum({col}) as {col}" for col in agg_cols]
-        aggs_expr = ", ".join(self._by + aggs_exprs)
-        rel = self._relation.aggregate(aggr_expr=aggs_expr, group_expr="all")
-        return type(self._frame)(rel)
+        Example:
+        ```python
+        df.groupby("city")["temperature"].mean()
+        ```
+        """
+        return LazyGrouppedFrame(self._frame, self._by, key)
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Literal
+
+from duckdb import ColumnExpression
+
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
+from lazy_pandas.frame.lazy_groupped_frame import LazyGrouppedFrame
+from lazy_pandas.utils import (
+    is_calendar_frequency,
+    is_period_end_frequency,
+    quote_identifier,
+    quote_literal,
+    to_interval,
+)
+
+if TYPE_CHECKING:
+    from lazy_pandas import LazyFrame
+
+__all__ = ["LazyResampler"]
+
+Origin = Literal["start_day", "start", "epoch"] | datetime | str
+
+ORIGIN_COLUMN = "__lazy_pandas_origin__"
+
+
+def origin_aggregate(on: str, rule: str | timedelta, origin: Origin) -> str | None:
+    # Aggregate computing an origin that depends on the data, joined to every row as ORIGIN_COLUMN.
+    if is_calendar_frequency(rule):
+        return None
+    if origin == "start_day":
+        return f"date_trunc('day', min({quote_identifier(on)}))"
+    if origin == "start":
+        return f"min({quote_identifier(on)})"
+    return None
+
+
+def time_bucket(
+    on: str,
+    rule: str | timedelta,
+    origin: Origin,
+    label: Literal["left", "right"],
+    closed: Literal["left", "right"],
+) -> str:
+    value = quote_identifier(on)
+    interval = to_interval(rule)
+    # Period end buckets are labeled by the last day of each week, month, quarter or year. Like in pandas,
+    # right closed ones include that whole day, so they are the calendar periods, while left closed
+    # ones start at the midnight of that day, so they are the periods starting a day later.
+    period_end = is_period_end_frequency(rule)
+    if period_end and interval.endswith(" weeks'") and interval != to_interval("W"):
+        # pandas anchors multiple week buckets on the first week with rows, not on the calendar.
+        raise LazyPandasUnsupporttedOperation(f"Resampling by multiple weeks is not supported: {rule}")
+
+    if period_end:
+        if closed == "left":
+            value = f"{value} + INTERVAL '1 day'"
+    elif closed == "right":
+        value = f"{value} - INTERVAL '1 microsecond'"
+
+    if is_calendar_frequency(rule):
+        # Calendar buckets are always aligned to the start of their calendar period, a Monday for weeks.
+        bucket = f"time_bucket({interval}, {value})"
+    else:
+        if origin == "epoch":
+            origin_sql = "TIMESTAMP '1970-01-01'"
+        elif origin in ("start_day", "start"):
+            origin_sql = quote_identifier(ORIGIN_COLUMN)
+        else:
+            origin_sql = f"CAST({quote_literal(str(origin))} AS TIMESTAMP)"
+        bucket = f"time_bucket({interval}, {value}, {origin_sql})"
+
+    if label == "right":
+        bucket = f"{bucket} + {interval}"
+    if period_end:
+        bucket = f"{bucket} - INTERVAL '1 day'"
+    return bucket
+
+
+class LazyResampler(LazyGrouppedFrame):
+    def __init__(
+        self,
+        frame: "LazyFrame",
+        on: str,
+        rule: str | timedelta,
+        fill_gaps: bool = False,
+        selection: str | list[str] | None = None,
+    ):
+        """
+        Initialize a LazyResampler, the result of `LazyFrame.resample`.
+
+        Args:
+            frame (LazyFrame): The frame whose `on` column already holds the time bucket of each row.
+            on (str): The bucketed time column.
+            rule (str | timedelta): The width of the buckets, e.g. '15min'.
+            fill_gaps (bool): Whether to add the buckets without rows to the aggregated results.
+            selection (str | list[str] | None): The column(s) to aggregate. If None, every column
+                but `on` is aggregated.
+        """
+        super().__init__(frame, on, selection)
+        self._on = on
+        self._rule = rule
+        self._fill_gaps = fill_gaps
+
+    def _aggregate(self, exprs: list[str]) -> "LazyFrame":
+        rel = super()._aggregate(exprs)._relation
+        on = quote_identifier(self._on)
+
+        if self._fill_gaps:
+            series = f"generate_series(lower_bound, upper_bound, {to_interval(self._rule)})"
+            if is_period_end_frequency(self._rule):
+                # Adding months to the last day of a month is not always the last day of another one.
+                series = (
+                    "list_transform(generate_series(lower_bound + INTERVAL '1 day', upper_bound + INTERVAL '1 day', "
+                    f"{to_interval(self._rule)}), bucket -> bucket - INTERVAL '1 day')"
+                )
+            buckets = rel.aggregate(f"min({on}) AS lower_bound, max({on}) AS upper_bound").project(
+                f"unnest({series}) AS {on}"
+            )
+            rel = buckets.set_alias("buckets").join(rel.set_alias("aggregated"), on, how="left")
+
+        return type(self._frame)(rel.sort(ColumnExpression(self._on)), self._frame._connection)
+
+    def __getitem__(self, key: str | list[str]) -> "LazyResampler":
+        return LazyResampler(self._frame, self._on, self._rule, self._fill_gaps, key)
@@ -1,16 +1,34 @@
+import itertools
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import timedelta
 from io import StringIO, TextIOBase
+from typing import TYPE_CHECKING, Literal, Union
 
 import duckdb
 import duckdb.typing
+from lazy_pandas import instrumentation, streams
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
 from lazy_pandas.frame.lazy_frame import LazyFrame
+from lazy_pandas.session import Session, get_connection
+from lazy_pandas.utils import merge_column_names, quote_identifier, to_interval
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
 
 
-def from_pandas(df) -> LazyFrame:
+@instrumentation.instrumented_reader
+def from_pandas(df, *, conn: duckdb.DuckDBPyConnection | Session | None = None) -> LazyFrame:
     """
     Converts a pandas DataFrame to a LazyFrame.
 
     Args:
         df (pd.DataFrame): The pandas DataFrame to convert.
+        conn (DuckDBPyConnection | Session | None, optional): Connection or Session to read the data with. Defaults to the default DuckDB connection.
 
     Returns:
         LazyFrame: A LazyFrame containing the data from the pandas DataFrame.
@@ -23,9 +41,206 @@ def from_pandas(df) -> LazyFrame:
     lazy_df = lp.from_pandas(df)
     ```
     """
-    return LazyFrame(duckdb.from_df(df))
+    connection = get_connection(conn)
+    return LazyFrame(connection.from_df(df), connection)
+
+
+def _scan_arrow(
+    data: Union["pa.Table", "pa.RecordBatchReader"], conn: duckdb.DuckDBPyConnection | Session | None
+) -> LazyFrame:
+    import pyarrow as pa
+
+    connection = get_connection(conn)
+    relation = connection.from_arrow(data)
+    if isinstance(data, pa.RecordBatchReader):
+        streams.register(relation, data)
+    return LazyFrame(relation, connection)
+
+
+@instrumentation.instrumented_reader
+def from_arrow(
+    data: Union["pa.Table", "pa.RecordBatch", "pa.RecordBatchReader"],
+    *,
+    conn: duckdb.DuckDBPyConnection | Session | None = None,
+) -> LazyFrame:
+    """
+    Converts Arrow data to a LazyFrame, scanning its buffers without copying them.
+
+    The data is kept alive by the LazyFrame and every frame derived from it. A RecordBatchReader is a
+    stream which is read while the first query runs, a second query scanning it raises
+    `LazyPandasStreamConsumed`; `persist()` the frame to run several queries over it.
+
+    Args:
+        data (pa.Table | pa.RecordBatch | pa.RecordBatchReader): The Arrow data to convert.
+        conn (DuckDBPyConnection | Session | None, optional): Connection or Session to read the data with. Defaults to the default DuckDB connection.
+
+    Returns:
+        LazyFrame: A LazyFrame scanning the Arrow data.
+
+    Example:
+    ```python
+    import pyarrow as pa
+    import lazy_pandas as lp
+    table = pa.table({'column1': [1, 2, 3], 'column2': ['a', 'b', 'c']})
+    lazy_df = lp.from_arrow(table)
+    ```
+    """
+    import pyarrow as pa
+
+    if isinstance(data, pa.RecordBatch):
+        data = pa.Table.from_batches([data])
+    return _scan_arrow(data, conn)
+
+
+@instrumentation.instrumented_reader
+def from_polars(df: "pl.DataFrame", *, conn: duckdb.DuckDBPyConnection | Session | None = None) -> LazyFrame:
+    """
+    Converts a Polars DataFrame to a LazyFrame, scanning its Arrow buffers without copying them.
+
+    Args:
+        df (pl.DataFrame): The Polars DataFrame to convert.
+        conn (DuckDBPyConnection | Session | None, optional): Connection or Session to read the data with. Defaults to the default DuckDB connection.
+
+    Returns:
+        LazyFrame: A LazyFrame scanning the Polars DataFrame.
+
+    Example:
+    ```python
+    import polars as pl
+    import lazy_pandas as lp
+    lazy_df = lp.from_polars(pl.DataFrame({'column1': [1, 2, 3]}))
+    ```
+    """
+    return _scan_arrow(df.to_arrow(), conn)
+
+
+@instrumentation.instrumented_reader
+def from_dict(data: dict, *, conn: duckdb.DuckDBPyConnection | Session | None = None) -> LazyFrame:
+    """
+    Converts a dict of columns to a LazyFrame.
+
+    The columns are converted to Arrow arrays, which reuse the buffers of NumPy arrays of numbers
+    instead of copying them.
+
+    Args:
+        data (dict): The columns, by name. Values can be lists, NumPy arrays, pandas Series or Arrow arrays.
+        conn (DuckDBPyConnection | Session | None, optional): Connection or Session to read the data with. Defaults to the default DuckDB connection.
+
+    Returns:
+        LazyFrame: A LazyFrame scanning the columns.
+
+    Example:
+    ```python
+    import numpy as np
+    import lazy_pandas as lp
+    lazy_df = lp.from_dict({'id': np.arange(1_000_000), 'name': ['a', 'b'] * 500_000})
+    ```
+    """
+    import pyarrow as pa
+
+    return _scan_arrow(pa.table(data), conn)
+
+
+@instrumentation.instrumented_reader
+def from_numpy(
+    array: "np.ndarray",
+    columns: list[str] | None = None,
+    *,
+    conn: duckdb.DuckDBPyConnection | Session | None = None,
+) -> LazyFrame:
+    """
+    Converts a one or two dimensional NumPy array, or a structured array, to a LazyFrame.
+
+    The columns of a Fortran-ordered (column-major) array of numbers, a one dimensional array and
+    the fields of a structured array are scanned without copying. The columns of a C-ordered array
+    are strided and are copied once.
+
+    Args:
+        array (np.ndarray): The array to convert.
+        columns (list[str] | None, optional): Names of the columns. Defaults to the field names of a
+            structured array, and to '0', '1', ... otherwise.
+        conn (DuckDBPyConnection | Session | None, optional): Connection or Session to read the data with. Defaults to the default DuckDB connection.
 
+    Returns:
+        LazyFrame: A LazyFrame scanning the array.
+
+    Raises:
+        ValueError: If the array has more than two dimensions or `columns` does not match its columns.
+
+    Example:
+    ```python
+    import numpy as np
+    import lazy_pandas as lp
+    lazy_df = lp.from_numpy(np.random.rand(1000, 3), columns=['x', 'y', 'z'])
+    ```
+    """
+    import pyarrow as pa
 
+    if array.dtype.names is not None:
+        arrays = [array[name] for name in array.dtype.names]
+        names = list(array.dtype.names)
+    elif array.ndim == 1:
+        arrays, names = [array], ["0"]
+    elif array.ndim == 2:
+        arrays = [array[:, i] for i in range(array.shape[1])]
+        names = [str(i) for i in range(array.shape[1])]
+    else:
+        raise ValueError(f"Expected a one or two dimensional array, got {array.ndim} dimensions")
+
+    if columns is not None:
+        if len(columns) != len(arrays):
+            raise ValueError(f"Expected {len(arrays)} column names, got {len(columns)}")
+        names = columns
+    return _scan_arrow(pa.table(dict(zip(names, arrays))), conn)
+
+
+@instrumentation.instrumented_reader
+def from_batches(
+    batches: Union["pa.RecordBatchReader", Iterable["pa.RecordBatch"]],
+    schema: "pa.Schema | None" = None,
+    *,
+    conn: duckdb.DuckDBPyConnection | Session | None = None,
+) -> LazyFrame:
+    """
+    Converts a stream of Arrow record batches to a LazyFrame, reading them while the query runs.
+
+    The batches are read once, by the first query over the frame or a frame derived from it; a second
+    query raises `LazyPandasStreamConsumed`. `persist()` the frame to run several queries over it.
+
+    Args:
+        batches (pa.RecordBatchReader | Iterable[pa.RecordBatch]): The batches, e.g. a generator.
+        schema (pa.Schema | None, optional): The schema of the batches, required for an iterable that
+            may be empty. Defaults to the schema of the first batch.
+        conn (DuckDBPyConnection | Session | None, optional): Connection or Session to read the data with. Defaults to the default DuckDB connection.
+
+    Returns:
+        LazyFrame: A LazyFrame scanning the stream.
+
+    Raises:
+        ValueError: If `batches` is empty and no schema is given.
+
+    Example:
+    ```python
+    import lazy_pandas as lp
+    df = lp.from_batches(fetch_batches_from_api())
+    df.groupby("user").sum().to_parquet("totals.parquet")
+    ```
+    """
+    import pyarrow as pa
+
+    if not isinstance(batches, pa.RecordBatchReader):
+        iterator = iter(batches)
+        if schema is None:
+            first = next(iterator, None)
+            if first is None:
+                raise ValueError("Cannot infer the schema of an empty stream of batches, pass schema")
+            schema, iterator = first.schema, itertools.chain([first], iterator)
+        batches = pa.RecordBatchReader.from_batches(schema, iterator)
+
+    return _scan_arrow(batches, conn)
+
+
+@instrumentation.instrumented_reader
 def read_csv(
     path_or_buffer: str | StringIO | TextIOBase,
     *,
@@ -66,6 +281,7 @@ def read_csv(
     hive_types: dict[str, str] | None = None,
     hive_types_autocast: bool | None = None,
     parse_dates: list[str] | None = None,
+    conn: duckdb.DuckDBPyConnection | Session | None = None,
 ) -> LazyFrame:
     """
     Reads a CSV file and returns a LazyFrame.
@@ -109,6 +325,7 @@ def read_csv(
         hive_types (dict[str, str] | None, optional): Dictionary specifying Hive types for columns. Defaults to None.
         hive_types_autocast (bool | None, optional): If True, automatically casts Hive types. Defaults to None.
         parse_dates (list[str] | None, optional): List of column names to parse as dates. Defaults to None.
+        conn (DuckDBPyConnection | Session | None, optional): Connection or Session to read the file with. Defaults to the default DuckDB connection.
 
     Returns:
         LazyFrame: A LazyFrame containing the data from the CSV file.
@@ -120,7 +337,8 @@ def read_csv(
     df.head()
     ```
     """
-    relation = duckdb.read_csv(
+    connection = get_connection(conn)
+    relation = connection.read_csv(
         path_or_buffer=path_or_buffer,
         header=header,
         compression=compression,
@@ -159,12 +377,13 @@ def read_csv(
         hive_types=hive_types,
         hive_types_autocast=hive_types_autocast,
     )
-    df = LazyFrame(relation)
+    df = LazyFrame(relation, connection)
     for col in parse_dates or []:
         df[col] = df[col].astype(duckdb.typing.TIMESTAMP)
     return df
 
 
+@instrumentation.instrumented_reader
 def read_json(
     path_or_buffer: str | StringIO | TextIOBase,
     *,
@@ -187,6 +406,7 @@ def read_json(
     union_by_name: bool | None = None,
     hive_types: dict[str, str] | None = None,
     hive_types_autocast: bool | None = None,
+    conn: duckdb.DuckDBPyConnection | Session | None = None,
 ) -> LazyFrame:
     """
     Reads a JSON file or buffer and returns a LazyFrame.
@@ -212,6 +432,7 @@ def read_json(
         union_by_name (bool | None): Whether the schemas of multiple JSON files should be unified by column name.
         hive_types (dict[str, str] | None): Dictionary specifying Hive types for columns.
         hive_types_autocast (bool | None): Whether to automatically cast Hive types.
+        conn (DuckDBPyConnection | Session | None): Connection or Session to read the data with. Defaults to the default DuckDB connection.
 
     Returns:
         LazyFrame: A LazyFrame containing the data from the JSON file or buffer.
@@ -223,7 +444,8 @@ def read_json(
     df.head()
     ```
     """
-    relation = duckdb.read_json(
+    connection = get_connection(conn)
+    relation = connection.read_json(
         path_or_buffer,
         columns=columns,
         sample_size=sample_size,
@@ -245,9 +467,10 @@ def read_json(
         hive_types=hive_types,
         hive_types_autocast=hive_types_autocast,
     )
-    return LazyFrame(relation)
+    return LazyFrame(relation, connection)
 
 
+@instrumentation.instrumented_reader
 def read_parquet(
     path: str,
     *,
@@ -257,6 +480,7 @@ def read_parquet(
     use_hive_partitioning: bool = False,
     union_by_name: bool = False,
     compression: str | None = None,
+    conn: duckdb.DuckDBPyConnection | Session | None = None,
 ) -> LazyFrame:
     """
     Reads a Parquet file and returns a LazyFrame.
@@ -269,6 +493,7 @@ def read_parquet(
         use_hive_partitioning (bool): If True, enables Hive partitioning.
         union_by_name (bool): If True, unions files by column name.
         compression (str | None): Compression type to use when reading the Parquet file.
+        conn (DuckDBPyConnection | Session | None): Connection or Session to read the file with. Defaults to the default DuckDB connection.
 
     Returns:
         LazyFrame: A LazyFrame containing the data from the Parquet file.
@@ -280,7 +505,8 @@ def read_parquet(
     df.head()
     ```
     """
-    relation = duckdb.read_parquet(
+    connection = get_connection(conn)
+    relation = connection.read_parquet(
         path,
         file_row_number=include_file_row_number,
         filename=include_filename,
@@ -288,18 +514,21 @@ def read_parquet(
         union_by_name=union_by_name,
         compression=compression,
     )
-    df = LazyFrame(relation)
-    if columns is None:
-        return df
-    return df[columns]
+    df = LazyFrame(relation, connection)
+    if columns is not None:
+        df = df[columns]
+    df._parquet_scan = (df._relation, path)
+    return df
 
 
-def read_delta(path: str, *, conn: duckdb.DuckDBPyConnection | None = None) -> LazyFrame:
+@instrumentation.instrumented_reader
+def read_delta(path: str, *, conn: duckdb.DuckDBPyConnection | Session | None = None) -> LazyFrame:
     """
     Reads a Delta Lake table and returns a LazyFrame.
 
     Args:
         path (str): Path to the Delta Lake table.
+        conn (DuckDBPyConnection | Session | None): Connection or Session to read the table with. Defaults to the default DuckDB connection.
 
     Returns:
         LazyFrame: A LazyFrame containing the data from the Delta Lake table.
@@ -312,19 +541,19 @@ def read_delta(path: str, *, conn: duckdb.DuckDBPyConnection | None = None) -> L
     df.head()
     ```
     """
-    if conn is None:
-        relation = duckdb.sql(f"FROM delta_scan('{path}')")
-    else:
-        relation = conn.sql(f"FROM delta_scan('{path}')")
-    return LazyFrame(relation)
+    connection = get_connection(conn)
+    relation = connection.sql(f"FROM delta_scan('{path}')")
+    return LazyFrame(relation, connection)
 
 
-def read_iceberg(path: str, *, conn: duckdb.DuckDBPyConnection | None = None) -> LazyFrame:
+@instrumentation.instrumented_reader
+def read_iceberg(path: str, *, conn: duckdb.DuckDBPyConnection | Session | None = None) -> LazyFrame:
     """
     Reads an Apache Iceberg table and returns a LazyFrame.
 
     Args:
         path (str): Path to the Apache Iceberg table.
+        conn (DuckDBPyConnection | Session | None): Connection or Session to read the table with. Defaults to the default DuckDB connection.
 
     Returns:
         LazyFrame: A LazyFrame containing the data from the Apache Iceberg table.
@@ -336,9 +565,166 @@ def read_iceberg(path: str, *, conn: duckdb.DuckDBPyConnection | None = None) ->
     df.head()
     ```
     """
-    if conn is None:
-        duckdb.sql("install iceberg; load iceberg;")
-        relation = duckdb.sql(f"FROM iceberg_scan('{path}')")
-    else:
-        relation = conn.sql(f"FROM iceberg_scan('{path}')")
-    return LazyFrame(relation)
+    connection = get_connection(conn)
+    connection.sql("install iceberg; load iceberg;")
+    relation = connection.sql(f"FROM iceberg_scan('{path}')")
+    return LazyFrame(relation, connection)
+
+
+def collect_all(frames: list[LazyFrame], *, max_workers: int | None = None) -> list["pd.DataFrame"]:
+    """
+    Collects many LazyFrames concurrently on a thread pool.
+
+    A DuckDB connection runs one query at a time, so the plan of each frame is bound to its own
+    cursor of the database it was read from, letting independent frames run in parallel without
+    sharing a connection. Frames whose plan cannot be moved to another cursor, like frames reading
+    a pandas DataFrame or a temporary table, run on their own connection one at a time.
+
+    Args:
+        frames (list[LazyFrame]): The frames to collect.
+        max_workers (int | None, optional): Maximum number of frames collected at the same time.
+            Defaults to the default of `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns:
+        list[pd.DataFrame]: The collected frames, in the order they were given.
+
+    Example:
+    ```python
+    import lazy_pandas as lp
+    df = lp.read_parquet('data.parquet')
+    totals, counts = lp.collect_all([df.groupby('city').sum(), df.groupby('city').count()], max_workers=2)
+    ```
+    """
+
+    def collect(frame: LazyFrame) -> "pd.DataFrame":
+        streams.consume(frame._relation)
+        with frame._isolated() as (relation, _, lock), lock or nullcontext():
+            return instrumentation.track("collect", relation, lambda relation: relation.to_df())
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(collect, frames))
+
+
+def merge_asof(
+    left: LazyFrame,
+    right: LazyFrame,
+    on: str | None = None,
+    *,
+    left_on: str | None = None,
+    right_on: str | None = None,
+    by: str | list[str] | None = None,
+    left_by: str | list[str] | None = None,
+    right_by: str | list[str] | None = None,
+    suffixes: tuple[str | None, str | None] = ("_x", "_y"),
+    tolerance: float | str | timedelta | None = None,
+    allow_exact_matches: bool = True,
+    direction: Literal["backward", "forward", "nearest"] = "backward",
+) -> LazyFrame:
+    """
+    Performs a point-in-time merge, matching each row of `left` with the last row of `right` whose key is
+    less than or equal to its key ('backward'), or the first one greater than or equal to it ('forward').
+
+    Compiles into a DuckDB `ASOF LEFT JOIN`, which streams and runs in parallel without collecting or
+    sorting the frames beforehand, unlike `pandas.merge_asof`. Rows are not returned in the order of
+    `left`, use `sort_values` if it matters.
+
+    Args:
+        left (LazyFrame): The left frame, every row of which is kept.
+        right (LazyFrame): The right frame, from the same connection as `left`.
+        on (str | None): The ordered column to match on, present in both frames, usually a timestamp.
+        left_on (str | None): The column of the left frame to match on.
+        right_on (str | None): The column of the right frame to match on.
+        by (str | list[str] | None): Column(s) that must be equal on both sides, e.g. a ticker.
+        left_by (str | list[str] | None): The column(s) of the left frame that must be equal to `right_by`.
+        right_by (str | list[str] | None): The column(s) of the right frame that must be equal to `left_by`.
+        suffixes (tuple[str | None, str | None]): Suffixes added to the overlapping columns of the left
+            and right frames. Defaults to ("_x", "_y").
+        tolerance (float | str | timedelta | None): Maximum distance between the matched keys, as a
+            number, a timedelta or a frequency like '2s' or '5min'. Farther matches are dropped.
+        allow_exact_matches (bool): Whether rows with equal keys match. Defaults to True.
+        direction (str): 'backward' or 'forward'. Defaults to 'backward'.
+
+    Returns:
+        LazyFrame: The columns of `left` followed by the columns of `right`, null where no row matched.
+
+    Raises:
+        LazyPandasUnsupporttedOperation: If direction is 'nearest', which DuckDB ASOF joins do not support.
+        ValueError: If the keys, `direction` or `tolerance` are invalid.
+
+    Example:
+    ```python
+    import lazy_pandas as lp
+    trades = lp.read_parquet('trades.parquet')
+    quotes = lp.read_parquet('quotes.parquet')
+    df = lp.merge_asof(trades, quotes, on="time", by="ticker", tolerance="2s")
+    ```
+    """
+    if direction == "nearest":
+        raise LazyPandasUnsupporttedOperation(
+            "merge_asof does not support direction='nearest', use 'backward' or 'forward'"
+        )
+    if direction not in ("backward", "forward"):
+        raise ValueError(f"Invalid direction: {direction!r}, expected 'backward' or 'forward'")
+
+    if on is not None:
+        if left_on is not None or right_on is not None:
+            raise ValueError("Can only pass on or left_on and right_on, not a combination of both")
+        left_on = right_on = on
+    elif left_on is None or right_on is None:
+        raise ValueError("Must pass on, or both left_on and right_on")
+
+    if by is not None:
+        if left_by is not None or right_by is not None:
+            raise ValueError("Can only pass by or left_by and right_by, not a combination of both")
+        left_by = right_by = by
+    elif (left_by is None) != (right_by is None):
+        raise ValueError("Must pass both left_by and right_by")
+    left_by = [left_by] if isinstance(left_by, str) else list(left_by or [])
+    right_by = [right_by] if isinstance(right_by, str) else list(right_by or [])
+    if len(left_by) != len(right_by):
+        raise ValueError("left_by and right_by must have the same length")
+
+    lhs, rhs = quote_identifier("lhs"), quote_identifier("rhs")
+    left_key, right_key = f"{lhs}.{quote_identifier(left_on)}", f"{rhs}.{quote_identifier(right_on)}"
+    operator = (">" if direction == "backward" else "<") + ("=" if allow_exact_matches else "")
+    conditions = [f"{lhs}.{quote_identifier(lb)} = {rhs}.{quote_identifier(rb)}" for lb, rb in zip(left_by, right_by)]
+    conditions.append(f"{left_key} {operator} {right_key}")
+
+    # DuckDB ASOF joins take a single inequality, the tolerance nulls the farther matches afterwards.
+    matched = None
+    if tolerance is not None:
+        if isinstance(tolerance, timedelta | str):
+            if isinstance(tolerance, timedelta) and tolerance < timedelta(0):
+                raise ValueError("tolerance must be positive")
+            limit = to_interval(tolerance)
+        elif isinstance(tolerance, int | float) and not isinstance(tolerance, bool):
+            if tolerance < 0:
+                raise ValueError("tolerance must be positive")
+            limit = repr(tolerance)
+        else:
+            raise ValueError(f"Invalid tolerance: {tolerance!r}")
+        distance = f"{left_key} - {right_key}" if direction == "backward" else f"{right_key} - {left_key}"
+        matched = f"{distance} <= {limit}"
+
+    # Keys with the same name on both sides are merged into a single column, like pandas does.
+    merged = {lk for lk, rk in zip([left_on, *left_by], [right_on, *right_by]) if lk == rk}
+    left_columns = left.columns
+    right_columns = [col for col in right.columns if col not in merged]
+    names = merge_column_names(left_columns, right_columns, suffixes)
+
+    exprs = [f"{lhs}.{quote_identifier(col)}" for col in left_columns]
+    for col in right_columns:
+        ref = f"{rhs}.{quote_identifier(col)}"
+        exprs.append(ref if matched is None else f"CASE WHEN {matched} THEN {ref} END")
+    projection = ", ".join(f"{expr} AS {quote_identifier(name)}" for expr, name in zip(exprs, names))
+
+    # The relation API has no ASOF join. The query refers to both relations by the names of these variables,
+    # which DuckDB's replacement scan resolves to the relations and inlines into the plan. Unlike a view,
+    # nothing is left registered on the connection.
+    _lazy_pandas_asof_left, _lazy_pandas_asof_right = left._relation, right._relation
+    connection = left._connection or duckdb.default_connection
+    relation = connection.sql(
+        f"SELECT {projection} FROM _lazy_pandas_asof_left AS {lhs} "
+        f"ASOF LEFT JOIN _lazy_pandas_asof_right AS {rhs} ON {' AND '.join(conditions)}"
+    )
+    return LazyFrame(relation, connection)
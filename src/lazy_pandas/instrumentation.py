@@ -0,0 +1,218 @@
+import functools
+import hashlib
+import logging
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import duckdb
+from duckdb import DuckDBPyRelation
+
+__all__ = ["QueryEvent", "clear_hooks", "on_query_end", "on_query_start", "remove_hook"]
+
+T = TypeVar("T")
+
+_logger = logging.getLogger(__name__)
+
+QueryHook = Callable[["QueryEvent"], None]
+
+# Hooks are replaced rather than mutated, so queries running in other threads iterate a stable list.
+_start_hooks: list[QueryHook] = []
+_end_hooks: list[QueryHook] = []
+
+_SOURCE_PATTERN = re.compile(r"\b(read_\w+|\w+_scan)\s*\(", re.IGNORECASE)
+# Memory addresses of scanned Python objects and generated names change between runs of the same plan.
+_VOLATILE_PATTERN = re.compile(r"0x[0-9a-fA-F]+|[0-9a-f]{16,}")
+
+
+@dataclass
+class QueryEvent:
+    """
+    A query run by lazy_pandas, given to the hooks registered with `on_query_start` and `on_query_end`.
+
+    Attributes:
+        operation (str): The method that ran the query, e.g. 'collect', 'to_parquet' or 'read_csv'.
+        sql (str | None): SQL of the plan, None until the relation of a reader is created.
+        fingerprint (str | None): Hash of the plan that is the same for every run of the same plan.
+        sources (list[str]): Table functions feeding the plan, e.g. 'read_csv_auto' or 'pandas_scan'.
+        started_at (float): Time the query started, in seconds since the epoch.
+        duration (float | None): Wall time of the query in seconds, set when it ends.
+        rows (int | None): Number of rows of the result, if the operation returns rows.
+        bytes (int | None): Size of the result in bytes, if the operation returns rows.
+        error (BaseException | None): The error raised by the query, if any.
+    """
+
+    operation: str
+    sql: str | None = None
+    fingerprint: str | None = None
+    sources: list[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.time)
+    duration: float | None = None
+    rows: int | None = None
+    bytes: int | None = None
+    error: BaseException | None = None
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    def _describe(self, relation: DuckDBPyRelation) -> None:
+        try:
+            self.sql = relation.sql_query()
+        except duckdb.Error:
+            # The event is still reported, only without the SQL, fingerprint and sources of the plan.
+            _logger.warning("Could not get the SQL of the %s query", self.operation, exc_info=True)
+            return
+        self.fingerprint = hashlib.sha1(_VOLATILE_PATTERN.sub("?", self.sql).encode()).hexdigest()
+        self.sources = list(dict.fromkeys(name.lower() for name in _SOURCE_PATTERN.findall(self.sql)))
+
+    def _add_result(self, result: Any) -> None:
+        if result is None:
+            return
+        rows, size = len(result), None
+        if hasattr(result, "memory_usage"):
+            size = int(result.memory_usage(index=True).sum())
+        elif hasattr(result, "nbytes"):
+            size = int(result.nbytes)
+        elif hasattr(result, "estimated_size"):
+            size = int(result.estimated_size())
+        self.rows = (self.rows or 0) + rows
+        if size is not None:
+            self.bytes = (self.bytes or 0) + size
+
+
+def on_query_start(hook: QueryHook) -> QueryHook:
+    """
+    Register a function called with the `QueryEvent` of every query before it runs.
+
+    Args:
+        hook (Callable[[QueryEvent], None]): The function to call.
+
+    Returns:
+        Callable[[QueryEvent], None]: The hook, so the function can be used as a decorator.
+
+    Example:
+    ```python
+    from lazy_pandas import instrumentation
+
+    @instrumentation.on_query_start
+    def log_start(event):
+        print("running", event.operation, event.fingerprint)
+    ```
+    """
+    global _start_hooks
+    _start_hooks = [*_start_hooks, hook]
+    return hook
+
+
+def on_query_end(hook: QueryHook) -> QueryHook:
+    """
+    Register a function called with the `QueryEvent` of every query once it ends, successfully or not.
+
+    Args:
+        hook (Callable[[QueryEvent], None]): The function to call.
+
+    Returns:
+        Callable[[QueryEvent], None]: The hook, so the function can be used as a decorator.
+
+    Example:
+    ```python
+    from lazy_pandas import instrumentation
+
+    @instrumentation.on_query_end
+    def log_end(event):
+        print(event.operation, event.sources, f"{event.duration:.3f}s", event.rows, event.bytes)
+    ```
+    """
+    global _end_hooks
+    _end_hooks = [*_end_hooks, hook]
+    return hook
+
+
+def remove_hook(hook: QueryHook) -> None:
+    """
+    Unregister a hook registered with `on_query_start` or `on_query_end`.
+
+    Args:
+        hook (Callable[[QueryEvent], None]): The hook to remove.
+    """
+    global _start_hooks, _end_hooks
+    _start_hooks = [h for h in _start_hooks if h is not hook]
+    _end_hooks = [h for h in _end_hooks if h is not hook]
+
+
+def clear_hooks() -> None:
+    """
+    Unregister every hook.
+    """
+    global _start_hooks, _end_hooks
+    _start_hooks, _end_hooks = [], []
+
+
+def start(operation: str, relation: DuckDBPyRelation | None = None) -> QueryEvent | None:
+    # Without hooks no event is created, which keeps the cost of instrumentation to this check.
+    if not _start_hooks and not _end_hooks:
+        return None
+    event = QueryEvent(operation)
+    if relation is not None:
+        event._describe(relation)
+    for hook in _start_hooks:
+        hook(event)
+    return event
+
+
+def finish(
+    event: QueryEvent | None,
+    result: Any = None,
+    *,
+    relation: DuckDBPyRelation | None = None,
+    error: BaseException | None = None,
+) -> None:
+    if event is None:
+        return
+    event.duration = time.perf_counter() - event._start
+    event.error = error
+    if relation is not None and event.sql is None:
+        event._describe(relation)
+    event._add_result(result)
+    for hook in _end_hooks:
+        hook(event)
+
+
+def add_result(event: QueryEvent | None, result: Any) -> None:
+    # Streaming operations report each batch as it is produced.
+    if event is not None:
+        event._add_result(result)
+
+
+def track(operation: str, relation: DuckDBPyRelation, func: Callable[[DuckDBPyRelation], T]) -> T:
+    event = start(operation, relation)
+    if event is None:
+        return func(relation)
+    try:
+        result = func(relation)
+    except BaseException as e:
+        finish(event, error=e)
+        raise
+    finish(event, result)
+    return result
+
+
+def instrumented_reader(reader: Callable[..., T]) -> Callable[..., T]:
+    """
+    Fire the hooks around a reader of `lazy_pandas.general`, the event describes the relation it creates.
+    """
+
+    @functools.wraps(reader)
+    def _(*args, **kwargs) -> T:
+        event = start(reader.__name__)
+        if event is None:
+            return reader(*args, **kwargs)
+        try:
+            frame = reader(*args, **kwargs)
+        except BaseException as e:
+            finish(event, error=e)
+            raise
+        finish(event, relation=frame._relation)  # type: ignore[attr-defined]
+        return frame
+
+    return _
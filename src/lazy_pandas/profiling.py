@@ -0,0 +1,140 @@
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = ["OperatorProfile", "QueryProfile"]
+
+# Operators DuckDB adds on top of the plan when profiling it through EXPLAIN ANALYZE.
+_WRAPPER_OPERATORS = ("QUERY", "EXPLAIN_ANALYZE")
+
+
+def _estimated_cardinality(extra_info: dict[str, Any]) -> int | None:
+    value = extra_info.get("Estimated Cardinality")
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class OperatorProfile:
+    """
+    Profile of one operator of a query plan, see `LazyFrame.profile`.
+
+    Attributes:
+        name (str): Type of the operator, e.g. 'HASH_GROUP_BY' or 'TABLE_SCAN'.
+        time (float): Seconds spent in the operator, excluding its children.
+        rows (int): Number of rows the operator produced.
+        rows_scanned (int): Number of rows the operator read from storage.
+        result_size (int): Size in bytes of the rows the operator produced.
+        estimated_cardinality (int | None): Number of rows the optimizer expected, if known.
+        extra_info (dict[str, Any]): Operator specific details, like its expressions or filters.
+        children (list[OperatorProfile]): The operators feeding this one.
+    """
+
+    name: str
+    time: float
+    rows: int
+    rows_scanned: int
+    result_size: int
+    estimated_cardinality: int | None
+    extra_info: dict[str, Any] = field(repr=False)
+    children: list["OperatorProfile"] = field(repr=False)
+
+    @classmethod
+    def from_dict(cls, node: dict[str, Any]) -> "OperatorProfile":
+        extra_info = node.get("extra_info") or {}
+        return cls(
+            name=node.get("operator_type") or node.get("operator_name") or node.get("name", ""),
+            time=float(node.get("operator_timing", node.get("timing", 0.0))),
+            rows=int(node.get("operator_cardinality", node.get("cardinality", 0))),
+            rows_scanned=int(node.get("operator_rows_scanned", 0)),
+            result_size=int(node.get("result_set_size", 0)),
+            estimated_cardinality=_estimated_cardinality(extra_info),
+            extra_info=extra_info,
+            children=[cls.from_dict(child) for child in node.get("children", [])],
+        )
+
+    def walk(self) -> Iterator["OperatorProfile"]:
+        """
+        Iterate over the operator and all the operators below it, depth first.
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def _format(self, depth: int) -> Iterator[str]:
+        line = f"{'  ' * depth}{self.name}: {self.rows} rows, {self.time:.4f}s, {self.result_size} bytes"
+        if self.estimated_cardinality is not None:
+            line += f" (estimated {self.estimated_cardinality} rows)"
+        yield line
+        for child in self.children:
+            yield from child._format(depth + 1)
+
+
+@dataclass
+class QueryProfile:
+    """
+    Profile of the execution of a query, the result of `LazyFrame.profile`.
+
+    Attributes:
+        latency (float): Wall time of the query in seconds.
+        cpu_time (float): Seconds of CPU time spent by all the operators.
+        rows (int): Number of rows of the result.
+        peak_memory (int | None): Peak memory of the buffers of the query in bytes, when reported
+            by the DuckDB version in use.
+        root (OperatorProfile): The last operator of the plan, which produces the result.
+        raw (dict[str, Any]): The profiling output of DuckDB the profile was built from.
+    """
+
+    latency: float
+    cpu_time: float
+    rows: int
+    peak_memory: int | None
+    root: OperatorProfile
+    raw: dict[str, Any] = field(repr=False)
+
+    @classmethod
+    def from_json(cls, text: str) -> "QueryProfile":
+        raw = json.loads(text)
+        node = raw
+        while node.get("children") and (
+            node is raw or (node.get("operator_type") or node.get("operator_name")) in _WRAPPER_OPERATORS
+        ):
+            node = node["children"][0]
+        root = OperatorProfile.from_dict(node)
+        peak_memory = raw.get("system_peak_buffer_memory")
+        return cls(
+            latency=float(raw.get("latency", 0.0)),
+            cpu_time=float(raw.get("cpu_time", 0.0)),
+            rows=root.rows,
+            peak_memory=int(peak_memory) if peak_memory is not None else None,
+            root=root,
+            raw=raw,
+        )
+
+    def operators(self) -> list[OperatorProfile]:
+        """
+        List the operators of the plan, depth first from the root.
+
+        Returns:
+            list[OperatorProfile]: The operators.
+        """
+        return list(self.root.walk())
+
+    def slowest(self, n: int = 1) -> list[OperatorProfile]:
+        """
+        List the `n` operators that took the longest.
+
+        Args:
+            n (int): Number of operators to return. Defaults to 1.
+
+        Returns:
+            list[OperatorProfile]: The slowest operators, slowest first.
+        """
+        return sorted(self.operators(), key=lambda operator: operator.time, reverse=True)[:n]
+
+    def __str__(self) -> str:
+        header = f"Query: {self.rows} rows, {self.latency:.4f}s"
+        return "\n".join([header, *self.root._format(1)])
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+from duckdb import DuckDBPyRelation
+from duckdb.typing import DuckDBPyType
+
+from lazy_pandas.utils import run_query
+
+__all__ = ["Schema"]
+
+# NumPy or pandas dtype `DuckDBPyRelation.to_df()` returns for each DuckDB type, types missing here become objects.
+_PANDAS_DTYPES = {
+    "boolean": "bool",
+    "tinyint": "int8",
+    "smallint": "int16",
+    "integer": "int32",
+    "bigint": "int64",
+    "utinyint": "uint8",
+    "usmallint": "uint16",
+    "uinteger": "uint32",
+    "ubigint": "uint64",
+    "hugeint": "float64",
+    "uhugeint": "float64",
+    "float": "float32",
+    "double": "float64",
+    "decimal": "float64",
+    "date": "datetime64[us]",
+    "timestamp": "datetime64[us]",
+    "timestamp_s": "datetime64[s]",
+    "timestamp_ms": "datetime64[ms]",
+    "timestamp_ns": "datetime64[ns]",
+    "interval": "timedelta64[ns]",
+    "enum": "category",
+}
+
+
+@dataclass(frozen=True)
+class Schema:
+    """
+    Column names and types of a LazyFrame, see `LazyFrame.schema`.
+
+    Attributes:
+        names (tuple[str, ...]): Names of the columns, in order.
+        types (tuple[DuckDBPyType, ...]): DuckDB type of each column.
+        time_zone (str | None): TimeZone setting of the connection, in which `collect()` returns
+            TIMESTAMP WITH TIME ZONE columns. None when the relation has no such column.
+    """
+
+    names: tuple[str, ...]
+    types: tuple[DuckDBPyType, ...]
+    time_zone: str | None = None
+
+    @classmethod
+    def from_relation(cls, relation: DuckDBPyRelation) -> "Schema":
+        types = tuple(relation.types)
+        time_zone = None
+        if any(type.id == "timestamp with time zone" for type in types):
+            row = run_query(relation, lambda _: "SELECT current_setting('TimeZone')").fetchone()  # type: ignore[union-attr]
+            time_zone = row[0] if row is not None else None
+        return cls(tuple(relation.columns), types, time_zone)
+
+    def _dtype(self, type: DuckDBPyType) -> str:
+        if type.id == "timestamp with time zone":
+            return f"datetime64[us, {self.time_zone or 'UTC'}]"
+        return _PANDAS_DTYPES.get(type.id, "object")
+
+    @property
+    def dtypes(self) -> list[str]:
+        """
+        The pandas dtype of each column in the result of `collect()`. Integer and boolean columns holding
+        nulls are returned as float64 and object columns instead.
+
+        Returns:
+            list[str]: The dtype name of each column, in order, e.g. 'int64', 'datetime64[us]' or 'object'.
+        """
+        return [self._dtype(type) for type in self.types]
+
+    def __len__(self) -> int:
+        return len(self.names)
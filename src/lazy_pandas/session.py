@@ -0,0 +1,241 @@
+import threading
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+from duckdb import DuckDBPyConnection
+
+from lazy_pandas.frame.lazy_frame import LazyFrame
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = ["Session", "get_connection"]
+
+_SETTINGS = ("threads", "memory_limit", "temp_directory", "preserve_insertion_order")
+
+
+class Session:
+    def __init__(
+        self,
+        database: str = ":memory:",
+        *,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+        temp_directory: str | None = None,
+        preserve_insertion_order: bool | None = None,
+        read_only: bool = False,
+        config: dict[str, Any] | None = None,
+    ):
+        """
+        Initializes a Session, which owns a DuckDB connection used by every frame read through it.
+
+        Sessions isolate workloads from each other and from the implicit default DuckDB connection,
+        each one with its own settings, temporary tables and persisted frames. Every reader accepts
+        a Session (or a `DuckDBPyConnection`) through its `conn` argument, and the readers are also
+        available as methods of the Session.
+
+        A Session can be shared by many threads: each thread gets its own cursor to the database of
+        the session, so frames created by different threads execute concurrently.
+
+        Args:
+            database (str, optional): Path of the DuckDB database file. Defaults to ":memory:".
+            threads (int | None, optional): Number of threads DuckDB may use. Defaults to None.
+            memory_limit (str | None, optional): Maximum memory of the database, e.g. '4GB'. Defaults to None.
+            temp_directory (str | None, optional): Directory where DuckDB spills data that does not fit
+                in memory. Defaults to None.
+            preserve_insertion_order (bool | None, optional): Whether results keep the order of the rows
+                they were read in. Disabling it lets DuckDB use less memory. Defaults to None.
+            read_only (bool, optional): Whether to open the database in read-only mode. Defaults to False.
+            config (dict[str, Any] | None, optional): Any other DuckDB settings. Defaults to None.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        with lp.Session(threads=4, memory_limit="2GB", temp_directory="/tmp/spill") as session:
+            df = session.read_parquet("data.parquet")
+            result = df.collect()
+        ```
+        """
+        settings = dict(config or {})
+        for name, value in zip(_SETTINGS, (threads, memory_limit, temp_directory, preserve_insertion_order)):
+            if value is not None:
+                settings[name] = value
+
+        self._connection = duckdb.connect(database, read_only=read_only, config=settings)
+        self._owner = threading.get_ident()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cursors: list[DuckDBPyConnection] = []
+
+    @property
+    def connection(self) -> DuckDBPyConnection:
+        """
+        The DuckDB connection of the session for the calling thread.
+
+        The thread that created the session uses the connection owned by the session, any other
+        thread gets a cursor to the same database, created on its first access.
+        """
+        if threading.get_ident() == self._owner:
+            return self._connection
+
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self._local.cursor = self._connection.cursor()
+            with self._lock:
+                self._cursors.append(cursor)
+        return cursor
+
+    @property
+    def settings(self) -> dict[str, str]:
+        """
+        Current value of the settings of the session, as reported by DuckDB.
+
+        Returns:
+            dict[str, str]: The value of threads, memory_limit, temp_directory and preserve_insertion_order.
+        """
+        names = ", ".join(f"'{name}'" for name in _SETTINGS)
+        rows = self.connection.sql(f"SELECT name, value FROM duckdb_settings() WHERE name IN ({names})").fetchall()
+        return dict(rows)
+
+    def sql(self, query: str) -> LazyFrame:
+        """
+        Runs a SQL query in the session and returns its result as a LazyFrame.
+
+        Args:
+            query (str): The SQL query.
+
+        Returns:
+            LazyFrame: The result of the query.
+
+        Example:
+        ```python
+        import lazy_pandas as lp
+        with lp.Session() as session:
+            df = session.sql("SELECT * FROM range(10)")
+        ```
+        """
+        connection = self.connection
+        return LazyFrame(connection.sql(query), connection)
+
+    def from_pandas(self, df) -> LazyFrame:
+        """
+        Converts a pandas DataFrame to a LazyFrame of the session, see `lazy_pandas.from_pandas`.
+        """
+        from lazy_pandas.general import from_pandas
+
+        return from_pandas(df, conn=self)
+
+    def from_arrow(self, data) -> LazyFrame:
+        """
+        Converts Arrow data to a LazyFrame of the session, see `lazy_pandas.from_arrow`.
+        """
+        from lazy_pandas.general import from_arrow
+
+        return from_arrow(data, conn=self)
+
+    def from_polars(self, df) -> LazyFrame:
+        """
+        Converts a Polars DataFrame to a LazyFrame of the session, see `lazy_pandas.from_polars`.
+        """
+        from lazy_pandas.general import from_polars
+
+        return from_polars(df, conn=self)
+
+    def from_dict(self, data) -> LazyFrame:
+        """
+        Converts a dict of columns to a LazyFrame of the session, see `lazy_pandas.from_dict`.
+        """
+        from lazy_pandas.general import from_dict
+
+        return from_dict(data, conn=self)
+
+    def from_numpy(self, array, columns=None) -> LazyFrame:
+        """
+        Converts a NumPy array to a LazyFrame of the session, see `lazy_pandas.from_numpy`.
+        """
+        from lazy_pandas.general import from_numpy
+
+        return from_numpy(array, columns, conn=self)
+
+    def from_batches(self, batches, schema=None) -> LazyFrame:
+        """
+        Converts a stream of Arrow record batches to a LazyFrame of the session, see `lazy_pandas.from_batches`.
+        """
+        from lazy_pandas.general import from_batches
+
+        return from_batches(batches, schema, conn=self)
+
+    def read_csv(self, path_or_buffer, **kwargs) -> LazyFrame:
+        """
+        Reads a CSV file in the session, see `lazy_pandas.read_csv` for the arguments.
+        """
+        from lazy_pandas.general import read_csv
+
+        return read_csv(path_or_buffer, conn=self, **kwargs)
+
+    def read_json(self, path_or_buffer, **kwargs) -> LazyFrame:
+        """
+        Reads a JSON file or buffer in the session, see `lazy_pandas.read_json` for the arguments.
+        """
+        from lazy_pandas.general import read_json
+
+        return read_json(path_or_buffer, conn=self, **kwargs)
+
+    def read_parquet(self, path: str, **kwargs) -> LazyFrame:
+        """
+        Reads a Parquet file in the session, see `lazy_pandas.read_parquet` for the arguments.
+        """
+        from lazy_pandas.general import read_parquet
+
+        return read_parquet(path, conn=self, **kwargs)
+
+    def read_delta(self, path: str) -> LazyFrame:
+        """
+        Reads a Delta Lake table in the session, see `lazy_pandas.read_delta`.
+        """
+        from lazy_pandas.general import read_delta
+
+        return read_delta(path, conn=self)
+
+    def read_iceberg(self, path: str) -> LazyFrame:
+        """
+        Reads an Apache Iceberg table in the session, see `lazy_pandas.read_iceberg`.
+        """
+        from lazy_pandas.general import read_iceberg
+
+        return read_iceberg(path, conn=self)
+
+    def close(self) -> None:
+        """
+        Closes the connection of the session and the cursors of its threads. Frames read through it
+        can no longer be executed.
+        """
+        with self._lock:
+            cursors, self._cursors = self._cursors, []
+        for cursor in cursors:
+            cursor.close()
+        self._connection.close()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def get_connection(conn: DuckDBPyConnection | Session | None = None) -> DuckDBPyConnection:
+    """
+    Resolves the `conn` argument of the readers to a DuckDB connection.
+
+    Args:
+        conn (DuckDBPyConnection | Session | None, optional): A connection, a Session, or None for
+            the default DuckDB connection. Defaults to None.
+
+    Returns:
+        DuckDBPyConnection: The connection to run queries on.
+    """
+    if conn is None:
+        return duckdb.default_connection
+    if isinstance(conn, Session):
+        return conn.connection
+    return conn
@@ -0,0 +1,48 @@
+import threading
+import weakref
+from typing import Any
+
+import duckdb
+from duckdb import DuckDBPyRelation
+
+from lazy_pandas.exceptions import LazyPandasStreamConsumed
+
+# Aliases of the relations scanning streaming sources, like Arrow record batch readers, and whether a
+# query already read them. DuckDB can only read a stream once and scanning it again silently returns no
+# rows, so plans are checked before they run instead.
+_streams_lock = threading.Lock()
+_streams: dict[str, bool] = {}
+
+
+def _unregister(alias: str) -> None:
+    with _streams_lock:
+        _streams.pop(alias, None)
+
+
+def register(relation: DuckDBPyRelation, source: Any) -> None:
+    # Relations keep the Python object they scan alive, so the stream is forgotten once no relation
+    # can scan it anymore.
+    alias = relation.alias
+    with _streams_lock:
+        _streams[alias] = False
+    weakref.finalize(source, _unregister, alias)
+
+
+def consume(relation: DuckDBPyRelation) -> None:
+    # Without streaming sources the check costs nothing more than this test.
+    if not _streams:
+        return
+    try:
+        sql = relation.sql_query()
+    except duckdb.Error:
+        return
+
+    with _streams_lock:
+        scanned = [alias for alias in _streams if alias in sql]
+        if any(_streams[alias] for alias in scanned):
+            raise LazyPandasStreamConsumed(
+                "The frame scans a streaming source that a previous query already consumed, "
+                "persist() the frame to run several queries over it"
+            )
+        for alias in scanned:
+            _streams[alias] = True
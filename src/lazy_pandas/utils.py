@@ -1,9 +1,136 @@
+import re
+import threading
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import timedelta
 from typing import Any, Callable, Union
 
-from duckdb import ColumnExpression, ConstantExpression, Expression, FunctionExpression
+from duckdb import (
+    ColumnExpression,
+    ConstantExpression,
+    DuckDBPyConnection,
+    DuckDBPyRelation,
+    Expression,
+    FunctionExpression,
+)
 
 ColumnOrExpression = Union["Expression", str]
 
+_FREQUENCY_PATTERN = re.compile(r"^\s*(\d+)?\s*([A-Za-z]+)\s*$")
+
+_FREQUENCY_UNITS = {
+    "Y": "years",
+    "YS": "years",
+    "YE": "years",
+    "A": "years",
+    "AS": "years",
+    "Q": "quarters",
+    "QS": "quarters",
+    "QE": "quarters",
+    "M": "months",
+    "ME": "months",
+    "MS": "months",
+    "W": "weeks",
+    "D": "days",
+    "d": "days",
+    "H": "hours",
+    "h": "hours",
+    "T": "minutes",
+    "min": "minutes",
+    "S": "seconds",
+    "s": "seconds",
+    "L": "milliseconds",
+    "ms": "milliseconds",
+    "U": "microseconds",
+    "us": "microseconds",
+}
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def is_calendar_frequency(freq: str | timedelta) -> bool:
+    if isinstance(freq, timedelta):
+        return False
+    match = _FREQUENCY_PATTERN.match(freq)
+    return match is not None and _FREQUENCY_UNITS.get(match.group(2)) in ("years", "quarters", "months", "weeks")
+
+
+def is_period_end_frequency(freq: str | timedelta) -> bool:
+    # Week, month, quarter and year end rules, whose pandas buckets end on the last day of each period.
+    # Weeks end on Sunday, like the 'W-SUN' rule 'W' stands for in pandas.
+    if isinstance(freq, timedelta):
+        return False
+    match = _FREQUENCY_PATTERN.match(freq)
+    return match is not None and match.group(2) in ("Y", "YE", "A", "Q", "QE", "M", "ME", "W")
+
+
+def to_interval(freq: str | timedelta) -> str:
+    if isinstance(freq, timedelta):
+        return f"INTERVAL '{freq // timedelta(microseconds=1)} microseconds'"
+
+    match = _FREQUENCY_PATTERN.match(freq)
+    if match is None or match.group(2) not in _FREQUENCY_UNITS:
+        raise ValueError(f"Invalid frequency: {freq}")
+    return f"INTERVAL '{match.group(1) or 1} {_FREQUENCY_UNITS[match.group(2)]}'"
+
+
+def merge_column_names(
+    left_columns: list[str], right_columns: list[str], suffixes: tuple[str | None, str | None]
+) -> list[str]:
+    # Names of the left then right columns of a merge, with the suffixes added to the overlapping ones.
+    overlap = set(left_columns) & set(right_columns)
+    left_suffix, right_suffix = suffixes
+    if overlap and left_suffix is None and right_suffix is None:
+        raise ValueError(f"Columns overlap but no suffix specified: {sorted(overlap)}")
+
+    names = [col + left_suffix if col in overlap and left_suffix else col for col in left_columns]
+    names += [col + right_suffix if col in overlap and right_suffix else col for col in right_columns]
+    if len(set(names)) != len(names):
+        raise ValueError(f"The merge would produce duplicated columns: {names}")
+    return names
+
+
+def run_query(relation: DuckDBPyRelation, query: Callable[[str], str]) -> DuckDBPyRelation | None:
+    # DuckDBPyRelation does not expose its connection, `DuckDBPyRelation.query` is the only way to run
+    # a statement on it. The relation is exposed as a uniquely named view which is dropped right after,
+    # so the returned relation must not reference it.
+    view_name = f"tmp_view_{uuid.uuid1().hex}"
+    try:
+        return relation.query(view_name, query(view_name))
+    finally:
+        relation.query(view_name, f"DROP VIEW {view_name}")
+
+
+@contextmanager
+def temporary_settings(relation: DuckDBPyRelation, **settings: str) -> Iterator[None]:
+    # Settings belong to the connection, they are reset once the block ends so later queries of the
+    # connection are not affected.
+    for name, value in settings.items():
+        run_query(relation, lambda _, name=name, value=value: f"SET {name} = {quote_literal(value)}")
+    try:
+        yield
+    finally:
+        for name in settings:
+            run_query(relation, lambda _, name=name: f"RESET {name}")
+
+
+_connection_locks_lock = threading.Lock()
+_connection_locks: dict[int, threading.Lock] = {}
+
+
+def connection_lock(connection: DuckDBPyConnection | None) -> threading.Lock:
+    # A DuckDB connection executes one query at a time and fails when used by several threads at once,
+    # queries that cannot run on a cursor of their own hold the lock of their connection instead.
+    with _connection_locks_lock:
+        return _connection_locks.setdefault(id(connection), threading.Lock())
+
 
 def to_column_expr(col: ColumnOrExpression) -> Expression:
     if isinstance(col, Expression):
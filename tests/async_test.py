@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+
+import lazy_pandas as lp
+from lazy_pandas.utils import connection_lock
+
+SLOW_QUERY = "SELECT sum(a.range * b.range) AS total FROM range(1000000) a, range(1000000) b"
+
+
+def test_collect_async():
+    async def main():
+        with lp.Session() as session:
+            frames = [session.sql(f"SELECT range AS a FROM range({n})") for n in range(10)]
+            return await asyncio.gather(*(frame.collect_async() for frame in frames))
+
+    results = asyncio.run(main())
+    assert [len(result) for result in results] == list(range(10))
+
+
+def test_collect_async_pandas_frame():
+    async def main():
+        df = lp.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+        return await asyncio.gather(df.collect_async(), df[df["a"] > 1].collect_async())
+
+    first, second = asyncio.run(main())
+    assert first["a"].tolist() == [1, 2, 3]
+    assert second["a"].tolist() == [2, 3]
+
+
+def test_to_arrow_async():
+    async def main():
+        with lp.Session() as session:
+            return await session.sql("SELECT range AS a FROM range(5000)").to_arrow_async(batch_size=1000)
+
+    table = asyncio.run(main())
+    assert table.num_rows == 5000
+    assert max(batch.num_rows for batch in table.to_batches()) <= 1000
+
+
+def test_aiter_batches():
+    async def main():
+        with lp.Session() as session:
+            df = session.sql("SELECT range AS a FROM range(10000)")
+            return [batch async for batch in df.aiter_batches(2048, format="pandas")]
+
+    batches = asyncio.run(main())
+    assert all(len(batch) <= 2048 for batch in batches)
+    assert pd.concat(batches)["a"].sort_values().tolist() == list(range(10000))
+
+
+def test_aiter_batches_pandas_frame_holds_connection():
+    df = lp.from_pandas(pd.DataFrame({"a": range(10000)}))
+    lock = connection_lock(df._connection)
+
+    async def main():
+        held = []
+        async for batch in df.aiter_batches(2048, format="pandas"):
+            held.append(lock.locked())
+            await asyncio.sleep(0.01)
+        return held
+
+    async def read():
+        # The collect waits on a worker thread until the reader is closed.
+        return await asyncio.gather(main(), df[df["a"] >= 0].collect_async())
+
+    held, collected = asyncio.run(read())
+    assert all(held)
+    assert len(collected) == 10000
+    assert not lock.locked()
+
+
+def test_aiter_batches_invalid_format():
+    with pytest.raises(ValueError):
+        lp.from_pandas(pd.DataFrame({"a": [1]})).aiter_batches(format="csv")  # type: ignore
+
+
+def test_collect_async_cancellation():
+    async def main():
+        with lp.Session() as session:
+            task = asyncio.create_task(session.sql(SLOW_QUERY).collect_async())
+            await asyncio.sleep(0.5)
+            start = time.monotonic()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return time.monotonic() - start
+
+    assert asyncio.run(main()) < 5
@@ -0,0 +1,64 @@
+import os
+
+import duckdb
+import pandas as pd
+import pytest
+
+import lazy_pandas as lp
+
+
+@pytest.fixture
+def source():
+    data = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    return lp.from_pandas(data)
+
+
+@pytest.mark.parametrize("storage", ["memory", "disk"])
+def test_persist(source, storage):
+    df = source.persist(storage)
+    try:
+        assert df.columns == ["a", "b"]
+        assert df.collect()["a"].tolist() == [1, 2, 3]
+        assert df[df["a"] > 1].collect()["b"].tolist() == ["y", "z"]
+        assert df._persisted in lp.persisted_relations()
+    finally:
+        df.unpersist()
+
+    assert df._persisted not in lp.persisted_relations()
+    with pytest.raises(duckdb.Error):
+        df.collect()
+
+
+def test_persist_disk_file_removed(source):
+    df = source.persist("disk")
+    path = df._persisted.path
+    assert os.path.exists(path)
+    df.unpersist()
+    assert not os.path.exists(path)
+
+
+def test_persist_executes_once():
+    con = duckdb.connect()
+    con.execute("CREATE TABLE t AS SELECT range AS a FROM range(3)")
+    df = lp.LazyFrame(con.sql("FROM t")).cache()
+    con.execute("INSERT INTO t VALUES (100)")
+    assert df.collect()["a"].tolist() == [0, 1, 2]
+    df.unpersist()
+
+
+def test_cache_invalid_storage(source):
+    with pytest.raises(ValueError):
+        source.persist("gpu")
+
+
+def test_unpersist_all(source):
+    first = source.cache()
+    second = source.persist("disk")
+    lp.unpersist_all()
+    assert first._persisted not in lp.persisted_relations()
+    assert second._persisted not in lp.persisted_relations()
+
+
+def test_unpersist_not_persisted(source):
+    source.unpersist()
+    assert source.collect().shape == (3, 2)
@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+
+import duckdb
+import pandas as pd
+import pytest
+
+import lazy_pandas as lp
+from lazy_pandas.exceptions import (
+    LazyPandasQueryCancelled,
+    LazyPandasQueryTimeout,
+    LazyPandasUnsupporttedOperation,
+)
+
+SLOW_QUERY = "SELECT sum(a.range * b.range) AS total FROM range(1000000) a, range(1000000) b"
+
+
+def test_collect_timeout():
+    with lp.Session() as session:
+        start = time.monotonic()
+        with pytest.raises(LazyPandasQueryTimeout):
+            session.sql(SLOW_QUERY).collect(timeout=0.5)
+        assert time.monotonic() - start < 5
+
+        assert session.sql("SELECT 42 AS a").collect(timeout=10)["a"].tolist() == [42]
+
+
+def test_timeout_on_non_default_connection():
+    connection = duckdb.connect()
+    df = lp.LazyFrame(connection.sql(SLOW_QUERY), connection)
+    start = time.monotonic()
+    with pytest.raises(LazyPandasQueryTimeout):
+        df.collect(timeout=0.5)
+    assert time.monotonic() - start < 5
+
+    # Without its connection the frame cannot be interrupted, rather than interrupting another connection.
+    with pytest.raises(LazyPandasUnsupporttedOperation):
+        lp.LazyFrame(connection.sql(SLOW_QUERY)).collect(timeout=0.5)
+    with pytest.raises(LazyPandasUnsupporttedOperation):
+        lp.LazyFrame(connection.sql(SLOW_QUERY)).collect(cancellation_token=lp.CancellationToken())
+    assert lp.LazyFrame(connection.sql("SELECT 1 AS a")).collect()["a"].tolist() == [1]
+
+
+def test_collect_timeout_is_a_timeout_error():
+    with lp.Session() as session, pytest.raises(TimeoutError):
+        session.sql(SLOW_QUERY).to_arrow(timeout=0.5)
+
+
+def test_cancellation_token():
+    token = lp.CancellationToken()
+    with lp.Session() as session:
+        threading.Timer(0.5, token.cancel).start()
+        with pytest.raises(LazyPandasQueryCancelled):
+            session.sql(SLOW_QUERY).collect(cancellation_token=token)
+        assert token.cancelled
+
+        with pytest.raises(LazyPandasQueryCancelled):
+            session.sql("SELECT 1").collect(cancellation_token=token)
+
+
+def test_cancellation_token_unused():
+    token = lp.CancellationToken()
+    with lp.Session() as session:
+        assert session.sql("SELECT 1 AS a").collect(cancellation_token=token)["a"].tolist() == [1]
+    token.cancel()
+
+
+def test_iter_batches_timeout():
+    with lp.Session() as session:
+        df = session.sql("SELECT range AS a FROM range(100000)")
+        with pytest.raises(LazyPandasQueryTimeout):
+            for _ in df.iter_batches(2048, timeout=0.5):
+                time.sleep(0.1)
+
+
+def test_writer_timeout(tmp_path):
+    with lp.Session() as session, pytest.raises(LazyPandasQueryTimeout):
+        session.sql(SLOW_QUERY).to_parquet(os.path.join(tmp_path, "out.parquet"), timeout=0.5)
+
+
+def test_invalid_timeout():
+    with pytest.raises(ValueError):
+        lp.from_pandas(pd.DataFrame({"a": [1]})).collect(timeout=0)
@@ -1,6 +1,10 @@
 import duckdb
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import pytest
 from lazy_pandas import LazyFrame
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
 
 
 @pytest.fixture
@@ -52,3 +56,80 @@ def test_cast_column(df):
     assert df.collect()["a"].tolist() == [1, 3]
     df["a"] = df["a"].astype(float)
     assert df.collect()["a"].tolist() == [1.0, 3.0]
+
+
+def test_isin(df):
+    assert df[df["a"].isin(1, 2)].collect()["b"].tolist() == [2]
+    assert df[df["a"].isin([3, 4])].collect()["b"].tolist() == [4]
+    assert df[df["a"].isin(np.array([3]))].collect()["b"].tolist() == [4]
+
+
+@pytest.mark.parametrize(
+    "make_values",
+    [list, set, np.array, pd.Series, pa.array, lambda keys: pa.chunked_array([keys])],
+)
+def test_isin_semi_join(make_values):
+    pdf = pd.DataFrame({"id": range(10000), "v": [i % 7 for i in range(10000)]})
+    df = LazyFrame(duckdb.from_df(pdf), duckdb.default_connection)
+    keys = list(range(0, 20000, 3))
+    values = make_values(keys)
+
+    result = df[df["id"].isin(values)]
+    assert "SEMI" in result.explain()
+    assert result.sort_values("id").collect()["id"].tolist() == pdf[pdf["id"].isin(keys)]["id"].tolist()
+
+    result = df[~df["id"].isin(values)]
+    assert "ANTI" in result.explain()
+    assert result.sort_values("id").collect()["id"].tolist() == pdf[~pdf["id"].isin(keys)]["id"].tolist()
+
+    result = df[df["id"].isin(values) & (df["v"] > 2)].sort_values("id").collect()
+    assert result["id"].tolist() == pdf[pdf["id"].isin(keys) & (pdf["v"] > 2)]["id"].tolist()
+
+
+def test_isin_unknown_connection():
+    connection = duckdb.connect()
+    df = LazyFrame(connection.sql("SELECT i AS id FROM range(5000) t(i)"))
+    keys = list(range(0, 4000, 2))
+
+    result = df[df["id"].isin(keys)]
+    assert "SEMI" not in result.explain()
+    assert len(result.collect()) == 2000
+    assert len(df[~df["id"].isin(keys)].collect()) == 3000
+
+
+def test_isin_other_frame_column(df):
+    other = LazyFrame(duckdb.sql("SELECT 3 AS key UNION ALL SELECT 3 UNION ALL SELECT 5"))
+
+    assert df[df["a"].isin(other["key"])].collect()["b"].tolist() == [4]
+    assert df[~df["a"].isin(other["key"])].collect()["b"].tolist() == [2]
+    with pytest.raises(LazyPandasUnsupporttedOperation):
+        df[df["a"].isin(other["key"]) & (df["b"] > 0)]
+
+
+def test_isin_same_frame_column():
+    pdf = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 4, 6, 8]})
+    df = LazyFrame(duckdb.from_df(pdf))
+
+    assert df[df["a"].isin(df["b"])].collect()["a"].tolist() == [2, 4]
+    assert df[~df["a"].isin(df["b"] - 1)].sort_values("a").collect()["a"].tolist() == [2, 4]
+
+
+def test_isin_derived_column():
+    df = LazyFrame(duckdb.sql("SELECT 1 AS a UNION ALL SELECT 3"))
+    other = LazyFrame(duckdb.sql("SELECT 3 AS id UNION ALL SELECT 5"))
+
+    assert df[df["a"].isin(other["id"] * 1)].collect()["a"].tolist() == [3]
+    with pytest.raises(LazyPandasUnsupporttedOperation):
+        df["a"].isin(other["id"] + df["a"])
+
+
+@pytest.mark.parametrize("size", [10, 5000])
+def test_isin_nulls(size):
+    pdf = pd.DataFrame({"id": [1.0, None, 3.0, None, 5.0]})
+    df = LazyFrame(duckdb.from_df(pdf), duckdb.default_connection)
+    keys = [3.0, None, *range(10, 10 + size)]
+
+    expected = pdf[pdf["id"].isin(keys)]["id"].tolist()
+    assert df[df["id"].isin(keys)].collect()["id"].tolist() == expected
+    expected = pdf[~pdf["id"].isin(keys)]["id"].isna().sum()
+    assert df[~df["id"].isin(keys)].collect()["id"].isna().sum() == expected == 2
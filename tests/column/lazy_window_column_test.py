@@ -0,0 +1,169 @@
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from lazy_pandas import LazyFrame
+
+
+@pytest.fixture
+def df():
+    rel = duckdb.sql("SELECT * FROM (VALUES (1, 2), (2, 1), (3, NULL), (4, 5), (5, 1)) AS t(pos, x)")
+    return LazyFrame(rel)
+
+
+def collect(df):
+    return df.sort_values("pos").collect()
+
+
+def test_cumsum(df):
+    df["c"] = df["x"].cumsum()
+    assert collect(df)["c"].fillna(-1).tolist() == [2, 3, -1, 8, 9]
+
+
+def test_cummax(df):
+    df["c"] = df["x"].cummax()
+    assert collect(df)["c"].fillna(-1).tolist() == [2, 2, -1, 5, 5]
+
+
+def test_cummin(df):
+    df["c"] = df["x"].cummin()
+    assert collect(df)["c"].fillna(-1).tolist() == [2, 1, -1, 1, 1]
+
+
+def test_cumsum_follows_sort_order(df):
+    df = df.sort_values("x")
+    df["c"] = df["pos"].cumsum()
+    result = df.collect()
+    assert result["c"].tolist() == [2, 7, 8, 12, 15]
+
+
+def test_shift(df):
+    df["prev"] = df["x"].shift()
+    df["next"] = df["x"].shift(-1)
+    result = collect(df)
+    assert result["prev"].fillna(-1).tolist() == [-1, 2, 1, -1, 5]
+    assert result["next"].fillna(-1).tolist() == [1, -1, 5, 1, -1]
+
+
+def test_diff(df):
+    df["c"] = df["pos"].diff()
+    assert collect(df)["c"].fillna(-1).tolist() == [-1, 1, 1, 1, 1]
+
+
+def test_pct_change(df):
+    df["c"] = df["x"].pct_change()
+    assert collect(df)["c"].fillna(-1).tolist() == [-1, -0.5, -1, -1, -0.8]
+
+
+@pytest.mark.parametrize(
+    "method, ascending, expected",
+    [
+        ("average", True, [3.0, 1.5, -1, 4.0, 1.5]),
+        ("min", True, [3.0, 1.0, -1, 4.0, 1.0]),
+        ("max", True, [3.0, 2.0, -1, 4.0, 2.0]),
+        ("first", True, [3.0, 1.0, -1, 4.0, 2.0]),
+        ("dense", True, [2.0, 1.0, -1, 3.0, 1.0]),
+        ("min", False, [2.0, 3.0, -1, 1.0, 3.0]),
+    ],
+)
+def test_rank(df, method, ascending, expected):
+    df["r"] = df["x"].rank(method=method, ascending=ascending)
+    assert collect(df)["r"].fillna(-1).tolist() == expected
+
+
+def test_window_expression_argument(df):
+    df["c"] = (df["pos"] * 10).cumsum()
+    assert collect(df)["c"].tolist() == [10, 30, 60, 100, 150]
+
+
+@pytest.fixture
+def daily():
+    rel = duckdb.sql(
+        """
+        SELECT * FROM (
+            VALUES
+                (TIMESTAMP '2024-01-01', 'a', 1),
+                (TIMESTAMP '2024-01-02', 'a', 2),
+                (TIMESTAMP '2024-01-03', 'a', 3),
+                (TIMESTAMP '2024-01-06', 'a', 4),
+                (TIMESTAMP '2024-01-01', 'b', 10),
+                (TIMESTAMP '2024-01-04', 'b', 20)
+        ) AS t(day, store, sales)
+        """
+    )
+    return LazyFrame(rel)
+
+
+def test_rolling_rows(df):
+    df["c"] = df["pos"].rolling(2).sum()
+    assert collect(df)["c"].fillna(-1).tolist() == [-1, 3, 5, 7, 9]
+
+
+def test_rolling_min_periods(df):
+    df["c"] = df["x"].rolling(2, min_periods=1).mean()
+    assert collect(df)["c"].tolist() == [2.0, 1.5, 1.0, 5.0, 3.0]
+
+
+@pytest.mark.parametrize(
+    "closed, expected",
+    [("right", [1, 3, 5]), ("both", [1, 3, 6]), ("left", [0, 1, 3]), ("neither", [0, 1, 2])],
+)
+def test_rolling_rows_closed(df, closed, expected):
+    df = df[df["pos"] <= 3]
+    df["c"] = df["pos"].rolling(2, min_periods=0, closed=closed).sum()
+    assert collect(df)["c"].fillna(0).tolist() == expected
+
+
+def test_rolling_time(daily):
+    daily = daily[daily["store"] == "a"]
+    daily["c"] = daily["sales"].rolling("2D", on="day").sum()
+    assert daily.sort_values("day").collect()["c"].tolist() == [1, 3, 5, 4]
+
+
+@pytest.mark.parametrize("closed", ["right", "both", "left", "neither"])
+@pytest.mark.parametrize("func", ["sum", "count", "mean"])
+def test_rolling_time_duplicate_timestamps(closed, func):
+    pdf = pd.DataFrame(
+        {
+            "day": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-03", "2024-01-04"]),
+            "sales": [1, 2, np.nan, 8, 16],
+        }
+    )
+    df = LazyFrame(duckdb.from_df(pdf))
+    df["c"] = df["sales"].rolling("2D", on="day", closed=closed).agg(func)
+
+    expected = pdf.rolling("2D", on="day", closed=closed)["sales"].agg(func)
+    pd.testing.assert_series_equal(df.collect()["c"], expected, check_dtype=False, check_names=False)
+
+
+@pytest.mark.parametrize("min_periods", [None, 0, 2])
+def test_rolling_count_min_periods(min_periods):
+    pdf = pd.DataFrame({"x": [1, np.nan, 3, 4, np.nan, np.nan, np.nan]})
+    df = LazyFrame(duckdb.from_df(pdf))
+    df["c"] = df["x"].rolling(3, min_periods=min_periods).count()
+
+    expected = pdf["x"].rolling(3, min_periods=min_periods).count()
+    pd.testing.assert_series_equal(df.collect()["c"], expected, check_dtype=False, check_names=False)
+
+
+def test_rolling_time_requires_on(daily):
+    with pytest.raises(ValueError):
+        daily["sales"].rolling("2D")
+
+
+def test_expanding(df):
+    df["c"] = df["x"].expanding().max()
+    assert collect(df)["c"].tolist() == [2, 2, 2, 5, 5]
+
+
+def test_groupby_rolling(daily):
+    daily["c"] = daily.groupby("store")["sales"].rolling("3D", on="day").sum()
+    result = daily.sort_values(["store", "day"]).collect()
+    assert result["c"].tolist() == [1, 3, 6, 4, 10, 20]
+
+
+def test_groupby_expanding(daily):
+    result = daily.groupby("store")[["sales"]].expanding().sum()
+    assert result.columns == ["day", "store", "sales"]
+    assert result.sort_values(["store", "day"]).collect()["sales"].tolist() == [1, 3, 6, 10, 10, 30]
@@ -1,7 +1,11 @@
+import os
+
 import duckdb
 import lazy_pandas as lp
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 
 def test_list_columns():
@@ -21,6 +25,132 @@ def test_collect():
     assert df.columns.tolist() == ["a", "b"]
 
 
+def test_collect_dtype_backend():
+    rel = duckdb.sql("SELECT * FROM (VALUES (1, 'x', 1.5::DOUBLE, true), (NULL, NULL, NULL, NULL)) t(a, b, c, d)")
+    df = lp.LazyFrame(rel)
+
+    result = df.collect(dtype_backend="pyarrow")
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+    assert result["b"].dtype == pd.ArrowDtype(pa.string())
+    assert result["a"].isna().tolist() == [False, True]
+
+    result = df.collect(dtype_backend="numpy_nullable")
+    assert result.dtypes.tolist() == [pd.Int32Dtype(), pd.StringDtype("pyarrow"), pd.Float64Dtype(), pd.BooleanDtype()]
+    assert result["a"].tolist() == [1, pd.NA]
+
+    result = df.to_pandas()
+    assert result["b"].dtype == object
+
+    with pytest.raises(ValueError):
+        df.collect(dtype_backend="arrow")
+
+
+@pytest.mark.parametrize("dtype_backend", ["numpy", "numpy_nullable", "pyarrow"])
+def test_collect_categorical(dtype_backend):
+    rel = duckdb.sql(
+        "SELECT ['x', 'y'][i % 2 + 1] AS a, i AS b, CAST(['p', 'q'][i % 2 + 1] AS ENUM('p', 'q')) AS c "
+        "FROM range(4) t(i)"
+    )
+    df = lp.LazyFrame(rel)
+
+    result = df.collect(dtype_backend=dtype_backend, categorical=["a"])
+    assert isinstance(result["a"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["c"].dtype, pd.CategoricalDtype)
+    assert result["a"].tolist() == ["x", "y", "x", "y"]
+    assert sorted(result["a"].cat.categories) == ["x", "y"]
+    assert result["c"].tolist() == ["p", "q", "p", "q"]
+
+    with pytest.raises(ValueError):
+        df.collect(dtype_backend=dtype_backend, categorical=["missing"])
+
+
+def test_collect_categorical_keeps_dtypes():
+    rel = duckdb.sql(
+        "SELECT * FROM (VALUES "
+        "('x', 1.5::DECIMAL(4, 2), 1::HUGEINT, DATE '2024-01-02', TIMESTAMPTZ '2024-01-02 03:04:05', "
+        "INTERVAL '1 month 2 hours', 'a', 1), "
+        "('y', NULL, NULL, NULL, NULL, NULL, NULL, NULL)"
+        ") t(a, b, c, d, e, f, g, h)"
+    )
+    df = lp.LazyFrame(rel)
+
+    expected = df.collect()
+    result = df.collect(categorical=["a"])
+    assert isinstance(result["a"].dtype, pd.CategoricalDtype)
+    assert result.dtypes.drop("a").to_dict() == expected.dtypes.drop("a").to_dict()
+    pd.testing.assert_frame_equal(result.drop(columns="a"), expected.drop(columns="a"))
+
+    result = df.collect(dtype_backend="numpy_nullable")
+    assert result["b"].dtype == pd.Float64Dtype()
+    assert result["d"].dtype == expected["d"].dtype
+    assert result["f"].tolist()[0] == expected["f"][0]
+    assert result["g"].dtype == pd.StringDtype("pyarrow")
+
+
+def test_to_numpy():
+    df = lp.from_pandas(pd.DataFrame({"a": [1, 2, 3], "b": [1.5, None, 2.5], "c": [4.0, 5.0, 6.0]}))
+
+    result = df.to_numpy(["a", "c"])
+    assert type(result) is np.ndarray
+    assert result.tolist() == [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]
+    assert df.to_numpy("a", dtype="int32").tolist() == [[1], [2], [3]]
+
+    result = df.to_numpy()
+    assert isinstance(result, np.ma.MaskedArray)
+    assert result.shape == (3, 3)
+    assert result.mask[:, 1].tolist() == [False, True, False]
+
+
+def test_column_values():
+    df = lp.from_pandas(pd.DataFrame({"a": [1, 2, 3], "b": [1.5, None, 2.5]}))
+
+    result = df.column_values("a")
+    assert type(result) is np.ndarray
+    assert result.tolist() == [1, 2, 3]
+    assert df.column_values(df["a"] * 2).tolist() == [2, 4, 6]
+    assert df.column_values(df["a"].cumsum()).tolist() == [1, 3, 6]
+    assert df.column_values("b").mask.tolist() == [False, True, False]
+
+    result = df.column_values(df["a"] + 1, format="arrow")
+    assert isinstance(result, pa.ChunkedArray)
+    assert result.to_pylist() == [2, 3, 4]
+
+    with pytest.raises(ValueError):
+        df.column_values("a", format="pandas")
+
+
+def test_schema_and_shape():
+    rel = duckdb.sql("SELECT i AS a, i::VARCHAR AS b, i::DOUBLE AS c, TIMESTAMP '2024-01-01' AS d FROM range(5) t(i)")
+    df = lp.LazyFrame(rel)
+
+    assert df.schema is df.schema
+    assert df.schema.names == ("a", "b", "c", "d")
+    assert [str(type) for type in df.schema.types] == ["BIGINT", "VARCHAR", "DOUBLE", "TIMESTAMP"]
+    assert df.dtypes.to_dict() == df.collect().dtypes.to_dict()
+    assert df.shape == (5, 4)
+    assert len(df) == 5
+    assert df._row_count == (df._relation, 5)
+
+    df["e"] = df["a"] * 2
+    assert df.columns == ["a", "b", "c", "d", "e"]
+    assert df.shape == (5, 5)
+    assert len(df[df["a"] > 2]) == 2
+    assert df.copy().schema is df.schema
+
+    with pytest.raises(ValueError):
+        bool(df)
+
+
+def test_dtypes():
+    connection = duckdb.connect()
+    connection.sql("SET TimeZone = 'America/Sao_Paulo'")
+    df = lp.LazyFrame(connection.sql("SELECT 1 AS a, 'x' AS a, TIMESTAMPTZ '2024-01-01 00:00:00' AS b"))
+
+    assert df.dtypes.tolist() == df.collect().dtypes.tolist()
+    assert df.dtypes.index.tolist() == ["a", "a", "b"]
+    assert str(df.dtypes.iloc[2]) == "datetime64[us, America/Sao_Paulo]"
+
+
 def test_new_column():
     rel = duckdb.sql("SELECT 1 AS a, 2 AS b")
     df = lp.LazyFrame(rel)
@@ -41,6 +171,50 @@ def test_overwrite_column():
     assert df["a"].tolist() == [3]
 
 
+def test_column_assignments_share_one_projection():
+    rel = duckdb.sql("SELECT 1 AS a, 2 AS b")
+    df = lp.LazyFrame(rel)
+    for i in range(100):
+        df[f"c{i}"] = df["a"] + i
+    df["a"] = df["b"] * 2
+
+    assert df._relation.sql_query().count("SELECT") == 2
+    result = df.collect()
+    assert result.columns.tolist() == ["a", "b", *(f"c{i}" for i in range(100))]
+    assert result["a"].tolist() == [4]
+    assert result["c99"].tolist() == [100]
+
+    df["d"] = df["c1"] + 1
+    assert df.collect()["d"].tolist() == [3]
+
+
+def test_assign():
+    df = lp.from_pandas(pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+    result = df.assign(c=df["a"] + df["b"], d=lambda d: d["c"] * 2, a=0)
+
+    assert df.columns == ["a", "b"]
+    assert result.collect().to_dict("list") == {"a": [0, 0], "b": [3, 4], "c": [4, 6], "d": [8, 12]}
+
+
+def test_astype():
+    df = lp.LazyFrame(duckdb.sql("SELECT '1' AS a, '2.5' AS b, 'x' AS c"))
+
+    result = df.astype({"a": "INTEGER", "b": "DOUBLE"}).collect()
+    assert result.to_dict("list") == {"a": [1], "b": [2.5], "c": ["x"]}
+    assert df.collect()["a"].tolist() == ["1"]
+
+    assert df.astype("VARCHAR")._relation.sql_query().count("SELECT") == 2
+
+
+def test_assign_projects_values_once():
+    df = lp.LazyFrame(duckdb.sql("SELECT " + ", ".join(f"{i} AS c{i}" for i in range(300))))
+    result = df.assign(c0=df["c1"], c1=df["c0"], **{f"c{i}": df[f"c{i}"] + 1 for i in range(2, 300)})
+
+    assert result._assignments is not None and result._assignments[0] is df._relation
+    assert result._relation.sql_query().count("SELECT") == 2
+    assert result.collect().iloc[0, :4].tolist() == [1, 0, 3, 4]
+
+
 def test_select_columns():
     rel = duckdb.sql("SELECT 1 AS a, 2 AS b")
     df = lp.LazyFrame(rel)
@@ -69,6 +243,74 @@ def test_sort_values():
     assert df["b"].tolist() == [2, 4]
 
 
+@pytest.mark.parametrize("na_position", ["first", "last"])
+@pytest.mark.parametrize("ascending", [True, False, [True, False], [False, True]])
+def test_sort_values_order(ascending, na_position):
+    pdf = pd.DataFrame(
+        {
+            "a": [2.0, None, 1.0, 2.0, None, 1.0, 3.0],
+            "b": [1.0, 2.0, None, 3.0, 1.0, 5.0, 2.0],
+            "c": range(7),
+        }
+    )
+    df = lp.from_pandas(pdf)
+
+    result = df.sort_values(["a", "b"], ascending=ascending, na_position=na_position).collect()
+    expected = pdf.sort_values(["a", "b"], ascending=ascending, na_position=na_position).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_sort_values_stable():
+    pdf = pd.DataFrame({"key": [i % 7 for i in range(10000)], "pos": range(10000)})
+    df = lp.from_pandas(pdf)
+
+    result = df.sort_values("key", kind="stable").collect()
+    expected = pdf.sort_values("key", kind="stable").reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_sort_values_invalid_arguments():
+    df = lp.from_pandas(pd.DataFrame({"a": [1], "b": [2]}))
+    with pytest.raises(ValueError):
+        df.sort_values(["a", "b"], ascending=[True])
+    with pytest.raises(ValueError):
+        df.sort_values("a", na_position="middle")  # type: ignore
+    with pytest.raises(ValueError):
+        df.sort_values("a", kind="bubblesort")  # type: ignore
+
+
+def test_sort_values_spills_to_temp_directory(tmp_path):
+    with lp.Session(memory_limit="16MB", temp_directory=str(tmp_path), threads=2) as session:
+        df = session.sql("SELECT md5(range::VARCHAR) AS k, range AS v FROM range(500000)")
+        batches = df.sort_values("k", ascending=False).iter_batches(100000)
+        # The sorted runs that did not fit in memory stay in the temp directory until every row is read.
+        first = next(batches)
+        spilled = os.listdir(tmp_path)
+        keys = first["k"].to_pylist() + [k for batch in batches for k in batch["k"].to_pylist()]
+
+    assert any(name.startswith("duckdb_temp_") for name in spilled)
+    assert len(keys) == 500000
+    assert keys == sorted(keys, reverse=True)
+
+
+@pytest.mark.parametrize("keep", ["first", "last", "all"])
+@pytest.mark.parametrize("method", ["nlargest", "nsmallest"])
+def test_nlargest_nsmallest(method, keep):
+    pdf = pd.DataFrame({"a": [1.0, None, 3.0, 3.0, 2.0, 1.0], "b": [1, 2, 3, 4, 5, 6]})
+    df = lp.from_pandas(pdf)
+
+    result = getattr(df, method)(2, "a", keep=keep).collect()
+    expected = getattr(pdf, method)(2, "a", keep=keep).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_nlargest_uses_top_n():
+    df = lp.from_pandas(pd.DataFrame({"a": range(1000), "b": range(1000)}))
+
+    assert "TOP_N" in df.nlargest(10, ["a", "b"]).explain()
+    assert df.nlargest(3, ["a", "b"]).collect()["a"].tolist() == [999, 998, 997]
+
+
 def test_drop_duplicates():
     rel = duckdb.sql("SELECT 1 AS a, 2 AS b UNION ALL SELECT 1, 2")
     df = lp.LazyFrame(rel)
@@ -87,6 +329,46 @@ def test_drop_duplicates_subset():
     assert df.columns.tolist() == ["a", "b"]
 
 
+@pytest.mark.parametrize("keep", ["first", "last", False])
+def test_drop_duplicates_keep(keep):
+    pdf = pd.DataFrame(
+        {
+            "key": [3, 1, 3, None, 2, 1, None, 3],
+            "value": [None, 2.0, 3.0, 4.0, 5.0, None, 7.0, 8.0],
+            "name": list("abcdefgh"),
+        }
+    )
+    df = lp.from_pandas(pdf)
+
+    result = df.drop_duplicates(subset="key", keep=keep).collect()
+    expected = pdf.drop_duplicates(subset="key", keep=keep).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("keep", ["first", "last", False])
+def test_drop_duplicates_all_columns(keep):
+    pdf = pd.DataFrame({"a": [1, 2, 1, 3, 2, 1], "b": ["x", "y", "x", "z", "w", "x"]})
+    df = lp.from_pandas(pdf).drop_duplicates(keep=keep)
+
+    assert "WINDOW" not in df.explain() and "ORDER" not in df.explain()
+    result = df.collect().sort_values(["a", "b"]).reset_index(drop=True)
+    expected = pdf.drop_duplicates(keep=keep).sort_values(["a", "b"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_drop_duplicates_keep_last_after_sort():
+    pdf = pd.DataFrame({"key": [i % 10 for i in range(10000)], "ts": np.arange(10000)[::-1]})
+    df = lp.from_pandas(pdf).sort_values("ts").drop_duplicates(subset="key", keep="last")
+
+    result = df.collect()
+    assert result["ts"].tolist() == list(range(9990, 10000))
+
+
+def test_drop_duplicates_invalid_keep():
+    with pytest.raises(ValueError):
+        lp.from_pandas(pd.DataFrame({"a": [1]})).drop_duplicates(keep="any")  # type: ignore
+
+
 def test_merge_inner():
     rel1 = duckdb.sql("SELECT 1 AS a, 2 AS b")
     rel2 = duckdb.sql("SELECT 1 AS a, 4 AS d")
@@ -171,3 +453,153 @@ def test_merge_right():
     vl1, vl2 = df["a"].tolist()
     assert vl1 == 1
     assert vl2 == 3
+
+
+@pytest.fixture
+def merge_frames():
+    left = pd.DataFrame({"k": [1, 2, 3, None], "v": [10, 20, 30, 40], "x": ["a", "b", "c", "d"]})
+    right = pd.DataFrame({"k": [1, 1, 4], "v": [5, 6, 7], "y": ["p", "q", "r"]})
+    return left, right
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_suffixes_and_indicator(merge_frames, how):
+    left, right = merge_frames
+
+    result = lp.from_pandas(left).merge(lp.from_pandas(right), on="k", how=how, indicator=True)
+    result = result.sort_values(["k", "v_x", "v_y"]).collect()
+    expected = left.merge(right, on="k", how=how, indicator=True)
+    expected = expected.sort_values(["k", "v_x", "v_y"]).reset_index(drop=True)
+    assert result["_merge"].tolist() == expected["_merge"].tolist()
+    pd.testing.assert_frame_equal(
+        result.drop(columns="_merge").fillna(-1), expected.drop(columns="_merge").fillna(-1), check_dtype=False
+    )
+
+
+def test_merge_left_on_right_on(merge_frames):
+    left, right = merge_frames
+
+    result = lp.from_pandas(left).merge(lp.from_pandas(right), left_on="v", right_on="k", suffixes=("", "_r"))
+    assert result.columns == ["k", "v", "x", "k_r", "v_r", "y"]
+
+    result = lp.from_pandas(left).merge(lp.from_pandas(right), left_on="k", right_on="v", how="left").collect()
+    assert result.columns.tolist() == ["k_x", "v_x", "x", "k_y", "v_y", "y"]
+    assert result["v_y"].isna().all()
+
+
+def test_merge_semi_anti(merge_frames):
+    left, right = merge_frames
+    df = lp.from_pandas(left)
+    keys = lp.from_pandas(right)[["k"]]
+
+    semi = df.merge(keys, on="k", how="semi")
+    assert "SEMI" in semi.explain()
+    assert semi.collect().to_dict("list") == {"k": [1.0], "v": [10], "x": ["a"]}
+
+    anti = df.merge(keys, on="k", how="anti").sort_values("v").collect()
+    assert anti["v"].tolist() == [20, 30, 40]
+
+
+def test_merge_cross(merge_frames):
+    left, right = merge_frames
+
+    result = lp.from_pandas(left).merge(lp.from_pandas(right), how="cross").collect()
+    assert result.shape == (12, 6)
+    assert result.columns.tolist() == ["k_x", "v_x", "x", "k_y", "v_y", "y"]
+
+
+def test_merge_validate(merge_frames):
+    left, right = merge_frames
+    df1, df2 = lp.from_pandas(left), lp.from_pandas(right)
+
+    assert df1.merge(df2, on="k", validate="one_to_many").columns == ["k", "v_x", "x", "v_y", "y"]
+    with pytest.raises(ValueError, match="not unique in right dataset"):
+        df1.merge(df2, on="k", validate="1:1")
+    with pytest.raises(ValueError, match="not unique in left dataset"):
+        df2.merge(df1, on="k", validate="one_to_many")
+
+
+def test_merge_invalid_arguments(merge_frames):
+    left, right = merge_frames
+    df1, df2 = lp.from_pandas(left), lp.from_pandas(right)
+
+    with pytest.raises(ValueError):
+        df1.merge(df2, on="k", left_on="k")
+    with pytest.raises(ValueError):
+        df1.merge(df2, left_on=["k", "v"], right_on="k")
+    with pytest.raises(ValueError):
+        df1.merge(df2, on="k", how="cross")
+    with pytest.raises(ValueError):
+        df1.merge(df2, on="k", suffixes=(None, None))
+    with pytest.raises(ValueError):
+        df1.merge(df2, on="k", how="semi", indicator=True)
+
+
+def test_iter_batches():
+    rel = duckdb.sql("SELECT range AS a FROM range(10000)")
+    df = lp.LazyFrame(rel)
+    batches = list(df.iter_batches(4096))
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert all(batch.num_rows <= 4096 for batch in batches)
+    assert sum(batch.num_rows for batch in batches) == 10000
+
+    batches = list(df.iter_pandas(4096))
+    assert all(isinstance(batch, pd.DataFrame) for batch in batches)
+    assert pd.concat(batches)["a"].sort_values().tolist() == list(range(10000))
+
+
+def test_iter_batches_invalid_format():
+    df = lp.LazyFrame(duckdb.sql("SELECT 1 AS a"))
+    with pytest.raises(ValueError):
+        df.iter_batches(format="csv")  # type: ignore[call-overload]
+    with pytest.raises(ValueError):
+        df.iter_batches(0)
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="requires procfs to read the RSS")
+def test_iter_batches_bounded_memory():
+    def rss() -> int:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    def peak_rss_growth(n_rows: int) -> int:
+        rel = duckdb.sql(f"SELECT range AS a, range * 2 AS b, 'value_' || range AS c FROM range({n_rows})")
+        base = peak = rss()
+        for _ in lp.LazyFrame(rel).iter_batches(100_000):
+            peak = max(peak, rss())
+        return peak - base
+
+    peak_rss_growth(1_000_000)
+    small = peak_rss_growth(1_000_000)
+    large = peak_rss_growth(8_000_000)
+    # Materializing 8M rows of this relation takes several hundred MB.
+    assert large < small + 64 * 1024 * 1024
+
+
+def test_explain():
+    df = lp.from_pandas(pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "x", "y"]}))
+    df = df[df["a"] > 1].groupby("b").sum()
+
+    assert "HASH_GROUP_BY" in df.explain()
+    assert "AGGREGATE" in df.explain("logical")
+    assert "Total Time" in df.explain("analyze")
+    assert "HASH_GROUP_BY" in df.explain()
+
+    with pytest.raises(ValueError):
+        df.explain("verbose")  # type: ignore
+
+
+def test_profile():
+    df = lp.from_pandas(pd.DataFrame({"a": range(1000), "b": [i % 3 for i in range(1000)]}))
+    profile = df.groupby("b").sum().profile()
+
+    assert profile.rows == 3
+    assert profile.latency >= 0
+    names = [operator.name for operator in profile.operators()]
+    assert "HASH_GROUP_BY" in names
+    assert all(name not in ("EXPLAIN_ANALYZE", "QUERY") for name in names)
+    assert max(operator.rows for operator in profile.operators()) == 1000
+    assert profile.slowest()[0].time == max(operator.time for operator in profile.operators())
+    assert str(profile).startswith("Query: 3 rows")
+
+    assert df.collect().shape == (1000, 2)
@@ -0,0 +1,188 @@
+import duckdb
+import pandas as pd
+import pytest
+
+import lazy_pandas as lp
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
+
+
+@pytest.fixture
+def df():
+    rel = duckdb.sql(
+        """
+        SELECT * FROM (
+            VALUES ('a', 1, 10.0), ('a', 2, NULL), ('a', 2, 30.0), ('b', 4, 40.0), ('b', 5, 50.0)
+        ) AS t("group key", x, y)
+        """
+    )
+    return lp.LazyFrame(rel)
+
+
+def collect_sorted(df):
+    return df.sort_values("group key").collect()
+
+
+def test_sum(df):
+    result = collect_sorted(df.groupby("group key").sum())
+    assert result.columns.tolist() == ["group key", "x", "y"]
+    assert result["x"].tolist() == [5, 9]
+    assert result["y"].tolist() == [40.0, 90.0]
+
+
+def test_max(df):
+    result = collect_sorted(df.groupby("group key").max())
+    assert result["x"].tolist() == [2, 5]
+    assert result["y"].tolist() == [30.0, 50.0]
+
+
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        ("min", [1, 4]),
+        ("mean", [5 / 3, 4.5]),
+        ("median", [2.0, 4.5]),
+        ("count", [3, 2]),
+        ("nunique", [2, 2]),
+        ("var", [1 / 3, 0.5]),
+    ],
+)
+def test_reducers(df, method, expected):
+    result = collect_sorted(getattr(df.groupby("group key")["x"], method)())
+    assert result.columns.tolist() == ["group key", "x"]
+    assert result["x"].tolist() == pytest.approx(expected)
+
+
+def test_count_skips_nulls(df):
+    result = collect_sorted(df.groupby("group key").count())
+    assert result["y"].tolist() == [2, 2]
+
+
+def test_first_last_skip_nulls():
+    rel = duckdb.sql(
+        "SELECT * FROM (VALUES ('a', NULL, 1), ('a', 2, NULL), ('a', 3, NULL), ('b', NULL, NULL)) t(k, x, y)"
+    )
+    result = lp.LazyFrame(rel).groupby("k").agg({"x": ["first", "last", "nunique"], "y": "last"})
+    result = result.sort_values("k").collect()
+    assert result["x_first"].tolist()[0] == 2
+    assert result["x_last"].tolist()[0] == 3
+    assert result["x_nunique"].tolist() == [2, 0]
+    assert result["y"].tolist()[0] == 1
+    assert result[["x_first", "x_last", "y"]].iloc[1].isna().all()
+
+
+def test_size(df):
+    result = collect_sorted(df.groupby("group key").size())
+    assert result.columns.tolist() == ["group key", "size"]
+    assert result["size"].tolist() == [3, 2]
+
+
+def test_quantile(df):
+    result = collect_sorted(df.groupby("group key")["x"].quantile(0.5))
+    assert result["x"].tolist() == [2.0, 4.5]
+
+
+def test_agg_list(df):
+    result = collect_sorted(df.groupby("group key").agg(["min", "max"]))
+    assert result.columns.tolist() == ["group key", "x_min", "x_max", "y_min", "y_max"]
+    assert result["x_max"].tolist() == [2, 5]
+
+
+def test_agg_dict(df):
+    result = collect_sorted(df.groupby("group key").agg({"x": "sum", "y": ["min", "max"]}))
+    assert result.columns.tolist() == ["group key", "x", "y_min", "y_max"]
+    assert result["x"].tolist() == [5, 9]
+    assert result["y_min"].tolist() == [10.0, 40.0]
+
+
+def test_agg_named(df):
+    result = collect_sorted(df.groupby("group key").agg(total=("x", "sum"), top=("y", "max")))
+    assert result.columns.tolist() == ["group key", "total", "top"]
+    assert result["total"].tolist() == [5, 9]
+    assert result["top"].tolist() == [30.0, 50.0]
+
+
+def test_agg_unsupported(df):
+    with pytest.raises(LazyPandasUnsupporttedOperation):
+        df.groupby("group key").agg("mode")
+
+
+def test_transform(df):
+    df["y_mean"] = df.groupby("group key")["y"].transform("mean")
+    df["size"] = df.groupby("group key")["x"].transform("size")
+    result = df.sort_values(["group key", "x"]).collect()
+    assert result["y_mean"].tolist() == [20.0, 20.0, 20.0, 45.0, 45.0]
+    assert result["size"].tolist() == [3, 3, 3, 2, 2]
+
+
+def test_transform_first(df):
+    df["y_first"] = df.groupby("group key")["y"].transform("first")
+    result = df.sort_values(["group key", "x"]).collect()
+    assert result["y_first"].tolist() == [10.0, 10.0, 10.0, 40.0, 40.0]
+
+
+def test_cumsum_frame(df):
+    result = df.groupby("group key").cumsum()
+    assert result.columns == ["group key", "x", "y"]
+    result = result.sort_values(["group key", "x"]).collect()
+    assert result["x"].tolist() == [1, 3, 5, 4, 9]
+
+
+def test_cumcount(df):
+    df["n"] = df.groupby("group key").cumcount()
+    result = df.sort_values(["group key", "n"]).collect()
+    assert result["n"].tolist() == [0, 1, 2, 0, 1]
+    assert result["x"].tolist() == [1, 2, 2, 4, 5]
+
+
+def test_group_shift_and_diff(df):
+    df["prev"] = df.groupby("group key")["x"].shift()
+    df["delta"] = df.groupby("group key")["x"].diff()
+    result = df.sort_values(["group key", "x", "prev"]).collect()
+    assert result["prev"].fillna(-1).tolist() == [-1, 1, 2, -1, 4]
+    assert result["delta"].fillna(-1).tolist() == [-1, 1, 0, -1, 1]
+
+
+def test_group_rank(df):
+    df["r"] = df.groupby("group key")["x"].rank(method="dense", ascending=False)
+    result = df.sort_values(["group key", "x"]).collect()
+    assert result["r"].tolist() == [2.0, 1.0, 1.0, 2.0, 1.0]
+
+
+def test_group_window_keeps_frame_order():
+    pdf = pd.DataFrame({"k": ["b", "a", "b", "a", "c", "a"], "v": [1, 2, 3, 4, 5, 6]})
+    df = lp.from_pandas(pdf)
+    expected = pdf.copy()
+
+    df["c"] = df.groupby("k")["v"].cumsum()
+    df["p"] = df["v"].shift(1)
+    df["t"] = df.groupby("k")["v"].transform("mean")
+    df["s"] = df["c"].cumsum()
+    expected["c"] = expected.groupby("k")["v"].cumsum()
+    expected["p"] = expected["v"].shift(1)
+    expected["t"] = expected.groupby("k")["v"].transform("mean")
+    expected["s"] = expected["c"].cumsum()
+
+    pd.testing.assert_frame_equal(df.collect(), expected, check_dtype=False)
+
+
+def test_transform_unsupported(df):
+    with pytest.raises(LazyPandasUnsupporttedOperation):
+        df.groupby("group key")["x"].transform("nunique")
+
+
+def test_group_nlargest(df):
+    result = df.groupby("group key")["x"].nlargest(1).collect()
+    assert result.columns.tolist() == ["group key", "x", "y"]
+    assert result["group key"].tolist() == ["a", "b"]
+    assert result["x"].tolist() == [2, 5]
+
+    result = df.groupby("group key").nsmallest(2, "y").collect()
+    assert result["y"].tolist() == [10.0, 30.0, 40.0, 50.0]
+
+    result = df.groupby("group key")["x"].nlargest(1, keep="all").collect()
+    assert result["x"].tolist() == [2, 2, 5]
+
+
+def test_group_nlargest_without_columns(df):
+    with pytest.raises(ValueError):
+        df.groupby("group key").nlargest(1)
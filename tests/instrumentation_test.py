@@ -0,0 +1,96 @@
+import os
+
+import duckdb
+import pandas as pd
+import pytest
+
+import lazy_pandas as lp
+from lazy_pandas import instrumentation
+
+ASSETS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "assets"))
+
+
+@pytest.fixture
+def events():
+    started, ended = [], []
+    instrumentation.on_query_start(started.append)
+    instrumentation.on_query_end(ended.append)
+    yield started, ended
+    instrumentation.clear_hooks()
+
+
+def test_no_hooks():
+    assert instrumentation.start("collect") is None
+
+
+def test_reader_and_collect_events(events):
+    started, ended = events
+    df = lp.read_csv(os.path.join(ASSETS_PATH, "weather_station.csv"), sep=";")
+    result = df.collect()
+
+    assert [event.operation for event in started] == ["read_csv", "collect"]
+    assert started[0] is ended[0]
+    assert ended[0].sql is not None
+    assert ended[1].sources == ["read_csv_auto"]
+    assert ended[1].rows == len(result)
+    assert ended[1].bytes == result.memory_usage(index=True).sum()
+    assert ended[1].duration is not None and ended[1].duration >= 0
+    assert ended[1].error is None
+
+
+def test_terminal_events(events, tmp_path):
+    _, ended = events
+    df = lp.from_pandas(pd.DataFrame({"a": range(5000)}))
+    ended.clear()
+
+    df.to_arrow()
+    df.to_polars()
+    list(df.iter_batches(2048))
+    df.to_parquet(os.path.join(tmp_path, "out.parquet"))
+    lp.collect_all([df])
+
+    assert [event.operation for event in ended] == ["to_arrow", "to_polars", "iter_batches", "to_parquet", "collect"]
+    assert [event.rows for event in ended] == [5000, 5000, 5000, None, 5000]
+    assert all(event.sources == ["pandas_scan"] for event in ended)
+
+
+def test_fingerprint_is_stable(events):
+    _, ended = events
+    lp.from_pandas(pd.DataFrame({"a": [1, 2]})).head(1).collect()
+    lp.from_pandas(pd.DataFrame({"a": [3, 4]})).head(1).collect()
+    lp.from_pandas(pd.DataFrame({"a": [3, 4]})).head(2).collect()
+
+    fingerprints = [event.fingerprint for event in ended if event.operation == "collect"]
+    assert fingerprints[0] == fingerprints[1]
+    assert fingerprints[1] != fingerprints[2]
+
+
+def test_error_event(events):
+    _, ended = events
+    df = lp.LazyFrame(duckdb.sql("SELECT 'a' AS a"))
+    df["a"] = df["a"].astype("INTEGER")
+
+    with pytest.raises(duckdb.ConversionException):
+        df.collect()
+    assert isinstance(ended[-1].error, duckdb.ConversionException)
+
+
+def test_remove_hook():
+    ended = []
+    hook = instrumentation.on_query_end(ended.append)
+    lp.from_pandas(pd.DataFrame({"a": [1]})).collect()
+    instrumentation.remove_hook(hook)
+    lp.from_pandas(pd.DataFrame({"a": [1]})).collect()
+
+    assert [event.operation for event in ended] == ["from_pandas", "collect"]
+
+
+def test_undescribable_plan_is_logged(events, caplog):
+    class Relation:
+        def sql_query(self):
+            raise duckdb.NotImplementedException("no SQL")
+
+    event = instrumentation.start("collect", Relation())  # type: ignore[arg-type]
+
+    assert event is not None and event.sql is None
+    assert "Could not get the SQL of the collect query" in caplog.text
@@ -0,0 +1,119 @@
+import gc
+import os
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+import lazy_pandas as lp
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
+
+
+@pytest.fixture
+def trades():
+    return pd.DataFrame(
+        {
+            "time": pd.to_datetime(["10:00:01", "10:00:02", "10:00:03", "10:00:10"], format="%H:%M:%S"),
+            "ticker": ["A", "B", "A", "A"],
+            "price": [1.0, 4.0, 2.0, 3.0],
+        }
+    )
+
+
+@pytest.fixture
+def quotes():
+    return pd.DataFrame(
+        {
+            "time": pd.to_datetime(["10:00:00", "10:00:01", "10:00:03"], format="%H:%M:%S"),
+            "ticker": ["A", "B", "A"],
+            "price": [0.9, 3.9, 1.9],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"allow_exact_matches": False},
+        {"direction": "forward"},
+        {"tolerance": timedelta(seconds=1)},
+        {"direction": "forward", "tolerance": timedelta(seconds=1), "allow_exact_matches": False},
+    ],
+)
+def test_merge_asof(trades, quotes, kwargs):
+    result = lp.merge_asof(lp.from_pandas(trades), lp.from_pandas(quotes), on="time", by="ticker", **kwargs)
+    result = result.sort_values("time").collect()
+
+    expected = pd.merge_asof(trades, quotes, on="time", by="ticker", **kwargs)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_merge_asof_left_on_right_on(trades, quotes):
+    quotes = quotes.rename(columns={"time": "quoted_at"})
+
+    result = lp.merge_asof(
+        lp.from_pandas(trades), lp.from_pandas(quotes), left_on="time", right_on="quoted_at", suffixes=("", "_quote")
+    )
+    result = result.sort_values("time").collect()
+    assert result.columns.tolist() == ["time", "ticker", "price", "quoted_at", "ticker_quote", "price_quote"]
+    assert result["price_quote"].tolist() == [3.9, 3.9, 1.9, 1.9]
+
+
+def test_merge_asof_numeric_tolerance():
+    left = lp.from_pandas(pd.DataFrame({"t": [1, 5, 10]}))
+    right = lp.from_pandas(pd.DataFrame({"t": [0, 4, 7], "v": ["a", "b", "c"]}))
+
+    result = lp.merge_asof(left, right, on="t", tolerance=2).sort_values("t").collect()
+    assert result["v"].tolist() == ["a", "b", None]
+
+
+def test_merge_asof_parquet(tmp_path, trades, quotes):
+    with lp.Session() as session:
+        trades.to_parquet(os.path.join(tmp_path, "trades.parquet"))
+        quotes.to_parquet(os.path.join(tmp_path, "quotes.parquet"))
+        left = session.read_parquet(os.path.join(tmp_path, "trades.parquet"))
+        right = session.read_parquet(os.path.join(tmp_path, "quotes.parquet"))
+
+        df = lp.merge_asof(left, right, on="time", by="ticker")
+        assert "ASOF" in df.explain()
+        assert df.sort_values("time").collect()["price_y"].tolist() == [0.9, 3.9, 1.9, 1.9]
+
+
+def test_merge_asof_session(trades, quotes):
+    with lp.Session() as session:
+        left, right = session.from_pandas(trades), session.from_pandas(quotes)
+        result = lp.merge_asof(left, right, on="time", by="ticker")
+        del left, right
+        gc.collect()
+
+        expected = pd.merge_asof(trades, quotes, on="time", by="ticker")
+        pd.testing.assert_frame_equal(result.sort_values("time").collect(), expected)
+
+
+def test_merge_asof_leaves_no_views(trades, quotes):
+    with lp.Session() as session:
+        views = "SELECT view_name FROM duckdb_views() WHERE NOT internal"
+        before = session.connection.sql(views).fetchall()
+
+        result = lp.merge_asof(session.from_pandas(trades), session.from_pandas(quotes), on="time", by="ticker")
+        gc.collect()
+        assert session.connection.sql(views).fetchall() == before
+        assert result.sort_values("time").collect()["price_y"].tolist() == [0.9, 3.9, 1.9, 1.9]
+        del result
+        gc.collect()
+
+        assert session.connection.sql(views).fetchall() == before
+
+
+def test_merge_asof_invalid_arguments(trades, quotes):
+    left, right = lp.from_pandas(trades), lp.from_pandas(quotes)
+
+    with pytest.raises(LazyPandasUnsupporttedOperation):
+        lp.merge_asof(left, right, on="time", direction="nearest")
+    with pytest.raises(ValueError):
+        lp.merge_asof(left, right, left_on="time")
+    with pytest.raises(ValueError):
+        lp.merge_asof(left, right, on="time", tolerance=timedelta(seconds=-1))
+    with pytest.raises(ValueError):
+        lp.merge_asof(left, right, on="time", by="ticker", left_by="ticker")
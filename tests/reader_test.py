@@ -1,9 +1,15 @@
+import gc
 import os
 from tempfile import TemporaryDirectory
 
 import lazy_pandas as lp
+import numpy as np
+import polars as pl
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+from lazy_pandas import instrumentation, streams
+from lazy_pandas.exceptions import LazyPandasStreamConsumed
 from pyiceberg.catalog.sql import SqlCatalog
 
 ASSETS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "assets"))
@@ -45,6 +51,26 @@ def test_read_parquet():
     assert df.columns == ["temperature", "city"]
 
 
+def test_read_parquet_shape(tmp_path):
+    for i in range(3):
+        pq.write_table(pa.table({"a": list(range(i * 10, i * 10 + 10))}), os.path.join(tmp_path, f"part_{i}.parquet"))
+    df = lp.read_parquet(os.path.join(tmp_path, "*.parquet"), columns=["a"])
+
+    ended = []
+    instrumentation.on_query_end(ended.append)
+    try:
+        assert df.shape == (30, 1)
+        assert len(df[df["a"] >= 25]) == 5
+        assert len(df.head(4)) == 4
+    finally:
+        instrumentation.clear_hooks()
+
+    assert [event.operation for event in ended] == ["count", "count", "count"]
+    # The footers give the count of the plain scan, the files are only read once rows are filtered.
+    assert "parquet_file_metadata" in ended[0].sql and ended[0].sources == []
+    assert all(event.sources == ["parquet_scan"] for event in ended[1:])
+
+
 def test_read_delta():
     delta_table_uri = os.path.join(ASSETS_PATH, "delta_table")
     df = lp.read_delta(delta_table_uri)
@@ -59,3 +85,65 @@ def test_read_iceberg(iceberg_table_uri):
     assert df.columns.tolist() == ["lat", "long"]
     assert df["lat"].tolist() == [52.371807, 52.387386, 52.078663]
     assert df["long"].tolist() == [4.896029, 4.646219, 4.288788]
+
+
+def test_from_arrow():
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    assert lp.from_arrow(table).collect()["a"].tolist() == [1, 2, 3]
+    assert lp.from_arrow(table.to_batches()[0]).columns == ["a", "b"]
+
+
+def test_from_arrow_keeps_source_alive():
+    def make_frame():
+        df = lp.from_arrow(pa.table({"a": np.arange(100000)}))
+        return df[df["a"] % 2 == 0]
+
+    df = make_frame()
+    gc.collect()
+    assert len(df.collect()) == 50000
+
+
+def test_from_polars_dict_numpy():
+    assert lp.from_polars(pl.DataFrame({"a": [1, 2]})).collect()["a"].tolist() == [1, 2]
+    assert lp.from_dict({"a": np.arange(3), "b": ["x", "y", "z"]}).collect()["b"].tolist() == ["x", "y", "z"]
+
+    df = lp.from_numpy(np.arange(6).reshape(3, 2), columns=["x", "y"]).collect()
+    assert df.to_dict("list") == {"x": [0, 2, 4], "y": [1, 3, 5]}
+    assert lp.from_numpy(np.arange(3)).columns == ["0"]
+    assert lp.from_numpy(np.array([(1, 2.0)], dtype=[("i", "i4"), ("f", "f8")])).columns == ["i", "f"]
+    with pytest.raises(ValueError):
+        lp.from_numpy(np.zeros((2, 2, 2)))
+
+
+def test_from_batches_is_consumed_once():
+    table = pa.table({"a": np.arange(10)})
+
+    df = lp.from_batches(table.to_reader(max_chunksize=3))
+    assert len(df[df["a"] > 2].collect()) == 7
+    with pytest.raises(LazyPandasStreamConsumed):
+        df.collect()
+
+    df = lp.from_batches(batch for batch in table.to_batches(max_chunksize=3)).persist()
+    assert len(df.collect()) == len(df.collect()) == 10
+    df.unpersist()
+
+    with pytest.raises(ValueError):
+        lp.from_batches(iter([]))
+    assert lp.from_batches([], schema=table.schema).collect().empty
+
+
+def test_from_batches_is_forgotten_once_collected():
+    table = pa.table({"a": np.arange(10)})
+    registered = len(streams._streams)
+
+    df = lp.from_batches(table.to_reader(max_chunksize=3))
+    filtered = df[df["a"] > 2]
+    del df
+    gc.collect()
+    assert len(streams._streams) == registered + 1
+
+    assert len(filtered.collect()) == 7
+    del filtered
+    gc.collect()
+    assert len(streams._streams) == registered
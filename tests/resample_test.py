@@ -0,0 +1,125 @@
+from datetime import datetime
+
+import duckdb
+import pandas as pd
+import pytest
+
+import lazy_pandas as lp
+from lazy_pandas.exceptions import LazyPandasUnsupporttedOperation
+
+
+@pytest.fixture
+def df():
+    rel = duckdb.sql(
+        """
+        SELECT * FROM (
+            VALUES
+                (TIMESTAMP '2024-01-01 10:07', 'a', 1),
+                (TIMESTAMP '2024-01-01 10:15', 'b', 2),
+                (TIMESTAMP '2024-01-01 10:29', 'a', 3),
+                (TIMESTAMP '2024-01-01 11:01', 'b', 4)
+        ) AS t(ts, host, requests)
+        """
+    )
+    return lp.LazyFrame(rel)
+
+
+def test_resample_sum(df):
+    result = df.resample("15min", on="ts")["requests"].sum().collect()
+    assert result.columns.tolist() == ["ts", "requests"]
+    assert result["ts"].tolist() == [
+        datetime(2024, 1, 1, 10, 0),
+        datetime(2024, 1, 1, 10, 15),
+        datetime(2024, 1, 1, 11, 0),
+    ]
+    assert result["requests"].tolist() == [1, 5, 4]
+
+
+def test_resample_agg(df):
+    result = df.resample("1h", on="ts").agg({"requests": "max", "host": "nunique"}).collect()
+    assert result["requests"].tolist() == [3, 4]
+    assert result["host"].tolist() == [2, 1]
+
+
+def test_resample_closed_right_label_right(df):
+    result = df.resample("15min", on="ts", closed="right", label="right")["requests"].sum().collect()
+    assert result["ts"].tolist() == [
+        datetime(2024, 1, 1, 10, 15),
+        datetime(2024, 1, 1, 10, 30),
+        datetime(2024, 1, 1, 11, 15),
+    ]
+    assert result["requests"].tolist() == [3, 3, 4]
+
+
+def test_resample_origin(df):
+    result = df.resample("30min", on="ts", origin="start")["requests"].count().collect()
+    assert result["ts"].tolist() == [datetime(2024, 1, 1, 10, 7), datetime(2024, 1, 1, 10, 37)]
+    assert result["requests"].tolist() == [3, 1]
+
+
+def test_resample_fill_gaps(df):
+    result = df.resample("15min", on="ts", fill_gaps=True)["requests"].sum().collect()
+    assert len(result) == 5
+    assert result["ts"].tolist()[2] == datetime(2024, 1, 1, 10, 30)
+    assert result["requests"].fillna(0).tolist() == [1, 5, 0, 0, 4]
+
+
+def test_resample_month(df):
+    result = df.resample("MS", on="ts")["requests"].sum().collect()
+    assert result["ts"].tolist() == [datetime(2024, 1, 1)]
+    assert result["requests"].tolist() == [10]
+
+
+def test_resample_start_day_has_no_window(df):
+    result = df.resample("15min", on="ts")["requests"].sum()
+    assert "WINDOW" not in result.explain()
+    assert result.collect()["requests"].tolist() == [1, 5, 4]
+
+
+@pytest.mark.parametrize("rule", ["W", "ME", "QE", "YE"])
+@pytest.mark.parametrize("closed", [None, "left"])
+@pytest.mark.parametrize("label", [None, "left"])
+def test_resample_period_end(rule, closed, label):
+    timestamps = pd.to_datetime(
+        [
+            "2024-01-01 00:00",
+            "2024-01-07 00:00",
+            "2024-01-07 12:00",
+            "2024-01-08 00:00",
+            "2024-01-31 00:00",
+            "2024-01-31 12:00",
+            "2024-02-29 00:00",
+            "2024-03-31 23:00",
+            "2024-06-30 00:00",
+            "2024-09-01 00:00",
+        ]
+    )
+    pdf = pd.DataFrame({"ts": timestamps, "requests": range(len(timestamps))})
+    resampler = pdf.resample(rule, on="ts", closed=closed, label=label)["requests"]
+    expected = resampler.sum()[resampler.count() > 0]
+
+    result = lp.from_pandas(pdf).resample(rule, on="ts", closed=closed, label=label)["requests"].sum().collect()
+    assert result["ts"].tolist() == expected.index.tolist()
+    assert result["requests"].tolist() == expected.tolist()
+
+
+def test_resample_period_end_fill_gaps():
+    pdf = pd.DataFrame({"ts": pd.to_datetime(["2024-01-15", "2024-04-10"]), "requests": [1, 2]})
+    result = lp.from_pandas(pdf).resample("ME", on="ts", fill_gaps=True)["requests"].sum().collect()
+    assert result["ts"].tolist() == pdf.resample("ME", on="ts")["requests"].sum().index.tolist()
+
+
+def test_resample_week_fill_gaps():
+    pdf = pd.DataFrame(
+        {"ts": pd.to_datetime(["2024-01-03 00:00", "2024-01-07 12:00", "2024-02-05 00:00"]), "requests": [1, 2, 3]}
+    )
+    result = lp.from_pandas(pdf).resample("W", on="ts", fill_gaps=True)["requests"].sum().collect()
+    expected = pdf.resample("W", on="ts")["requests"].sum()
+    assert result["ts"].tolist() == expected.index.tolist()
+    assert result["requests"].fillna(0).tolist() == expected.tolist()
+
+
+def test_resample_multiple_weeks():
+    pdf = pd.DataFrame({"ts": pd.to_datetime(["2024-01-03"]), "requests": [1]})
+    with pytest.raises(LazyPandasUnsupporttedOperation):
+        lp.from_pandas(pdf).resample("2W", on="ts")
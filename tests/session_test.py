@@ -0,0 +1,82 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pandas as pd
+import pytest
+
+import lazy_pandas as lp
+
+ASSETS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "assets"))
+
+
+def test_session_settings(tmp_path):
+    with lp.Session(threads=2, memory_limit="1GB", temp_directory=str(tmp_path), preserve_insertion_order=False) as s:
+        settings = s.settings
+        assert settings["threads"] == "2"
+        assert settings["temp_directory"] == str(tmp_path)
+        assert settings["preserve_insertion_order"] == "false"
+        assert settings["memory_limit"] != duckdb.sql("SELECT current_setting('memory_limit')").fetchone()[0]
+
+
+def test_session_readers():
+    with lp.Session() as session:
+        df = session.read_csv(os.path.join(ASSETS_PATH, "weather_station.csv"), sep=";")
+        assert df.columns == ["city", "temperature"]
+
+        df = session.read_parquet(os.path.join(ASSETS_PATH, "weather_station.parquet"), columns=["temperature"])
+        assert df.columns == ["temperature"]
+
+        df = session.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+        assert df.collect()["a"].tolist() == [1, 2, 3]
+
+
+def test_session_is_isolated():
+    with lp.Session() as session:
+        session.connection.sql("CREATE TABLE numbers AS FROM range(5)")
+        df = session.sql("SELECT count(*) AS n FROM numbers")
+        assert df.collect()["n"].tolist() == [5]
+
+        with pytest.raises(duckdb.CatalogException):
+            duckdb.sql("FROM numbers")
+
+
+def test_readers_accept_session_and_connection():
+    path = os.path.join(ASSETS_PATH, "weather_station.csv")
+    with lp.Session() as session:
+        assert lp.read_csv(path, sep=";", conn=session).columns == ["city", "temperature"]
+        assert lp.read_csv(path, sep=";", conn=session.connection).columns == ["city", "temperature"]
+
+
+def test_session_close():
+    session = lp.Session()
+    with session:
+        df = session.sql("SELECT 1 AS a")
+    with pytest.raises(duckdb.ConnectionException):
+        df.collect()
+
+
+def test_session_cursor_per_thread():
+    with lp.Session() as session:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            connections = list(executor.map(lambda _: session.connection, range(2)))
+        assert session.connection not in connections
+
+        def count(n: int) -> int:
+            return session.sql(f"SELECT count(*) AS n FROM range({n})").collect()["n"].item()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(count, range(20))) == list(range(20))
+
+
+def test_collect_all():
+    path = os.path.join(ASSETS_PATH, "weather_station.csv")
+    with lp.Session() as session:
+        df = session.read_csv(path, sep=";")
+        pandas_df = session.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+        frames = [df, df[df["temperature"] > 20], pandas_df, pandas_df[pandas_df["a"] > 1]]
+
+        results = lp.collect_all(frames, max_workers=4)
+
+        assert [len(result) for result in results] == [len(frame.collect()) for frame in frames]
+        assert results[3]["a"].tolist() == [2, 3]
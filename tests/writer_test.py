@@ -0,0 +1,72 @@
+import os
+from tempfile import TemporaryDirectory
+
+import duckdb
+import pyarrow.parquet as pq
+import pytest
+
+import lazy_pandas as lp
+
+
+@pytest.fixture
+def df():
+    rel = duckdb.sql("SELECT range AS a, range % 3 AS b, 'row_' || range AS c FROM range(1000)")
+    return lp.LazyFrame(rel)
+
+
+def test_to_parquet():
+    df = lp.LazyFrame(duckdb.sql("SELECT range AS a, range % 3 AS b FROM range(10000)"))
+    with TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "data.parquet")
+        df.to_parquet(path, compression="zstd", row_group_size=2048)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_rows == 10000
+        assert metadata.num_row_groups > 1
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+        result = lp.read_parquet(path).sort_values("a").collect()
+        assert result.columns.tolist() == ["a", "b"]
+        assert result["a"].tolist() == list(range(10000))
+
+
+def test_to_parquet_partitioned(df):
+    with TemporaryDirectory() as temp_dir:
+        df.to_parquet(temp_dir, partition_by="b", overwrite=True)
+        assert sorted(os.listdir(temp_dir)) == ["b=0", "b=1", "b=2"]
+
+        result = lp.read_parquet(os.path.join(temp_dir, "*/*.parquet"), use_hive_partitioning=True).collect()
+        assert result.shape == (1000, 3)
+
+
+def test_to_parquet_sort_by(df):
+    with TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "data.parquet")
+        df.to_parquet(path, sort_by=["b", "a"])
+        result = pq.read_table(path).to_pandas()
+        assert result["b"].is_monotonic_increasing
+
+
+def test_to_csv(df):
+    with TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "data.csv")
+        df.to_csv(path, sep=";", sort_by="a")
+
+        with open(path) as f:
+            assert f.readline().strip() == "a;b;c"
+            assert f.readline().strip() == "0;0;row_0"
+
+        result = lp.read_csv(path, sep=";").collect()
+        assert result.shape == (1000, 3)
+
+
+def test_to_json(df):
+    with TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "data.json")
+        df.to_json(path, sort_by="a")
+
+        with open(path) as f:
+            assert f.readline().strip() == '{"a":0,"b":0,"c":"row_0"}'
+
+        result = duckdb.read_json(path).df()
+        assert result.shape == (1000, 3)